@@ -0,0 +1,52 @@
+"""
+多模式读入成本对比：分别用 any 与 osu_std 解析器各解析一次 vs common.ingest 一次解析
+
+两种方式都产出 Tau（any 模型）与 Sentakki（osu_std 模型）所需的谱面对象，
+并完整遍历一遍物件，模拟转换器的访问。
+
+运行：python benchmarks/bench_ingest.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from osu_std.parser import parse_osu
+from common.ingest import ingest
+from bench_osu_parser import bench
+from corpus import generate_corpus
+
+
+def parse_twice(data):
+    any_beatmap = parse_osu_bytes(data)
+    std_beatmap = parse_osu(data.decode("utf-8"))
+    for _ in any_beatmap.hit_objects:
+        pass
+    for _ in std_beatmap.hit_objects:
+        pass
+
+
+def parse_once(data):
+    canonical = ingest(data)
+    for _ in canonical.for_tau().hit_objects:
+        pass
+    for _ in canonical.for_sentakki().hit_objects:
+        pass
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    corpus = generate_corpus(map_count, object_count)
+    print(f"corpus: {map_count} maps x {object_count} objects")
+
+    best = bench([
+        ("any + osu_std (two parses)", parse_twice),
+        ("common.ingest (one parse)", parse_once),
+    ], corpus, rounds=5)
+    print(f"  speedup: {best['any + osu_std (two parses)'] / best['common.ingest (one parse)']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
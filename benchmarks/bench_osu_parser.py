@@ -0,0 +1,45 @@
+"""
+any.osu_parser 解析性能对比：文本逐行解析 vs 章节偏移表 bytes 快速路径
+
+运行：python benchmarks/bench_osu_parser.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_file, parse_osu_bytes
+from corpus import generate_corpus
+
+
+def bench(cases, corpus, rounds=10):
+    """交替运行各个用例以减小机器负载波动的影响，返回每个用例的最佳耗时"""
+    best = {label: float("inf") for label, _ in cases}
+    for _ in range(rounds):
+        for label, fn in cases:
+            start = time.perf_counter()
+            for data in corpus:
+                fn(data)
+            best[label] = min(best[label], time.perf_counter() - start)
+    for label, _ in cases:
+        print(f"  {label:<30} {best[label] * 1000:9.1f} ms  ({len(corpus) / best[label]:8.1f} maps/s)")
+    return best
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    corpus = generate_corpus(map_count, object_count)
+    print(f"corpus: {map_count} maps x {object_count} objects, {sum(map(len, corpus)) / 1e6:.1f} MB")
+
+    best = bench([
+        ("parse_osu_file (decode+text)", lambda d: parse_osu_file(d.decode("utf-8"))),
+        ("parse_osu_bytes (bytes)", parse_osu_bytes),
+        ("parse_osu_bytes (memoryview)", lambda d: parse_osu_bytes(memoryview(d))),
+    ], corpus)
+    print(f"  speedup: {best['parse_osu_file (decode+text)'] / best['parse_osu_bytes (bytes)']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+osu_std 解析内存占用对比：HitObject 列表 vs HitObjectColumns 列式存储
+
+运行：python benchmarks/bench_osu_std_columnar.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from osu_std import OsuFileParser
+from corpus import generate_corpus
+
+
+def measure(parser, texts):
+    """解析全部谱面并保持引用，返回 (常驻内存字节数, 耗时秒)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    beatmaps = [parser.parse(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del beatmaps
+    return current, elapsed
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 3000
+    texts = [data.decode("utf-8") for data in generate_corpus(map_count, object_count, storyboard_lines=0)]
+    print(f"corpus: {map_count} maps x {object_count} objects")
+
+    results = {}
+    for label, parser in (("list of HitObject", OsuFileParser()),
+                          ("HitObjectColumns", OsuFileParser(columnar=True))):
+        memory, elapsed = measure(parser, texts)
+        results[label] = memory
+        print(f"  {label:<20} {memory / 1e6:8.1f} MB  {elapsed * 1000:8.1f} ms")
+    print(f"  memory ratio: {results['HitObjectColumns'] / results['list of HitObject']:.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+解析缓存收益：重新解析文本 vs 磁盘层读取（新进程冷启动）vs 进程内 LRU 命中
+
+运行：python benchmarks/bench_parse_cache.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from common.ingest import ingest
+from common.parse_cache import ParseCache
+from bench_osu_parser import bench
+from corpus import generate_corpus
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    corpus = generate_corpus(map_count, object_count)
+    print(f"corpus: {map_count} maps x {object_count} objects")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        warm = ParseCache(max_entries=map_count, cache_dir=cache_dir)
+        for data in corpus:
+            warm.get(data)
+        print(f"  disk layer: {warm.stats.disk_bytes / 1024:.0f} KB, "
+              f"text: {sum(len(d) for d in corpus) / 1024:.0f} KB")
+
+        def disk_load(data):
+            # 每轮使用新的 ParseCache（空 LRU），模拟新进程
+            ParseCache(max_entries=0, cache_dir=cache_dir).get(data)
+
+        best = bench([
+            ("text parse (ingest)", ingest),
+            ("disk layer load", disk_load),
+            ("in-process LRU hit", warm.get),
+        ], corpus, rounds=5)
+        print(f"  disk vs parse: {best['text parse (ingest)'] / best['disk layer load']:.1f}x")
+        print(f"  LRU vs parse: {best['text parse (ingest)'] / best['in-process LRU hit']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
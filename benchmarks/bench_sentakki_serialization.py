@@ -0,0 +1,39 @@
+"""
+SentakkiBeatmap binary format: re-running SentakkiConverter vs loading the saved artifact
+
+Run: python benchmarks/bench_sentakki_serialization.py [map count] [objects per map]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from osu_std.parser import parse_osu
+from sentakki.beatmaps import ConversionFlags
+from sentakki.beatmaps.serialization import dumps, loads
+from sentakki.converter import SentakkiConverter
+from bench_osu_parser import bench
+from corpus import generate_corpus
+
+FLAGS = ConversionFlags.TWIN_NOTES | ConversionFlags.FAN_SLIDES | ConversionFlags.TWIN_SLIDES
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    corpus = generate_corpus(map_count, object_count)
+    print(f"corpus: {map_count} maps x {object_count} objects")
+
+    osu_beatmaps = {id(data): parse_osu(data.decode("utf-8")) for data in corpus}
+    artifacts = {id(data): dumps(SentakkiConverter(osu_beatmaps[id(data)], flags=FLAGS).convert()) for data in corpus}
+    print(f"  artifact size: {sum(len(a) for a in artifacts.values()) / len(corpus) / 1024:.0f} KB/map")
+
+    best = bench([
+        ("SentakkiConverter.convert", lambda data: SentakkiConverter(osu_beatmaps[id(data)], flags=FLAGS).convert()),
+        ("serialization.loads", lambda data: loads(artifacts[id(data)])),
+    ], corpus, rounds=5)
+    print(f"  speedup: {best['SentakkiConverter.convert'] / best['serialization.loads']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
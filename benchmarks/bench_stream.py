@@ -0,0 +1,62 @@
+"""
+超长谱面 / 合集文件的峰值内存对比：整体读入 parse vs mmap 流式解析
+
+两种方式都遍历全部物件一次（只统计数量，不保留物件）。
+
+运行：python benchmarks/bench_stream.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_file, iter_hit_objects
+from common.stream import split_concatenated
+from corpus import generate_corpus
+
+
+def parse_whole(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    count = 0
+    for start, end in split_concatenated(data):
+        count += len(parse_osu_file(data[start:end].decode("utf-8")).hit_objects)
+    return count
+
+
+def parse_streamed(path):
+    count = 0
+    for _ in iter_hit_objects(path):
+        count += 1
+    return count
+
+
+def measure(fn, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, peak, elapsed
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pack.osu")
+        with open(path, "wb") as f:
+            for data in generate_corpus(map_count, object_count):
+                f.write(data)
+        print(f"pack: {map_count} maps x {object_count} objects, {os.path.getsize(path) / 1e6:.1f} MB")
+        for label, fn in (("read + parse_osu_file", parse_whole), ("iter_hit_objects (mmap)", parse_streamed)):
+            count, peak, elapsed = measure(fn, path)
+            print(f"  {label:<26} objects={count}  peak={peak / 1e6:7.1f} MB  {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
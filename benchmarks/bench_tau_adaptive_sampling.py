@@ -0,0 +1,78 @@
+"""
+自适应滑条采样：节点数与耗时，固定 20ms 步长 vs AdaptiveSampling
+
+报告：
+- 滑条节点总数
+- 转换耗时（简化在完整采样之后进行，转换本身会略慢）
+- 下游 PolarSliderPath 操作耗时：calculated_distance、calculate_lazy_distance、按 20ms 扫描 angle_at
+- 难度计算耗时，以及 distance / lazy distance / star rating 的最大偏差
+
+运行：python benchmarks/bench_tau_adaptive_sampling.py [谱面数量] [每张物件数] [angle_tolerance]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import AdaptiveSampling, convert_osu_beatmap
+from tau.difficulty.difficultyCalculator import TauDifficultyCalculator
+from tau.objects import Slider
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def path_ops(tau_beatmap):
+    for obj in tau_beatmap.hit_objects:
+        if isinstance(obj, Slider):
+            path = obj.path
+            path.calculated_distance
+            path.calculate_lazy_distance(0)
+            for t in range(0, int(path.duration), 20):
+                path.angle_at(t)
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    tolerance = float(sys.argv[3]) if len(sys.argv) > 3 else 5.0
+    sampling = AdaptiveSampling(angle_tolerance=tolerance)
+    maps = [generate_osu(object_count, seed=seed).encode("utf-8") for seed in range(map_count)]
+    print(f"{map_count} beatmaps x {object_count} objects, {sampling}")
+
+    best = bench([
+        ("convert, fixed 20ms", lambda data: convert_osu_beatmap(parse_osu_bytes(data), curve_cache=None)),
+        ("convert, adaptive", lambda data: convert_osu_beatmap(parse_osu_bytes(data), curve_cache=None,
+                                                               adaptive_sampling=sampling)),
+    ], maps, rounds=3)
+    print(f"  conversion: {best['convert, adaptive'] / best['convert, fixed 20ms']:.2f}x time")
+
+    fixed = [convert_osu_beatmap(parse_osu_bytes(data)) for data in maps]
+    adaptive = [convert_osu_beatmap(parse_osu_bytes(data), adaptive_sampling=sampling) for data in maps]
+
+    def node_count(beatmaps):
+        return sum(len(o.path.nodes) for b in beatmaps for o in b.hit_objects if isinstance(o, Slider))
+    before, after = node_count(fixed), node_count(adaptive)
+    print(f"  slider nodes: {before} -> {after} ({before / after:.1f}x fewer)")
+
+    best = {}
+    for name, beatmaps in (("fixed", fixed), ("adaptive", adaptive)):
+        best.update(bench([(f"path ops, {name}", path_ops)], beatmaps, rounds=3))
+        best.update(bench([(f"difficulty, {name}", lambda b: TauDifficultyCalculator(b).calculate())],
+                          beatmaps, rounds=3))
+    print(f"  path ops speedup: {best['path ops, fixed'] / best['path ops, adaptive']:.2f}x, "
+          f"difficulty speedup: {best['difficulty, fixed'] / best['difficulty, adaptive']:.2f}x")
+
+    distance_error = lazy_error = 0.0
+    for a_map, b_map in zip(fixed, adaptive):
+        for a, b in zip(a_map.hit_objects, b_map.hit_objects):
+            if isinstance(a, Slider):
+                distance_error = max(distance_error, abs(a.path.calculated_distance - b.path.calculated_distance))
+                lazy_error = max(lazy_error, abs(a.path.calculate_lazy_distance(0) - b.path.calculate_lazy_distance(0)))
+    star_error = max(abs(TauDifficultyCalculator(a).calculate().star_rating - TauDifficultyCalculator(b).calculate().star_rating)
+                     for a, b in zip(fixed, adaptive))
+    print(f"  max error: distance {distance_error:.2e}, lazy distance {lazy_error:.2e}, star rating {star_error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
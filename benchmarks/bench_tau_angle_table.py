@@ -0,0 +1,81 @@
+"""
+物件角度计算：逐点三角函数 vs 预计算角度表
+
+1. 标量：旧版 get_hit_object_angle（normalize_angle 调用、常量逐次查找）与内联后的版本，
+   输入为谱面中的物件位置与滑条采样点
+2. 转换：use_numpy=True 时逐元素 math.atan2 与 AngleTable 查表插值，整张谱面转换耗时
+
+逐点查表在 CPython 中不比 math.atan2 快，标量路径因此只做了内联；查表只用于 NumPy 批量采样。
+
+运行：python benchmarks/bench_tau_angle_table.py [谱面数量] [每张物件数]
+"""
+
+import math
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.models.others import Pos
+from any.osu_parser import parse_osu_bytes
+from tau import convertor
+from tau.convertor import AngleTable, TauBeatmapConverter, convert_osu_beatmap, get_hit_object_angle
+from tau.objects import normalize_angle
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def get_hit_object_angle_old(pos) -> float:
+    """内联前的实现"""
+    if pos is None:
+        return 0.0
+    dx = pos.x - convertor.STANDARD_PLAYFIELD_CENTER[0]
+    dy = pos.y - convertor.STANDARD_PLAYFIELD_CENTER[1]
+    angle = math.degrees(math.atan2(dy, dx))
+    return normalize_angle(angle + 90)
+
+
+def sample_positions(beatmaps):
+    """谱面中实际出现的角度计算输入：物件位置 + 滑条 20ms 采样点"""
+    converter = TauBeatmapConverter(curve_cache=None)
+    positions = []
+    for beatmap in beatmaps:
+        for obj in beatmap.hit_objects:
+            positions.append(obj.pos)
+            path = converter._curve_path(obj) if hasattr(obj, 'curves') else None
+            if path is not None:
+                count = max(1, int(path.distance // 5))
+                positions.extend(path.position_at(i / count) for i in range(count + 1))
+    return positions
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    maps = [generate_osu(object_count, seed=seed).encode("utf-8") for seed in range(map_count)]
+
+    positions = sample_positions([parse_osu_bytes(data) for data in maps])
+    integer = sum(1 for p in positions if float(p.x).is_integer() and float(p.y).is_integer())
+    print(f"{len(positions)} positions ({integer / len(positions):.0%} integer-valued)")
+    assert all(get_hit_object_angle(p) == get_hit_object_angle_old(p) for p in positions)
+    best = bench([
+        ("scalar, old", lambda chunk: [get_hit_object_angle_old(p) for p in chunk]),
+        ("scalar, inlined", lambda chunk: [get_hit_object_angle(p) for p in chunk]),
+    ], [positions], rounds=5)
+    print(f"  scalar speedup: {best['scalar, old'] / best['scalar, inlined']:.2f}x")
+
+    start = time.perf_counter()
+    table = AngleTable()
+    print(f"  AngleTable build: {(time.perf_counter() - start) * 1000:.0f} ms, {table.table.nbytes / 1024 / 1024:.1f} MiB")
+
+    # 默认阈值下只有长滑条走 NumPy 采样；短滑条的数组开销会抵消查表的收益
+    best = bench([
+        ("numpy, atan2", lambda data: convert_osu_beatmap(parse_osu_bytes(data), use_numpy=True, curve_cache=None)),
+        ("numpy, table", lambda data: convert_osu_beatmap(parse_osu_bytes(data), use_numpy=True, curve_cache=None,
+                                                          angle_table=table)),
+    ], maps, rounds=3)
+    print(f"  conversion speedup: {best['numpy, atan2'] / best['numpy, table']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+滑条路径存储：SliderNode 列表 + 游标 (PolarSliderPath) vs 并行 array('d') + bisect (ArrayPolarSliderPath)
+
+1. 构造：由采样得到的时间、角度序列构造路径（列表版需要为每个节点创建 SliderNode）
+2. 内存：全部滑条路径占用的内存（tracemalloc）
+3. 查询：按时间顺序扫描 angle_at（游标每次只移动一步），以及随机顺序查询
+4. 整张谱面转换耗时（array_paths=False / True）
+
+运行：python benchmarks/bench_tau_array_path.py [谱面数量] [每张物件数]
+"""
+
+import os
+import random
+import sys
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import convert_osu_beatmap
+from tau.objects import ArrayPolarSliderPath, PolarSliderPath, Slider, SliderNode
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def build_list(samples):
+    return [PolarSliderPath([SliderNode(t, a) for t, a in zip(times, angles)]) for times, angles in samples]
+
+
+def build_array(samples):
+    return [ArrayPolarSliderPath.from_samples(times, angles) for times, angles in samples]
+
+
+def measure_memory(build, samples):
+    tracemalloc.start()
+    paths = build(samples)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del paths
+    return size
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    maps = [generate_osu(object_count, seed=seed).encode("utf-8") for seed in range(map_count)]
+    parsed = [parse_osu_bytes(data) for data in maps]
+
+    samples = []
+    for osu_beatmap in parsed:
+        tau_beatmap = convert_osu_beatmap(osu_beatmap)
+        samples.append([([n.time for n in obj.path.nodes], [n.angle for n in obj.path.nodes])
+                        for obj in tau_beatmap.hit_objects if isinstance(obj, Slider)])
+    flat = [s for batch in samples for s in batch]
+    nodes = sum(len(times) for times, _ in flat)
+    print(f"{len(flat)} slider paths, {nodes / len(flat):.1f} nodes avg")
+
+    print("build")
+    best = bench([
+        ("SliderNode list", build_list),
+        ("array", build_array),
+    ], samples, rounds=5)
+    print(f"  speedup: {best['SliderNode list'] / best['array']:.2f}x")
+
+    list_memory = measure_memory(build_list, flat)
+    array_memory = measure_memory(build_array, flat)
+    print(f"memory: {list_memory / 2 ** 20:.1f} MiB -> {array_memory / 2 ** 20:.1f} MiB "
+          f"({list_memory / nodes:.0f} -> {array_memory / nodes:.0f} bytes/node)")
+
+    rng = random.Random(0)
+    queries = []
+    for batch in samples:
+        for times, _ in batch:
+            scan = [t + 7.0 for t in times]
+            shuffled = list(scan)
+            rng.shuffle(shuffled)
+            queries.append((scan, shuffled))
+    list_paths = [(p, q) for p, q in zip(build_list(flat), queries)]
+    array_paths = [(p, q) for p, q in zip(build_array(flat), queries)]
+    for (a, (scan, shuffled)), (b, _) in zip(list_paths, array_paths):
+        assert [a.angle_at(t) for t in shuffled] == [b.angle_at(t) for t in shuffled]
+
+    def scan(pairs):
+        for path, (times, _) in pairs:
+            for t in times:
+                path.angle_at(t)
+
+    def shuffled(pairs):
+        for path, (_, times) in pairs:
+            for t in times:
+                path.angle_at(t)
+
+    print("angle_at, sequential")
+    best = bench([("cursor (list)", scan)], [list_paths], rounds=5)
+    best.update(bench([("bisect (array)", scan)], [array_paths], rounds=5))
+    print(f"  speedup: {best['cursor (list)'] / best['bisect (array)']:.2f}x")
+    print("angle_at, random order")
+    best = bench([("cursor (list)", shuffled)], [list_paths], rounds=5)
+    best.update(bench([("bisect (array)", shuffled)], [array_paths], rounds=5))
+    print(f"  speedup: {best['cursor (list)'] / best['bisect (array)']:.2f}x")
+
+    print("conversion")
+    best = bench([
+        ("PolarSliderPath", lambda b: convert_osu_beatmap(b, curve_cache=None)),
+        ("ArrayPolarSliderPath", lambda b: convert_osu_beatmap(b, curve_cache=None, array_paths=True)),
+    ], parsed, rounds=3)
+    print(f"  speedup: {best['PolarSliderPath'] / best['ArrayPolarSliderPath']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+批量 Tau 难度计算的吞吐量随进程数的变化
+
+生成一批合成谱面写入临时目录，分别以 1、2、4 … 个进程运行 calculate_batch，
+报告 maps/s、objects/s 与相对单进程的加速比（上限为机器的核心数）。
+
+运行：python benchmarks/bench_tau_batch.py [谱面数量] [每张物件数] [chunk_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tau.batch import calculate_batch
+from corpus import generate_osu
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 48
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    chunk_size = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    cores = os.cpu_count() or 1
+    worker_counts = sorted({1, *[n for n in (2, 4, 8, 16) if n <= cores], cores})
+
+    with tempfile.TemporaryDirectory() as directory:
+        for seed in range(map_count):
+            with open(os.path.join(directory, f"{seed:04d}.osu"), "w", encoding="utf-8") as f:
+                f.write(generate_osu(object_count, seed=seed))
+        print(f"{map_count} beatmaps x {object_count} objects, chunk_size={chunk_size}, {cores} CPU(s)")
+
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            results = calculate_batch(directory, workers=workers, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - start
+            objects = sum(r.object_count for r in results)
+            baseline = baseline or elapsed
+            print(f"  {workers:>2} worker(s) {elapsed * 1000:9.1f} ms  {map_count / elapsed:7.1f} maps/s  "
+                  f"{objects / elapsed:>10,.0f} objects/s  {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+贝塞尔展平：原递归实现 vs 迭代、复用缓冲区的 bezier_to_piecewise_linear
+
+原实现（_bezier_subdivide + 递归 _bezier_to_piecewise_linear）原样复制在本文件中用于对比；
+注意它每次递归丢弃左半部分的最后一个控制点，输出本身与 osu! 不一致，这里只比较耗时。
+
+运行：python benchmarks/bench_tau_bezier.py [滑条数量]
+"""
+
+import os
+import random
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.models.others import Pos
+from tau.convertor import BEZIER_TOLERANCE, bezier_to_piecewise_linear
+from bench_osu_parser import bench
+
+
+def _bezier_is_flat_enough(points):
+    for i in range(1, len(points) - 1):
+        diff = Pos()
+        diff.x = points[i - 1].x - 2 * points[i].x + points[i + 1].x
+        diff.y = points[i - 1].y - 2 * points[i].y + points[i + 1].y
+        length_squared = diff.x * diff.x + diff.y * diff.y
+        if length_squared > BEZIER_TOLERANCE * BEZIER_TOLERANCE * 4:
+            return False
+    return True
+
+
+def _bezier_subdivide(points, progress):
+    midpoints = list(points)
+    count = len(points)
+    for i in range(count):
+        for j in range(count - i - 1):
+            mid_point = Pos()
+            mid_point.x = (midpoints[j].x + midpoints[j + 1].x) / 2
+            mid_point.y = (midpoints[j].y + midpoints[j + 1].y) / 2
+            midpoints[j] = mid_point
+    left = [points[0]]
+    right = [midpoints[count - 1]]
+    subdivision_buffer = list(points)
+    for i in range(count):
+        left.append(midpoints[0] if i < len(midpoints) else Pos())
+        right.insert(0, midpoints[count - i - 1] if count - i - 1 < len(midpoints) else Pos())
+        for j in range(count - i - 1):
+            mid_point = Pos()
+            mid_point.x = (subdivision_buffer[j].x + subdivision_buffer[j + 1].x) / 2
+            mid_point.y = (subdivision_buffer[j].y + subdivision_buffer[j + 1].y) / 2
+            subdivision_buffer[j] = mid_point
+    return left[:count], right[:count]
+
+
+def recursive_bezier(control_points):
+    if len(control_points) < 2:
+        return control_points
+    if _bezier_is_flat_enough(control_points):
+        return control_points
+    left, right = _bezier_subdivide(control_points, 0.5)
+    return recursive_bezier(left[:-1]) + recursive_bezier(right)
+
+
+def make_sliders(count, seed=0, anchors=True):
+    """
+    B 滑条，总计 20+ 个控制点
+
+    anchors=True 时每 3-6 个控制点插入一个重合点（红色锚点）分段；
+    False 时为单段曲线，用于单独比较展平算法本身
+    """
+    rng = random.Random(seed)
+    sliders = []
+    for _ in range(count):
+        points = [Pos(rng.randint(0, 512), rng.randint(0, 384))]
+        while len(points) < 20:
+            for _ in range(rng.randint(2, 5)):
+                points.append(Pos(rng.randint(0, 512), rng.randint(0, 384)))
+            if anchors:
+                points.append(Pos(points[-1].x, points[-1].y))
+        points.append(Pos(rng.randint(0, 512), rng.randint(0, 384)))
+        sliders.append(points)
+    return sliders
+
+
+def main():
+    slider_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    def run(fn):
+        def inner(batch):
+            for points in batch:
+                fn(points)
+        return inner
+
+    for anchors in (True, False):
+        batches = [make_sliders(slider_count // 10, seed, anchors) for seed in range(10)]
+        kind = "multi-segment (red anchors)" if anchors else "single-segment"
+        print(f"{slider_count} {kind} B sliders, "
+              f"{sum(len(s) for b in batches for s in b) / slider_count:.1f} control points avg")
+        best = bench([
+            ("recursive (old)", run(recursive_bezier)),
+            ("iterative", run(bezier_to_piecewise_linear)),
+        ], batches, rounds=3)
+        print(f"  speedup: {best['recursive (old)'] / best['iterative']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Catmull-Rom 近似：逐点调用 _catmull_find_point、每步输出两个点 vs 预计算 (t, t², t³) 表、每点只算一次
+
+1. 近似：原实现（原样复制在本文件中）、catmull_rom_coordinates、catmull_rom_coordinates_numpy
+2. 构造 CurvePath：点数减半后累计长度表也减半
+3. 单点查询：_catmull_rom_curve_position_at 原先每次构造整条近似折线，现在直接计算目标点
+
+运行：python benchmarks/bench_tau_catmull.py [滑条数量]
+"""
+
+import os
+import random
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.models.others import Pos
+from tau.convertor import (CurvePath, _catmull_find_point, _catmull_rom_curve_position_at,
+                           catmull_rom_coordinates, catmull_rom_coordinates_numpy)
+from bench_osu_parser import bench
+
+
+def approximate_old(control_points):
+    """原 _approximate_catmull_rom"""
+    result_points = []
+    for i in range(len(control_points) - 1):
+        v1 = control_points[max(0, i - 1)]
+        v2 = control_points[i]
+        v3 = control_points[min(len(control_points) - 1, i + 1)]
+        v4 = control_points[min(len(control_points) - 1, i + 2)]
+        for c in range(50):
+            p1 = _catmull_find_point(v1, v2, v3, v4, c / 50)
+            p2 = _catmull_find_point(v1, v2, v3, v4, (c + 1) / 50)
+            result_points.extend([p1, p2])
+    return result_points
+
+
+def position_at_old(points, progress):
+    """原 _catmull_rom_curve_position_at"""
+    result_points = approximate_old(points)
+    target_index = int(progress * (len(result_points) - 1))
+    return result_points[max(0, min(target_index, len(result_points) - 1))]
+
+
+def make_sliders(count, seed=0):
+    rng = random.Random(seed)
+    return [[Pos(rng.randint(0, 512), rng.randint(0, 384)) for _ in range(rng.randint(3, 8))]
+            for _ in range(count)]
+
+
+def main():
+    slider_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    batches = [make_sliders(slider_count // 10, seed) for seed in range(10)]
+    control = sum(len(s) for b in batches for s in b)
+    print(f"{slider_count} C sliders, {control / slider_count:.1f} control points avg")
+
+    def run(fn):
+        def inner(batch):
+            for points in batch:
+                fn(points)
+        return inner
+
+    def to_pos(xs, ys):
+        return [Pos(x, y) for x, y in zip(xs, ys)]
+
+    old_points = sum(len(approximate_old(s)) for b in batches for s in b)
+    new_points = sum(len(catmull_rom_coordinates(s)[0]) for b in batches for s in b)
+    print(f"  points: {old_points} -> {new_points}")
+
+    cases = [
+        ("approximate (old)", run(approximate_old)),
+        ("approximate", run(lambda s: to_pos(*catmull_rom_coordinates(s)))),
+    ]
+    try:
+        import numpy  # noqa: F401
+        cases.append(("approximate (numpy)", run(lambda s: to_pos(*catmull_rom_coordinates_numpy(s)))))
+    except ImportError:
+        pass
+    best = bench(cases, batches, rounds=3)
+    print(f"  approximation speedup: {best['approximate (old)'] / best['approximate']:.1f}x")
+
+    best = bench([
+        ("approximate + CurvePath (old)", run(lambda s: CurvePath(approximate_old(s), 300.0))),
+        ("approximate + CurvePath", run(lambda s: CurvePath.from_coordinates(*catmull_rom_coordinates(s), 300.0))),
+    ], batches, rounds=3)
+    print(f"  path speedup: {best['approximate + CurvePath (old)'] / best['approximate + CurvePath']:.1f}x")
+
+    progresses = [i / 19 for i in range(20)]
+    best = bench([
+        ("position_at (old)", run(lambda s: [position_at_old(s, p) for p in progresses])),
+        ("position_at", run(lambda s: [_catmull_rom_curve_position_at(s, p) for p in progresses])),
+    ], [b[:5] for b in batches], rounds=3)
+    print(f"  position_at speedup: {best['position_at (old)'] / best['position_at']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
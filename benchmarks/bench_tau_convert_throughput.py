@@ -0,0 +1,56 @@
+"""
+Tau 转换吞吐量（物件/秒）：单趟共用转换器 vs 旧的逐物件创建转换器
+
+旧实现对每个物件调用 convert_object（每次新建 TauBeatmapConverter，isinstance 链分派），
+失败的物件被 try/except 静默跳过；这里保留一份用于对照。
+两种方式都关闭曲线缓存，谱面只解析一次。
+
+运行：python benchmarks/bench_tau_convert_throughput.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.beatmap import TauBeatmap
+from tau.convertor import convert_object, convert_osu_beatmap
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def convert_per_object(osu_beatmap):
+    """旧实现：每个物件新建转换器"""
+    tau_beatmap = TauBeatmap()
+    for obj in osu_beatmap.hit_objects:
+        try:
+            tau_obj = convert_object(obj, osu_beatmap, curve_cache=None)
+            if tau_obj:
+                tau_beatmap.add_hit_object(tau_obj)
+        except Exception:
+            continue
+    return tau_beatmap
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    parsed = [parse_osu_bytes(generate_osu(object_count, seed=seed).encode("utf-8")) for seed in range(map_count)]
+    total = sum(len(b.hit_objects) for b in parsed)
+    print(f"{map_count} beatmaps, {total} objects")
+
+    best = bench([
+        ("per-object converter", convert_per_object),
+        ("single pass", lambda beatmap: convert_osu_beatmap(beatmap, curve_cache=None)),
+    ], parsed, rounds=3)
+
+    for name in ("per-object converter", "single pass"):
+        print(f"  {name:<22} {total / best[name]:>12,.0f} objects/s")
+    print(f"  speedup: {best['per-object converter'] / best['single pass']:.2f}x")
+
+    stats = [convert_osu_beatmap(b).conversion_stats for b in parsed]
+    print(f"  converted {sum(s.converted for s in stats)}, failed {sum(s.failed for s in stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+曲线近似缓存：同一谱面集多个难度的 Tau 转换，缓存 vs 不缓存
+
+合成谱面集：每个谱面集 4 个难度，物件完全相同，只有 OD / AR 不同（模拟共享滑条的难度）。
+谱面只解析一次，各轮转换同一批解析结果。
+
+运行：python benchmarks/bench_tau_curve_cache.py [谱面集数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import CurveApproximationCache, convert_osu_beatmap
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def make_sets(set_count, object_count):
+    sets = []
+    for seed in range(set_count):
+        text = generate_osu(object_count, seed=seed)
+        sets.append([parse_osu_bytes(text.replace("OverallDifficulty:8", f"OverallDifficulty:{od}")
+                                     .replace("ApproachRate:9", f"ApproachRate:{od + 1}").encode("utf-8"))
+                     for od in (5, 6, 7, 8)])
+    return sets
+
+
+def main():
+    set_count = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    sets = make_sets(set_count, object_count)
+    print(f"{set_count} beatmapsets x 4 difficulties x {object_count} objects")
+
+    def with_cache(cache):
+        def inner(difficulties):
+            for beatmap in difficulties:
+                convert_osu_beatmap(beatmap, curve_cache=cache)
+        return inner
+
+    cache = CurveApproximationCache()
+    best = bench([
+        ("no cache", with_cache(None)),
+        ("curve cache (warm)", with_cache(cache)),
+    ], sets, rounds=3)
+    stats = cache.stats
+    print(f"  cache: {stats.entries} entries, hits {stats.hits}, misses {stats.misses}, "
+          f"hit rate {stats.hit_rate:.1%}")
+    print(f"  speedup: {best['no cache'] / best['curve cache (warm)']:.2f}x")
+
+    # 冷缓存：每个谱面集只有第一个难度需要计算
+    cold = CurveApproximationCache()
+    for difficulties in sets:
+        with_cache(cold)(difficulties)
+    print(f"  cold run over all sets: hit rate {cold.stats.hit_rate:.1%} "
+          f"({cold.stats.hits} hits / {cold.stats.misses} misses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Tau 难度技能：逐个技能遍历（Aim x2、Speed、Complexity 各一遍）vs 单次融合遍历
+
+- 技能阶段：在预先创建好的难度物件上只运行技能（每轮新建技能对象）
+- 完整 calculate(fused=False / True)：包含难度物件创建与属性计算
+
+两种方式的难度属性逐位一致，最后一并校验。
+
+运行：python benchmarks/bench_tau_fused_skills.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import convert_osu_beatmap
+from tau.difficulty.difficultyCalculator import TauDifficultyCalculator
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def per_skill(prepared):
+    calculator, difficulty_hit_objects = prepared
+    for skill in calculator._create_skills(difficulty_hit_objects):
+        for hit_object in difficulty_hit_objects:
+            skill.process(hit_object)
+
+
+def fused(prepared):
+    calculator, difficulty_hit_objects = prepared
+    calculator._process_skills_fused(calculator._create_skills(difficulty_hit_objects), difficulty_hit_objects)
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2500
+    beatmaps = [convert_osu_beatmap(parse_osu_bytes(generate_osu(object_count, seed=seed).encode("utf-8")))
+                for seed in range(map_count)]
+    calculators = [TauDifficultyCalculator(beatmap) for beatmap in beatmaps]
+    prepared = [(c, c._create_difficulty_hit_objects()) for c in calculators]
+    print(f"{map_count} beatmaps x {object_count} objects")
+
+    print("skills only")
+    best = bench([
+        ("per-skill passes", per_skill),
+        ("fused pass", fused),
+    ], prepared, rounds=5)
+    print(f"  speedup: {best['per-skill passes'] / best['fused pass']:.2f}x")
+
+    print("calculate()")
+    best = bench([
+        ("calculate(fused=False)", lambda c: c.calculate(fused=False)),
+        ("calculate(fused=True)", lambda c: c.calculate(fused=True)),
+    ], calculators, rounds=5)
+    print(f"  speedup: {best['calculate(fused=False)'] / best['calculate(fused=True)']:.2f}x")
+
+    same = all(vars(c.calculate(fused=False)) == vars(c.calculate(fused=True)) for c in calculators)
+    print(f"  identical attributes: {same}")
+
+
+if __name__ == "__main__":
+    main()
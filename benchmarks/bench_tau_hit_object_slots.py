@@ -0,0 +1,150 @@
+"""
+Tau 击打物件：__dict__ 与 __slots__ 布局的内存与构造耗时
+
+原实现（每个物件一个 __dict__，angle / range 通过 getattr 默认值读取）原样复制在本文件中用于对比。
+报告每种物件的字节数（tracemalloc，含 samples 等空列表）、构造耗时与 angle 读取耗时。
+
+运行：python benchmarks/bench_tau_hit_object_slots.py [每种物件数量]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from tau import objects
+from tau.objects import IHasAngle, IHasOffsetAngle
+
+
+class OldHitObject:
+    def __init__(self):
+        self.start_time = 0
+        self.samples = []
+
+
+class OldTauHitObject(OldHitObject):
+    @property
+    def angle(self):
+        return getattr(self, '_angle', 0.0)
+
+    @angle.setter
+    def angle(self, value):
+        self._angle = value
+
+    def get_offset_angle(self):
+        return 0.0
+
+    @property
+    def range(self):
+        return getattr(self, '_range', 0.0)
+
+    @range.setter
+    def range(self, value):
+        self._range = value
+
+    def __init__(self):
+        super().__init__()
+        self.time_preempt = 600
+        self.time_fade_in = 400
+        self.new_combo = False
+        self.combo_offset = 0
+        self.index_in_current_combo = 0
+        self.combo_index = 0
+        self.combo_index_with_offsets = 0
+        self.last_in_combo = False
+        self.start_time = 0.0
+
+
+class OldAngledTauHitObject(OldTauHitObject, IHasAngle):
+    path = None
+    duration = 0.0
+
+    def __init__(self):
+        super().__init__()
+        self._angle = 0.0
+        self.angle_range = 0.0
+
+    @property
+    def angle(self):
+        return self._angle
+
+    @angle.setter
+    def angle(self, value):
+        self._angle = value
+
+
+class OldBeat(OldAngledTauHitObject):
+    pass
+
+
+class OldHardBeat(OldTauHitObject):
+    pass
+
+
+class OldStrictHardBeat(OldHardBeat):
+    def __init__(self):
+        super().__init__()
+        self.range = 0.0
+
+
+class OldSlider(OldAngledTauHitObject, IHasOffsetAngle):
+    def __init__(self):
+        super().__init__()
+        self.is_hard = False
+        self.path = None
+        self.head_beat = None
+        self.tail_samples = []
+        self.velocity = 0
+        self.tick_distance = 0
+        self.tick_distance_multiplier = 2
+        self.repeat_count = 0
+        self.node_samples = []
+        self._span_duration = 0
+        self.nested_hit_objects = []
+
+    @property
+    def duration(self):
+        return 0
+
+    def get_offset_angle(self):
+        return 0
+
+
+def bytes_per_object(cls, count):
+    tracemalloc.start()
+    items = [cls() for _ in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (size - count * 8) / count  # 减去列表本身每项 8 字节
+
+
+def best_time(fn, rounds=5):
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    pairs = [("Beat", OldBeat, objects.Beat), ("HardBeat", OldHardBeat, objects.HardBeat),
+             ("StrictHardBeat", OldStrictHardBeat, objects.StrictHardBeat), ("Slider", OldSlider, objects.Slider)]
+    print(f"{count} objects per type")
+    print(f"  {'':<16}{'bytes/object':>22}{'construct (ns)':>22}{'angle read (ns)':>22}")
+    for name, old, new in pairs:
+        old_bytes, new_bytes = bytes_per_object(old, count), bytes_per_object(new, count)
+        old_build = best_time(lambda: [old() for _ in range(count)]) / count * 1e9
+        new_build = best_time(lambda: [new() for _ in range(count)]) / count * 1e9
+        old_items, new_items = [old() for _ in range(count)], [new() for _ in range(count)]
+        old_read = best_time(lambda: [o.angle for o in old_items]) / count * 1e9
+        new_read = best_time(lambda: [o.angle for o in new_items]) / count * 1e9
+        print(f"  {name:<16}{old_bytes:>10.0f} -> {new_bytes:<8.0f}{old_build:>12.0f} -> {new_build:<8.0f}"
+              f"{old_read:>12.1f} -> {new_read:<8.1f}")
+
+
+if __name__ == "__main__":
+    main()
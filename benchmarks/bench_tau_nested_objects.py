@@ -0,0 +1,46 @@
+"""
+滑条嵌套物件与最大连击数
+
+- 原来的近似（每个滑条 repeat_count + 2）与按滑条事件计数的最大连击数
+- 生成嵌套物件（create_nested_hit_objects，首次访问 nested_hit_objects 时的开销）与
+  生成后读取 Slider.max_combo 的耗时
+- 原近似的耗时作为下限参考
+
+运行：python benchmarks/bench_tau_nested_objects.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import convert_osu_beatmap
+from tau.objects import Slider, SliderTick
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    beatmaps = [convert_osu_beatmap(parse_osu_bytes(generate_osu(object_count, seed=seed).encode("utf-8")))
+                for seed in range(map_count)]
+    sliders = [[obj for obj in b.hit_objects if isinstance(obj, Slider)] for b in beatmaps]
+
+    approximate = sum(s.repeat_count + 2 for batch in sliders for s in batch)
+    counted = sum(s.max_combo for batch in sliders for s in batch)
+    ticks = sum(isinstance(o, SliderTick) for batch in sliders for s in batch for o in s.nested_hit_objects)
+    print(f"{sum(map(len, sliders))} sliders: slider combo {approximate} (repeat_count + 2) -> {counted} "
+          f"({ticks} ticks)")
+
+    best = bench([
+        ("repeat_count + 2 (old)", lambda batch: sum(s.repeat_count + 2 for s in batch)),
+        ("max_combo (generated)", lambda batch: sum(s.max_combo for s in batch)),
+        ("create_nested_hit_objects", lambda batch: [s.create_nested_hit_objects() for s in batch]),
+    ], sliders, rounds=5)
+    print(f"  reading generated nested objects vs regenerating them: "
+          f"{best['create_nested_hit_objects'] / best['max_combo (generated)']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
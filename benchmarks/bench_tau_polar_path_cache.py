@@ -0,0 +1,87 @@
+"""
+PolarSliderPath 距离缓存：每次访问遍历全部节点 vs 缓存 + 融合遍历
+
+难度物件对每个滑条先读 calculated_distance 再调用 calculate_lazy_distance；原实现两次都完整遍历路径，
+同一张谱面换 mods 重复计算时还会再遍历。这里对转换得到的全部滑条路径比较：
+1. 原实现（两次独立遍历，原样复制在本文件中）
+2. calculate_distances 首次访问（一次融合遍历；每轮前 invalidate 使缓存失效）
+3. 缓存命中（calculated_distance + calculate_lazy_distance 直接返回）
+
+运行：python benchmarks/bench_tau_polar_path_cache.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import convert_osu_beatmap
+from tau.objects import Slider, get_delta_angle
+from bench_osu_parser import bench
+from corpus import generate_osu
+
+
+def calculated_distance_old(path):
+    length = 0
+    if len(path.nodes) <= 0:
+        return length
+    last_angle = path.nodes[0].angle
+    for node in path.nodes:
+        delta = get_delta_angle(node.angle, last_angle)
+        length += abs(delta)
+        last_angle = node.angle
+    return length
+
+
+def calculate_lazy_distance_old(path, half_tolerance):
+    if len(path.nodes) <= 0:
+        return 0
+    length = 0.0
+    last_angle = path.nodes[0].angle
+    for node in path.nodes:
+        delta = get_delta_angle(node.angle, last_angle)
+        if abs(delta) > half_tolerance:
+            last_angle += delta - (half_tolerance if delta > 0 else -half_tolerance)
+            length += abs(delta)
+    return length
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    batches = []
+    for seed in range(map_count):
+        tau_beatmap = convert_osu_beatmap(parse_osu_bytes(generate_osu(object_count, seed=seed).encode("utf-8")))
+        batches.append([obj.path for obj in tau_beatmap.hit_objects if isinstance(obj, Slider) and obj.path])
+    paths = [path for batch in batches for path in batch]
+    print(f"{len(paths)} slider paths, {sum(len(p.nodes) for p in paths) / len(paths):.1f} nodes avg")
+
+    for path in paths:
+        assert path.calculate_distances(0.0) == (calculated_distance_old(path), calculate_lazy_distance_old(path, 0.0))
+
+    def old(batch):
+        for path in batch:
+            calculated_distance_old(path)
+            calculate_lazy_distance_old(path, 0.0)
+
+    def fused(batch):
+        for path in batch:
+            path.invalidate()
+            path.calculate_distances(0.0)
+
+    def cached(batch):
+        for path in batch:
+            path.calculated_distance
+            path.calculate_lazy_distance(0.0)
+
+    best = bench([
+        ("two walks, uncached (old)", old),
+        ("fused walk (first access)", fused),
+        ("cached access", cached),
+    ], batches, rounds=5)
+    print(f"  first access speedup: {best['two walks, uncached (old)'] / best['fused walk (first access)']:.2f}x")
+    print(f"  repeat access speedup: {best['two walks, uncached (old)'] / best['cached access']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
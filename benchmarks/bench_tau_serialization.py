@@ -0,0 +1,42 @@
+"""
+TauBeatmap 二进制格式：重新转换 vs 从序列化数据读取
+
+array_paths=True 转换的谱面读取时由节点列直接构造 ArrayPolarSliderPath，不创建 SliderNode。
+
+运行：python benchmarks/bench_tau_serialization.py [谱面数量] [每张物件数]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import convert_osu_beatmap
+from tau.serialization import dumps, loads
+from bench_osu_parser import bench
+from corpus import generate_corpus
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    corpus = generate_corpus(map_count, object_count)
+    print(f"corpus: {map_count} maps x {object_count} objects")
+
+    osu_beatmaps = {id(data): parse_osu_bytes(data) for data in corpus}
+    artifacts = {id(data): dumps(convert_osu_beatmap(osu_beatmaps[id(data)])) for data in corpus}
+    array_artifacts = {id(data): dumps(convert_osu_beatmap(osu_beatmaps[id(data)], array_paths=True))
+                       for data in corpus}
+    print(f"  artifact size: {sum(len(a) for a in artifacts.values()) / len(corpus) / 1024:.0f} KB/map")
+
+    best = bench([
+        ("convert_osu_beatmap", lambda data: convert_osu_beatmap(osu_beatmaps[id(data)])),
+        ("tau.serialization.loads", lambda data: loads(artifacts[id(data)])),
+        ("loads (array paths)", lambda data: loads(array_artifacts[id(data)])),
+    ], corpus, rounds=3)
+    print(f"  speedup: {best['convert_osu_beatmap'] / best['tau.serialization.loads']:.1f}x")
+    print(f"  array paths vs node paths: {best['tau.serialization.loads'] / best['loads (array paths)']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
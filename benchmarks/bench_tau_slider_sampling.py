@@ -0,0 +1,55 @@
+"""
+Tau 滑条节点采样：纯 Python vs NumPy 向量化（TauBeatmapConverter(use_numpy=True)）
+
+曲线近似在第一轮后已进入共享的曲线缓存，计时主要反映弧长表构建与 20ms 采样循环。
+分别统计原始滑条与长度放大 8 倍的长滑条。
+
+运行：python benchmarks/bench_tau_slider_sampling.py [谱面数量] [每张物件数]
+"""
+
+import copy
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.models.HitObject import Slider as OsuSlider
+from any.osu_parser import parse_osu_bytes
+from tau.convertor import TauBeatmapConverter
+from bench_osu_parser import bench
+from corpus import generate_corpus
+
+
+def convert_all(use_numpy):
+    def run(item):
+        beatmap, sliders = item
+        converter = TauBeatmapConverter(use_numpy=use_numpy)
+        for slider in sliders:
+            converter.convert_to_slider(slider, beatmap)
+    return run
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    corpus = generate_corpus(map_count, object_count)
+
+    for scale in (1, 8):
+        items = []
+        for data in corpus:
+            beatmap = parse_osu_bytes(data)
+            sliders = [copy.copy(o) for o in beatmap.hit_objects if isinstance(o, OsuSlider)]
+            for slider in sliders:
+                slider.length *= scale
+            items.append((beatmap, sliders))
+        nodes = sum(len(s.path.nodes) for b, ss in items for s in map(lambda o: TauBeatmapConverter().convert_to_slider(o, b), ss)
+                    if getattr(s, 'path', None))
+        print(f"length x{scale}: {sum(len(ss) for _, ss in items)} sliders, {nodes} nodes")
+        best = bench([
+            ("pure Python", convert_all(False)),
+            ("NumPy", convert_all(True)),
+        ], items, rounds=5)
+        print(f"  speedup: {best['pure Python'] / best['NumPy']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+流式 Tau 难度计算：峰值内存与耗时，完整列表 vs iter_convert + calculate_iter
+
+完整流程：parse -> convert_osu_beatmap（完整物件列表）-> calculate（完整难度物件列表）
+流式流程：stream_osu_file（按块解析）-> iter_convert -> calculate_iter（只保留最近的难度物件）
+
+两种流程都关闭曲线缓存，避免先运行的一方为后者预热。
+
+运行：python benchmarks/bench_tau_streaming.py [物件数]
+"""
+
+import io
+import os
+import sys
+import time
+import tracemalloc
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes, stream_osu_file
+from tau.convertor import convert_osu_beatmap, create_tau_beatmap, iter_convert
+from tau.difficulty.difficultyCalculator import TauDifficultyCalculator
+from corpus import generate_osu
+
+
+def full(data):
+    return TauDifficultyCalculator(convert_osu_beatmap(parse_osu_bytes(data), curve_cache=None)).calculate()
+
+
+def streamed(data):
+    for osu_beatmap in stream_osu_file(io.BytesIO(data)):
+        return TauDifficultyCalculator(create_tau_beatmap(osu_beatmap)).calculate_iter(iter_convert(osu_beatmap, curve_cache=None))
+
+
+def measure(fn, data):
+    """(结果, 耗时, 峰值内存)；耗时单独测量，不受 tracemalloc 开销影响"""
+    start = time.perf_counter()
+    result = fn(data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    object_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    data = generate_osu(object_count, seed=1).encode("utf-8")
+    print(f"1 beatmap, {object_count} objects, {len(data) / 1024:.0f} KiB")
+
+    results = {}
+    for name, fn in (("full lists", full), ("streaming", streamed)):
+        result, elapsed, peak = measure(fn, data)
+        results[name] = result
+        print(f"  {name:<12} {elapsed * 1000:9.1f} ms  peak {peak / 1024 / 1024:7.1f} MiB (traced)")
+    same = vars(results["full lists"]) == vars(results["streaming"])
+    print(f"  identical attributes: {same}")
+
+
+if __name__ == "__main__":
+    main()
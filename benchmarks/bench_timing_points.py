@@ -0,0 +1,56 @@
+"""
+any.osu_parser 时间点模型对比：Decimal TimePoint vs FloatTimePoint
+
+谱面含大量绿线时，对比解析耗时以及一个典型消费方（按物件时间查找当前时间点并取
+float(beat_length)，与转换器中的写法相同）的耗时。
+
+运行：python benchmarks/bench_timing_points.py [谱面数量] [每张物件数] [绿线数量]
+"""
+
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from any.osu_parser import parse_osu_bytes
+from bench_osu_parser import bench
+from corpus import generate_corpus
+
+
+def consume(beatmap):
+    """按物件时间推进时间点游标，累加每个物件所在时间点的 beat length"""
+    timing_points = beatmap.timing_points
+    index = 0
+    total = 0.0
+    for obj in beatmap.hit_objects:
+        while index + 1 < len(timing_points) and timing_points[index + 1].start_time <= obj.time:
+            index += 1
+        total += abs(float(timing_points[index].beat_length))
+    return total
+
+
+def main():
+    map_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    green_lines = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    corpus = generate_corpus(map_count, object_count, green_lines=green_lines, storyboard_lines=0)
+    print(f"corpus: {map_count} maps x {object_count} objects, {green_lines} green lines each")
+
+    print("parse:")
+    best = bench([
+        ("TimePoint (Decimal)", parse_osu_bytes),
+        ("FloatTimePoint", lambda d: parse_osu_bytes(d, float_timing=True)),
+    ], corpus)
+    print(f"  speedup: {best['TimePoint (Decimal)'] / best['FloatTimePoint']:.2f}x")
+
+    decimal_maps = [parse_osu_bytes(d) for d in corpus]
+    float_maps = [parse_osu_bytes(d, float_timing=True) for d in corpus]
+    print("consume:")
+    best = bench([
+        ("TimePoint (Decimal)", lambda i: consume(decimal_maps[i])),
+        ("FloatTimePoint", lambda i: consume(float_maps[i])),
+    ], range(map_count))
+    print(f"  speedup: {best['TimePoint (Decimal)'] / best['FloatTimePoint']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
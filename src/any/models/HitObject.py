@@ -18,7 +18,7 @@ class Slider(HitObject):
     tail_hitsound: int
     curves: Curve
     repeat_count: int
-    length: int
+    length: float
     # 滑条节点音效相关字段
     edge_hitsounds: List[int] = []
     edge_sets: List[str] = []
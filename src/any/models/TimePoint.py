@@ -9,4 +9,29 @@ class TimePoint:
     sample_index: int = 0
     volume: int = 0
     uninherited: bool
-    effects: int
\ No newline at end of file
+    effects: int
+
+class FloatTimePoint:
+    """
+    float 版本的时间点
+
+    字段与 TimePoint 相同，但 beat_length 直接存为 float，并使用 __slots__
+    减少内存占用。消费方原有的 float(tp.beat_length) 写法仍然适用。
+    """
+    __slots__ = ("start_time", "beat_length", "meter", "sample_set", "sample_index",
+                 "volume", "uninherited", "effects")
+
+    def __init__(self, start_time: int, beat_length: float, meter: int, sample_set: int = 0,
+                 sample_index: int = 0, volume: int = 100, uninherited: bool = True, effects: int = 0) -> None:
+        self.start_time = start_time
+        self.beat_length = beat_length
+        self.meter = meter
+        self.sample_set = sample_set
+        self.sample_index = sample_index
+        self.volume = volume
+        self.uninherited = uninherited
+        self.effects = effects
+
+    def __repr__(self):
+        return (f"FloatTimePoint(start_time={self.start_time}, beat_length={self.beat_length}, "
+                f"meter={self.meter}, uninherited={self.uninherited})")
@@ -1,10 +1,20 @@
 import re
 from decimal import Decimal
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from any.models.HitObject import HitObject, Circle, Slider, Spinner
-from any.models.TimePoint import TimePoint
+from any.models.TimePoint import TimePoint, FloatTimePoint
 from any.models.others import Pos, Curve, CurveType
 from any.parser import OsuBeatmap
+from common.sections import build_section_table
+from common.stream import Source, StreamedHitObjects, map_osu_source, split_concatenated
+
+# 曲线类型字符 -> CurveType，未知类型按线性处理
+_CURVE_TYPES = {
+    'B': CurveType.Bezier,
+    'C': CurveType.Catmull_rom,
+    'L': CurveType.linear,
+    'P': CurveType.perfrct,
+}
 
 
 class OsuFileParser:
@@ -13,7 +23,21 @@ class OsuFileParser:
     能够解析.osu文件内容并返回OsuBeatmap结构
     """
 
-    def __init__(self):
+    # 章节分派表（章节名 -> 整段解析方法名）：parse_bytes 只解析这里列出的章节，其余章节整段跳过。
+    # 存方法名而非绑定方法，避免解析器实例与自身形成引用环、只能等循环 GC 回收
+    _SECTION_PARSERS: Dict[str, str] = {
+        "difficulty": "_parse_difficulty_block",
+        "timingpoints": "_parse_timing_point_block",
+        "hitobjects": "_parse_hit_object_block",
+    }
+
+    def __init__(self, float_timing: bool = False):
+        """
+        Args:
+            float_timing: 为 True 时时间点使用 FloatTimePoint（beat_length 为 float），
+                          否则使用 TimePoint（beat_length 为 Decimal）
+        """
+        self.float_timing = float_timing
         self.beatmap = OsuBeatmap()
         self.beatmap.timing_points = []
         self.beatmap.hit_objects = []
@@ -60,6 +84,169 @@ class OsuFileParser:
         
         return self.beatmap
 
+    def parse_bytes(self, data: Union[bytes, bytearray, memoryview]) -> OsuBeatmap:
+        """
+        解析.osu文件的原始字节（快速路径）
+
+        先通过章节偏移表直接定位 [Difficulty]、[TimingPoints] 与 [HitObjects]，
+        只对这些章节的内容解码，并按章节分派表整段交给对应的解析函数。
+        返回结果与 parse() 完全一致。
+
+        Args:
+            data: .osu文件的原始字节，可以是 bytes、bytearray、memoryview 或 mmap
+
+        Returns:
+            解析后的OsuBeatmap对象
+        """
+        section_parsers = self._SECTION_PARSERS
+        for name, start, end in build_section_table(data):
+            handler = section_parsers.get(name)
+            if handler is not None:
+                getattr(self, handler)(str(data[start:end], "utf-8", "replace"))
+
+        self._calculate_derived_properties()
+
+        return self.beatmap
+
+    def stream(self, data, start: int = 0, end: Optional[int] = None) -> OsuBeatmap:
+        """
+        流式解析缓冲区中的一张谱面
+
+        除 [HitObjects] 外的章节立即解析；hit_objects 为 StreamedHitObjects，
+        迭代时才按块从缓冲区解析物件。依赖全部物件的衍生属性（物件数量、播放时间）不计算。
+
+        Args:
+            data: 文件缓冲区（通常为 mmap）
+            start: 谱面起始偏移
+            end: 谱面结束偏移，默认到末尾
+
+        Returns:
+            解析后的OsuBeatmap对象
+        """
+        section_parsers = self._SECTION_PARSERS
+        hit_objects = []
+        for name, section_start, section_end in build_section_table(data, start, end):
+            if name == "hitobjects":
+                hit_objects = StreamedHitObjects(data, section_start, section_end, self._parse_hit_object_chunk)
+                continue
+            handler = section_parsers.get(name)
+            if handler is not None:
+                getattr(self, handler)(str(data[section_start:section_end], "utf-8", "replace"))
+
+        self._calculate_derived_properties()
+        self.beatmap.hit_objects = hit_objects
+
+        return self.beatmap
+
+    @staticmethod
+    def _parse_hit_object_chunk(text: str) -> List[HitObject]:
+        """解析一块[HitObjects]文本并返回物件列表（不影响当前谱面）"""
+        chunk_parser = OsuFileParser()
+        chunk_parser._parse_hit_object_block(text)
+        return chunk_parser.beatmap.hit_objects
+
+    def _parse_difficulty_block(self, text: str):
+        """整段解析[Difficulty]部分"""
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("//"):
+                self._parse_difficulty(line)
+
+    def _parse_timing_point_block(self, text: str):
+        """整段解析[TimingPoints]部分"""
+        if self.float_timing:
+            self._parse_float_timing_point_block(text)
+            return
+        for line in text.splitlines():
+            line = line.strip()
+            if line and not line.startswith("//"):
+                self._parse_timing_point(line)
+
+    def _parse_float_timing_point_block(self, text: str):
+        """整段解析[TimingPoints]部分，生成 FloatTimePoint"""
+        append = self.beatmap.timing_points.append
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("//"):
+                continue
+            parts = line.split(",")
+            if len(parts) >= 8:
+                append(FloatTimePoint(
+                    int(float(parts[0])),
+                    float(parts[1]),
+                    int(parts[2]),
+                    int(parts[3]) if parts[3] else 0,
+                    int(parts[4]) if parts[4] else 0,
+                    int(parts[5]) if parts[5] else 100,
+                    int(parts[6]) == 1,
+                    int(parts[7]) if parts[7] else 0,
+                ))
+
+    def _parse_hit_object_block(self, text: str):
+        """
+        整段解析[HitObjects]部分
+
+        与逐行调用 _parse_hit_object 的结果相同，但把循环内用到的类、方法和计数器
+        提到局部变量中，并直接用 Pos(x, y) 构造坐标。
+        """
+        beatmap = self.beatmap
+        append = beatmap.hit_objects.append
+        parse_slider_data = self._parse_slider_data
+        ncircles = nsliders = nspinners = total_hits = 0
+
+        for line in text.splitlines():
+            line = line.strip()
+            if not line or line.startswith("//"):
+                continue
+            parts = line.split(",")
+            part_count = len(parts)
+            if part_count < 5:
+                continue
+            x = int(parts[0])
+            y = int(parts[1])
+            time = int(parts[2])
+            obj_type = int(parts[3])
+            hitsound = int(parts[4])
+
+            if obj_type & 1:  # Circle
+                hit_object = Circle()
+                ncircles += 1
+                hit_object.hit_sample = parts[5] if part_count > 5 else ""
+            elif obj_type & 2:  # Slider
+                hit_object = Slider()
+                nsliders += 1
+                hit_object.edge_hitsounds = []
+                hit_object.edge_sets = []
+                parse_slider_data(hit_object, parts, x, y)
+                if part_count > 8 and parts[8]:
+                    try:
+                        hit_object.edge_hitsounds = [int(v) for v in parts[8].split("|") if v]
+                    except ValueError:
+                        hit_object.edge_hitsounds = []
+                if part_count > 9 and parts[9]:
+                    hit_object.edge_sets = [v for v in parts[9].split("|") if v]
+                hit_object.hit_sample = parts[10] if part_count > 10 else ""
+            elif obj_type & 8:  # Spinner
+                hit_object = Spinner()
+                nspinners += 1
+                if part_count > 5:
+                    hit_object.end_time = int(parts[5])
+                hit_object.hit_sample = parts[6] if part_count > 6 else ""
+            else:
+                continue
+
+            hit_object.pos = Pos(x, y)
+            hit_object.time = time
+            hit_object.hitsound = hitsound
+            hit_object.is_newcombo = bool(obj_type & 4)
+            append(hit_object)
+            total_hits += 1
+
+        beatmap.ncircles += ncircles
+        beatmap.nsliders += nsliders
+        beatmap.nspinners += nspinners
+        beatmap.total_hits += total_hits
+
     def _parse_general(self, line: str):
         """解析[General]部分"""
         if ":" in line:
@@ -100,6 +287,10 @@ class OsuFileParser:
 
     def _parse_timing_point(self, line: str):
         """解析[TimingPoints]部分"""
+        if self.float_timing:
+            # 块解析函数对单行文本同样适用
+            self._parse_float_timing_point_block(line)
+            return
         parts = line.split(",")
         if len(parts) >= 8:
             timing_point = TimePoint()
@@ -147,8 +338,7 @@ class OsuFileParser:
                 hit_object.edge_sets = []
                 
                 # 解析滑条特定数据
-                if len(parts) > 5:
-                    self._parse_slider_data(hit_object, parts[5], x, y)
+                self._parse_slider_data(hit_object, parts, x, y)
                     
                 # 解析滑条边缘音效
                 if len(parts) > 8 and parts[8]:
@@ -181,76 +371,55 @@ class OsuFileParser:
                 # Hit sample在不同对象类型中位置不同
                 if (obj_type & 1) and len(parts) > 5:  # Circle
                     hit_object.hit_sample = parts[5]
-                elif (obj_type & 2) and len(parts) > 7:  # Slider
-                    # Slider的hitSample通常在最后
-                    hit_object.hit_sample = parts[-1]
+                elif (obj_type & 2) and len(parts) > 10:  # Slider
+                    # Slider的hitSample在edgeSets之后
+                    hit_object.hit_sample = parts[10]
                 elif (obj_type & 8) and len(parts) > 6:  # Spinner
                     hit_object.hit_sample = parts[6]
                 
                 self.beatmap.hit_objects.append(hit_object)
                 self.beatmap.total_hits += 1
 
-    def _parse_slider_data(self, slider: Slider, data: str, start_x: int, start_y: int):
-        """解析滑条数据"""
-        # 滑条数据格式: 曲线类型|控制点1|控制点2|...|重复次数|像素长度
-        slider_parts = data.split("|")
-        if len(slider_parts) >= 3:
-            # 创建曲线对象
-            curve = Curve()
-            
-            # 获取曲线类型
-            curve_type_char = slider_parts[0][0] if slider_parts[0] else 'L'
-            if curve_type_char == 'B':
-                curve.type = CurveType.Bezier
-            elif curve_type_char == 'C':
-                curve.type = CurveType.Catmull_rom
-            elif curve_type_char == 'L':
-                curve.type = CurveType.linear
-            elif curve_type_char == 'P':
-                curve.type = CurveType.perfrct
-            else:
-                curve.type = CurveType.linear  # 默认线性
-            
-            # 解析控制点
-            curve.control_points = []
-            
-            # 添加起始点
-            start_point = Pos()
-            start_point.x = start_x
-            start_point.y = start_y
-            curve.control_points.append(start_point)
-            
-            # 查找重复次数和长度的位置（它们是最后两个参数）
-            if len(slider_parts) >= 3:
-                repeat_count = slider_parts[-2]  # 倒数第二个是重复次数
-                length = slider_parts[-1]        # 最后一个是长度
-                
-                # 控制点是中间的参数
-                # 我们需要找到控制点部分（排除第一个和最后两个）
-                control_points_data = slider_parts[1:-2] if len(slider_parts) > 3 else []
-                
-                # 添加其他控制点
-                for point_str in control_points_data:
-                    if point_str and ":" in point_str:
-                        px, py = point_str.split(":")
-                        point = Pos()
-                        point.x = int(px)
-                        point.y = int(py)
-                        curve.control_points.append(point)
-                
-                slider.curves = curve
-                
-                # 解析重复次数
-                try:
-                    slider.repeat_count = int(repeat_count) if repeat_count else 1
-                except ValueError:
-                    slider.repeat_count = 1
-                    
-                # 解析像素长度
+    def _parse_slider_data(self, slider: Slider, parts: List[str], start_x: int, start_y: int):
+        """
+        解析滑条数据
+
+        物件行格式: x,y,time,type,hitSound,曲线类型|控制点1|控制点2|...,重复次数,像素长度,...
+        曲线定义在 parts[5]，重复次数与像素长度分别是 parts[6] 与 parts[7]。
+        缺少的字段取默认值（线性曲线、仅起始点、重复 1 次、长度 0），curves / repeat_count / length 总会被设置。
+        """
+        slider_parts = parts[5].split("|") if len(parts) > 5 else [""]
+
+        # 创建曲线对象
+        curve = Curve()
+
+        # 获取曲线类型（未知类型默认线性）
+        curve_type_char = slider_parts[0][0] if slider_parts[0] else 'L'
+        curve.type = _CURVE_TYPES.get(curve_type_char, CurveType.linear)
+
+        # 解析控制点，先添加起始点，格式不正确的控制点跳过
+        curve.control_points = [Pos(start_x, start_y)]
+        for point_str in slider_parts[1:]:
+            if ":" in point_str:
+                px, py = point_str.split(":", 1)
                 try:
-                    slider.length = int(float(length)) if length else 0
+                    curve.control_points.append(Pos(int(px), int(py)))
                 except ValueError:
-                    slider.length = 0
+                    continue
+
+        slider.curves = curve
+
+        # 解析重复次数
+        try:
+            slider.repeat_count = int(parts[6]) if len(parts) > 6 and parts[6] else 1
+        except ValueError:
+            slider.repeat_count = 1
+
+        # 解析像素长度
+        try:
+            slider.length = float(parts[7]) if len(parts) > 7 and parts[7] else 0
+        except ValueError:
+            slider.length = 0
 
     def _calculate_derived_properties(self):
         """计算衍生属性"""
@@ -274,15 +443,64 @@ class OsuFileParser:
                 pass
 
 
-def parse_osu_file(osu_file_content: str) -> OsuBeatmap:
+def parse_osu_file(osu_file_content: str, float_timing: bool = False) -> OsuBeatmap:
     """
     解析.osu文件内容并返回OsuBeatmap结构
     
     Args:
         osu_file_content: .osu文件的字符串内容
+        float_timing: 是否生成 FloatTimePoint 时间点
         
     Returns:
         解析后的OsuBeatmap对象
     """
-    parser = OsuFileParser()
-    return parser.parse(osu_file_content)
\ No newline at end of file
+    parser = OsuFileParser(float_timing)
+    return parser.parse(osu_file_content)
+
+
+def parse_osu_bytes(data: Union[bytes, bytearray, memoryview], float_timing: bool = False) -> OsuBeatmap:
+    """
+    解析.osu文件的原始字节并返回OsuBeatmap结构（章节偏移表快速路径）
+
+    Args:
+        data: .osu文件的原始字节
+        float_timing: 是否生成 FloatTimePoint 时间点
+
+    Returns:
+        解析后的OsuBeatmap对象
+    """
+    parser = OsuFileParser(float_timing)
+    return parser.parse_bytes(data)
+
+
+def stream_osu_file(source: Source, float_timing: bool = False) -> Iterator[OsuBeatmap]:
+    """
+    以内存映射方式流式读取.osu文件，支持多张谱面首尾相接的合集文件
+
+    每张谱面的 hit_objects 在迭代时才按块解析；生成器结束后文件关闭，
+    此后不能再迭代之前产出谱面的 hit_objects。
+
+    Args:
+        source: 文件路径或二进制文件对象
+        float_timing: 是否生成 FloatTimePoint 时间点
+
+    Yields:
+        每张谱面的OsuBeatmap对象
+    """
+    with map_osu_source(source) as buf:
+        for start, end in split_concatenated(buf):
+            yield OsuFileParser(float_timing).stream(buf, start, end)
+
+
+def iter_hit_objects(source: Source) -> Iterator[HitObject]:
+    """
+    以内存映射方式逐个产出文件中所有谱面的物件
+
+    Args:
+        source: 文件路径或二进制文件对象
+
+    Yields:
+        物件（Circle / Slider / Spinner）
+    """
+    for beatmap in stream_osu_file(source):
+        yield from beatmap.hit_objects
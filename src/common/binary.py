@@ -0,0 +1,85 @@
+"""紧凑二进制容器格式
+
+解析缓存、转换后的谱面等序列化格式共用的外层结构：
+
+    魔数(4B) | 版本(u16) | 字节序(u8) | 头部长度(u32) | 头部 JSON(UTF-8)
+    之后按固定顺序为每个列：typecode(1B) | 元素个数(u32) | array 原始字节
+
+标量与字典等少量数据放在 JSON 头部，大量数值数据以 array 原样写出，
+读取时直接 frombytes，不逐个构造 Python 对象；写入端与读取端字节序不同时自动 byteswap。
+"""
+from __future__ import annotations
+import json
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+_HEADER = struct.Struct("<4sHBI")
+_COLUMN_HEADER = struct.Struct("<cI")
+_BYTE_ORDER = {"little": 0, "big": 1}
+
+
+def pack(magic: bytes, version: int, header: Dict[str, Any], columns: Sequence[array]) -> bytes:
+    """
+    打包为二进制
+
+    Args:
+        magic: 4 字节魔数，区分不同格式
+        version: 格式版本
+        header: 可 JSON 序列化的头部数据
+        columns: 各列 array，读取时按相同顺序返回
+
+    Returns:
+        二进制数据
+    """
+    header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    parts = [_HEADER.pack(magic, version, _BYTE_ORDER[sys.byteorder], len(header_bytes)), header_bytes]
+    for col in columns:
+        parts.append(_COLUMN_HEADER.pack(col.typecode.encode("ascii"), len(col)))
+        parts.append(col.tobytes())
+    return b"".join(parts)
+
+
+def unpack(data: bytes, magic: bytes, version: int, column_count: int) -> Tuple[Dict[str, Any], List[array]]:
+    """
+    解包 pack() 的输出
+
+    Args:
+        data: 二进制数据
+        magic: 期望的魔数
+        version: 期望的格式版本
+        column_count: 期望的列数
+
+    Returns:
+        (头部数据, 列 array 列表)
+
+    Raises:
+        ValueError: 魔数或版本不匹配、数据被截断或损坏
+    """
+    view = memoryview(data)
+    try:
+        found_magic, found_version, byte_order, header_len = _HEADER.unpack_from(view, 0)
+        if found_magic != magic or found_version != version:
+            raise ValueError(f"unsupported format (magic={found_magic!r}, version={found_version})")
+        offset = _HEADER.size
+        header = json.loads(bytes(view[offset:offset + header_len]))
+        offset += header_len
+
+        swap = byte_order != _BYTE_ORDER[sys.byteorder]
+        columns = []
+        for _ in range(column_count):
+            typecode, count = _COLUMN_HEADER.unpack_from(view, offset)
+            offset += _COLUMN_HEADER.size
+            col = array(typecode.decode("ascii"))
+            size = col.itemsize * count
+            if offset + size > len(view):
+                raise ValueError("truncated data")
+            col.frombytes(view[offset:offset + size])
+            if swap:
+                col.byteswap()
+            offset += size
+            columns.append(col)
+    except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError(f"corrupt data: {e}") from e
+    return header, columns
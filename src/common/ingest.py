@@ -0,0 +1,218 @@
+"""统一的谱面读入层
+
+Tau 转换使用 any 模型（any.parser.OsuBeatmap），Sentakki 转换使用 osu_std 模型
+（osu_std.parser.OsuBeatmap）。同时计算两个模式时，原本每个文件要解析两次。
+
+这里以一次 osu_std 列式解析（OsuFileParser(columnar=True, lazy=True).parse_bytes）的结果
+作为两个模式共用的规范表示 CanonicalBeatmap：
+- for_sentakki(): 直接返回规范表示中的 osu_std 谱面
+- for_tau(): 基于同一份列式数据构造 any 模型谱面，物件在首次访问时生成并缓存
+
+这一层的作用是让两个模式（以及 common.parse_cache）共用同一份解析结果，而不是加快读入：
+文件只分节、拆分字段一次，但 Tau 转换仍要访问全部 any 模型物件，构造它们的成本与
+any 解析器本身相当，端到端与分别解析两次相差不大（见 benchmarks/bench_ingest.py）。
+
+用法：
+    canonical = ingest(data)
+    tau_beatmap = convert_osu_beatmap(canonical.for_tau())
+    sentakki_beatmap = SentakkiConverter(canonical.for_sentakki()).convert()
+"""
+from __future__ import annotations
+from array import array
+from collections.abc import Sequence
+from typing import List, Optional, Union
+
+from any.models.HitObject import HitObject, Circle, Slider, Spinner
+from any.models.TimePoint import FloatTimePoint
+from any.models.others import Pos, Curve, CurveType
+from any.osu_parser import _CURVE_TYPES
+from any.parser import OsuBeatmap as AnyOsuBeatmap
+from osu_std.columnar import HitObjectColumns
+from osu_std.parser import OsuBeatmap as StdOsuBeatmap, OsuFileParser as StdOsuFileParser
+
+# any 模型的难度字段 <- .osu [Difficulty] 键（小写）
+_ANY_DIFFICULTY_FIELDS = {
+    'circlesize': 'cs',
+    'approachrate': 'ar',
+    'overalldifficulty': 'od',
+    'hpdrainrate': 'hp',
+    'slidermultiplier': 'slider_multiplier',
+    'slidertickrate': 'slider_tick_rate',
+}
+
+
+class AnyHitObjectView(Sequence):
+    """
+    把 HitObjectColumns 呈现为 any 模型物件（Circle / Slider / Spinner）序列
+
+    与 any.osu_parser 一样，类型位中不含圆、滑条、转盘的行被跳过。
+    物件在第一次下标访问 / 迭代到时才构造，之后缓存，再次访问返回同一个对象（与列表一致）。
+    """
+
+    def __init__(self, columns: HitObjectColumns):
+        self.columns = columns
+        types = columns.type
+        self.rows = array('i', (i for i in range(len(types)) if types[i] & 0b1011))
+        self._objects: List[Optional[HitObject]] = [None] * len(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self.rows)))]
+        if index < 0:
+            index += len(self.rows)
+        if not 0 <= index < len(self.rows):
+            raise IndexError(index)
+        return self._get(index)
+
+    def __iter__(self):
+        objects = self._objects
+        build = self._build
+        rows = self.rows
+        for i, hit_object in enumerate(objects):
+            if hit_object is None:
+                hit_object = objects[i] = build(rows[i])
+            yield hit_object
+
+    def _get(self, index: int) -> HitObject:
+        hit_object = self._objects[index]
+        if hit_object is None:
+            hit_object = self._objects[index] = self._build(self.rows[index])
+        return hit_object
+
+    def _build(self, row: int):
+        c = self.columns
+        x = c.x[row]
+        y = c.y[row]
+        obj_type = c.type[row]
+        sample = c.sample[row]
+        hit_sample = c.strings[sample] if sample >= 0 else ""
+
+        if obj_type & 1:
+            hit_object = Circle()
+            hit_object.hit_sample = hit_sample
+        elif obj_type & 2:
+            hit_object = Slider()
+            edge_sets = c.edge_sets[row]
+            hit_object.edge_hitsounds = c.edge_sounds[c.edge_offsets[row]:c.edge_offsets[row + 1]].tolist()
+            hit_object.edge_sets = [v for v in c.strings[edge_sets].split('|') if v] if edge_sets >= 0 else []
+            # 与 any.osu_parser 相同，字段不足的滑条也设置 curves / repeat_count / length（缺省为线性、仅起始点）
+            curve_type = c.curve_type[row]
+            type_str = c.strings[curve_type] if curve_type >= 0 else ''
+            curve = Curve()
+            curve.type = _CURVE_TYPES.get(type_str[0] if type_str else 'L', CurveType.linear)
+            flat = c.points[2 * c.point_offsets[row]:2 * c.point_offsets[row + 1]]
+            curve.control_points = [Pos(x, y)]
+            curve.control_points.extend(Pos(flat[k], flat[k + 1]) for k in range(0, len(flat), 2))
+            hit_object.curves = curve
+            hit_object.repeat_count = c.repeat[row]
+            hit_object.length = c.pixel_length[row]
+            hit_object.hit_sample = hit_sample
+        else:
+            hit_object = Spinner()
+            hit_object.end_time = c.end_time[row]
+            hit_object.hit_sample = hit_sample
+
+        hit_object.pos = Pos(x, y)
+        hit_object.time = c.time[row]
+        hit_object.hitsound = c.hit_sound[row]
+        hit_object.is_newcombo = bool(obj_type & 4)
+        return hit_object
+
+
+def std_to_any(std: StdOsuBeatmap) -> AnyOsuBeatmap:
+    """
+    由列式 osu_std 谱面构造 any 模型谱面（Tau 转换使用）
+
+    时间点转换为 FloatTimePoint，物件通过 AnyHitObjectView 按需生成；
+    衍生属性（物件计数、播放时间、BPM）直接由列数据计算，规则与 any.osu_parser 相同。
+
+    Args:
+        std: hit_objects 为 HitObjectColumns 的 osu_std 谱面
+
+    Returns:
+        any.parser.OsuBeatmap
+    """
+    beatmap = AnyOsuBeatmap()
+    for key, value in std.difficulty.items():
+        field = _ANY_DIFFICULTY_FIELDS.get(key.lower())
+        if field is not None:
+            try:
+                setattr(beatmap, field, float(value))
+            except (TypeError, ValueError):
+                pass
+
+    beatmap.timing_points = [
+        FloatTimePoint(int(tp.time), tp.beat_length, tp.meter, tp.sample_set, tp.sample_index,
+                       tp.volume, tp.uninherited, tp.effects)
+        for tp in std.timing_points
+    ]
+
+    columns = std.hit_objects
+    view = AnyHitObjectView(columns)
+    beatmap.hit_objects = view
+
+    ncircles = nsliders = nspinners = 0
+    types = columns.type
+    for row in view.rows:
+        obj_type = types[row]
+        if obj_type & 1:
+            ncircles += 1
+        elif obj_type & 2:
+            nsliders += 1
+        else:
+            nspinners += 1
+    beatmap.ncircles = ncircles
+    beatmap.nsliders = nsliders
+    beatmap.nspinners = nspinners
+    beatmap.total_hits = len(view)
+
+    if len(view):
+        beatmap.play_time = (columns.time[view.rows[-1]] - columns.time[view.rows[0]]) / 1000.0
+        beatmap.drain_time = beatmap.play_time
+    for tp in beatmap.timing_points:
+        if tp.uninherited and tp.beat_length > 0:
+            beatmap.bpm = int(60000 / tp.beat_length)
+            break
+    return beatmap
+
+
+class CanonicalBeatmap:
+    """
+    谱面的规范表示：一次解析，多个模式共用
+
+    Attributes:
+        std: 列式 osu_std 谱面（hit_objects 为 HitObjectColumns）
+    """
+    __slots__ = ('std', '_any')
+
+    def __init__(self, std: StdOsuBeatmap):
+        self.std = std
+        self._any: Optional[AnyOsuBeatmap] = None
+
+    def for_sentakki(self) -> StdOsuBeatmap:
+        """供 SentakkiConverter 使用的 osu_std 谱面"""
+        return self.std
+
+    def for_tau(self) -> AnyOsuBeatmap:
+        """供 tau.convertor.convert_osu_beatmap 使用的 any 模型谱面（首次调用时构造并缓存）"""
+        if self._any is None:
+            self._any = std_to_any(self.std)
+        return self._any
+
+
+def ingest(data: Union[str, bytes, bytearray, memoryview]) -> CanonicalBeatmap:
+    """
+    解析一次 .osu 内容，得到各模式共用的规范表示
+
+    Args:
+        data: .osu 文件内容（str 或原始字节）
+
+    Returns:
+        CanonicalBeatmap
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return CanonicalBeatmap(StdOsuFileParser(columnar=True, lazy=True).parse_bytes(data))
@@ -0,0 +1,265 @@
+"""按内容哈希缓存的谱面解析结果
+
+同一张谱面会因每个成绩、每种 mod 组合被反复计算，每次都重新解析 .osu 文本。
+ParseCache 以文件字节的 MD5（与 osu! 的谱面校验和一致）为键缓存 common.ingest 的
+规范表示 CanonicalBeatmap：
+- 进程内 LRU 层：最多保留 max_entries 个
+- 可选磁盘层：cache_dir 下每个谱面一个紧凑二进制文件（列式数据原样写出），
+  读取比重新解析文本快一个数量级；总大小超过 max_disk_bytes 时按最近使用时间淘汰
+
+缓存返回的谱面对象在调用方之间共享，应视为只读。
+
+用法：
+    cache = ParseCache(cache_dir="/var/cache/gu-pp")
+    canonical = cache.get(data)
+    tau_input = canonical.for_tau()
+    sentakki_input = canonical.for_sentakki()
+"""
+from __future__ import annotations
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Dict, Optional, Union
+
+from osu_std.columnar import COLUMN_NAMES, HitObjectColumns
+from osu_std.parser import OsuBeatmap as StdOsuBeatmap, TimingPoint
+from . import binary
+from .ingest import CanonicalBeatmap, ingest
+
+# 磁盘层条目格式（common.binary 容器）
+_MAGIC = b"GUPC"
+_FORMAT_VERSION = 1
+
+
+def dump_canonical(canonical: CanonicalBeatmap) -> bytes:
+    """
+    把规范表示序列化为紧凑二进制
+
+    Args:
+        canonical: hit_objects 为 HitObjectColumns 的规范表示
+
+    Returns:
+        二进制数据
+    """
+    std = canonical.std
+    columns: HitObjectColumns = std.hit_objects
+    header = {
+        "format_version": std.format_version,
+        "general": std.general,
+        "metadata": std.metadata,
+        "difficulty": std.difficulty,
+        "editor": std.editor,
+        "timing_points": [[tp.time, tp.beat_length, tp.meter, tp.sample_set, tp.sample_index,
+                           tp.volume, tp.uninherited, tp.effects] for tp in std.timing_points],
+        "strings": columns.strings,
+        "lazy": columns.lazy,
+    }
+    return binary.pack(_MAGIC, _FORMAT_VERSION, header, [getattr(columns, name) for name in COLUMN_NAMES])
+
+
+def load_canonical(data: bytes) -> CanonicalBeatmap:
+    """
+    从 dump_canonical 的输出恢复规范表示
+
+    Args:
+        data: 二进制数据
+
+    Returns:
+        CanonicalBeatmap
+
+    Raises:
+        ValueError: 魔数或版本不匹配、数据被截断
+    """
+    header, arrays = binary.unpack(data, _MAGIC, _FORMAT_VERSION, len(COLUMN_NAMES))
+    columns = HitObjectColumns(header["lazy"])
+    for name, col in zip(COLUMN_NAMES, arrays):
+        setattr(columns, name, col)
+    columns.set_strings(header["strings"])
+
+    std = StdOsuBeatmap(
+        format_version=header["format_version"],
+        general=header["general"],
+        metadata=header["metadata"],
+        difficulty=header["difficulty"],
+        editor=header["editor"],
+        timing_points=[TimingPoint(*fields) for fields in header["timing_points"]],
+        hit_objects=columns,
+    )
+    return CanonicalBeatmap(std)
+
+
+@dataclass
+class ParseCacheStats:
+    """缓存统计"""
+    hits: int = 0             # 进程内 LRU 命中
+    disk_hits: int = 0        # 磁盘层命中
+    misses: int = 0           # 两层都未命中，重新解析
+    evictions: int = 0        # LRU 淘汰次数
+    disk_writes: int = 0
+    disk_evictions: int = 0
+    entries: int = 0          # 当前 LRU 条目数
+    disk_bytes: int = 0       # 当前磁盘层总字节数
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class ParseCache:
+    """
+    内容寻址的谱面解析缓存（线程安全）
+
+    Args:
+        max_entries: 进程内 LRU 最多保留的谱面数
+        cache_dir: 磁盘层目录，None 表示不启用
+        max_disk_bytes: 磁盘层总大小上限（字节）
+    """
+
+    def __init__(self, max_entries: int = 128, cache_dir: Optional[Union[str, os.PathLike]] = None,
+                 max_disk_bytes: int = 512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.cache_dir = os.fspath(cache_dir) if cache_dir is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.stats = ParseCacheStats()
+        self._entries: "OrderedDict[str, CanonicalBeatmap]" = OrderedDict()
+        self._lock = threading.Lock()
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.stats.disk_bytes = sum(size for _, size, _ in self._disk_entries())
+
+    @staticmethod
+    def key_for(data: bytes) -> str:
+        """缓存键：文件字节的 MD5 十六进制串"""
+        return hashlib.md5(data).hexdigest()
+
+    def get(self, data: Union[str, bytes, bytearray, memoryview]) -> CanonicalBeatmap:
+        """
+        获取谱面的规范表示，未命中时解析并写入缓存
+
+        Args:
+            data: .osu 文件内容（str 或原始字节）
+
+        Returns:
+            CanonicalBeatmap
+        """
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        key = self.key_for(data)
+
+        with self._lock:
+            canonical = self._entries.get(key)
+            if canonical is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return canonical
+
+        canonical = self._load_from_disk(key)
+        if canonical is not None:
+            with self._lock:
+                self.stats.disk_hits += 1
+        else:
+            canonical = ingest(data)
+            with self._lock:
+                self.stats.misses += 1
+            self._store_to_disk(key, canonical)
+
+        with self._lock:
+            self._entries[key] = canonical
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+            self.stats.entries = len(self._entries)
+        return canonical
+
+    def clear(self, disk: bool = False):
+        """清空进程内缓存；disk=True 时同时删除磁盘层文件"""
+        with self._lock:
+            self._entries.clear()
+            self.stats.entries = 0
+            if disk and self.cache_dir is not None:
+                for path, _, _ in self._disk_entries():
+                    self._remove(path)
+                self.stats.disk_bytes = 0
+
+    # ---- 磁盘层 ----
+    def _path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".bin")
+
+    def _disk_entries(self):
+        """(路径, 大小, 最近使用时间) 列表"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".bin"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _load_from_disk(self, key: str) -> Optional[CanonicalBeatmap]:
+        if self.cache_dir is None:
+            return None
+        path = self._path_for(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            canonical = load_canonical(data)
+        except (ValueError, KeyError, TypeError):
+            # 损坏或旧版本的条目：删除后按未命中处理
+            with self._lock:
+                self._remove(path)
+                self.stats.disk_bytes = max(0, self.stats.disk_bytes - len(data))
+            return None
+        try:
+            os.utime(path)  # 更新最近使用时间，供淘汰排序
+        except OSError:
+            pass
+        return canonical
+
+    def _store_to_disk(self, key: str, canonical: CanonicalBeatmap):
+        if self.cache_dir is None:
+            return
+        data = dump_canonical(canonical)
+        if len(data) > self.max_disk_bytes:
+            return
+        path = self._path_for(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            self._remove(tmp_path)
+            return
+        with self._lock:
+            self.stats.disk_writes += 1
+            self.stats.disk_bytes += len(data)
+            if self.stats.disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        """按最近使用时间从旧到新删除文件，直到总大小回到上限以内"""
+        entries = sorted(self._disk_entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_disk_bytes:
+                break
+            self._remove(path)
+            total -= size
+            self.stats.disk_evictions += 1
+        self.stats.disk_bytes = total
@@ -0,0 +1,48 @@
+""".osu 文件章节偏移表
+
+各解析器的 bytes 快速路径共用：一次扫描定位所有 [Section]，
+之后只解码、解析需要的章节。
+"""
+import re
+from typing import List, Optional, Tuple, Union
+
+# "[" 到行尾；re 直接在缓冲区上查找，memoryview / mmap 不需要先复制成 bytes
+_BRACKET_RE = re.compile(rb"\[[^\n]*")
+_BLANK = b" \t\r\x0b\x0c"
+
+
+def build_section_table(data: Union[bytes, bytearray, memoryview], start: int = 0,
+                        end: Optional[int] = None) -> List[Tuple[str, int, int]]:
+    """
+    预先扫描一次文件内容，生成章节偏移表
+
+    章节标题行的判定与 any.osu_parser.OsuFileParser.parse() 一致：去掉首尾空白后以 "[" 开头的行。
+    扫描只在 "[" 出现的位置做检查，不逐行处理，也不复制输入。
+
+    Args:
+        data: .osu文件的原始字节（bytes / bytearray / memoryview / mmap 均可）
+        start: 扫描起始偏移（用于合并包中的单张谱面）
+        end: 扫描结束偏移，默认到末尾
+
+    Returns:
+        按文件顺序排列的 (小写章节名, 内容起始偏移, 内容结束偏移) 列表，偏移相对于 data 开头
+    """
+    if end is None:
+        end = len(data)
+    table: List[Tuple[str, int, int]] = []
+    name = None
+    body_start = start
+    for match in _BRACKET_RE.finditer(data, start, end):
+        # "[" 之前到行首只能是空白
+        line_start = match.start()
+        while line_start > start and data[line_start - 1] in _BLANK:
+            line_start -= 1
+        if line_start > start and data[line_start - 1] != 0x0A:
+            continue
+        if name is not None:
+            table.append((name, body_start, line_start))
+        name = match.group().strip().strip(b"[]").decode("utf-8", "replace").lower()
+        body_start = match.end()
+    if name is not None:
+        table.append((name, body_start, end))
+    return table
@@ -0,0 +1,123 @@
+"""内存映射的流式读取
+
+超长谱面或把多张 .osu 首尾相接拼在一起的合集文件，如果整体解码成 str 再 splitlines()，
+完整文本与全部行字符串会同时驻留内存。这里的工具把文件 mmap 后：
+- 按 "osu file format v" 行把合集拆成各张谱面的字节区间
+- 按固定大小、在换行处对齐的块解码 [HitObjects]，逐块解析并通过生成器逐个产出物件
+
+各解析器的 stream_* 入口（any.osu_parser.stream_osu_file、osu_std.parser.stream_osu）
+基于这些工具实现。
+"""
+from __future__ import annotations
+import mmap
+import os
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Tuple, Union
+
+# 每次解码的 [HitObjects] 字节数（约数千个物件）
+DEFAULT_BLOCK_SIZE = 1 << 18
+
+_FORMAT_HEADER = b"osu file format v"
+
+Source = Union[str, bytes, os.PathLike, BinaryIO]
+
+
+@contextmanager
+def map_osu_source(source: Source):
+    """
+    以只读 mmap 打开 .osu 文件
+
+    Args:
+        source: 文件路径，或以二进制模式打开的文件对象；
+                不支持 fileno() 的文件对象（如 BytesIO）与空文件退化为一次性读入的 bytes
+
+    Yields:
+        支持 find / rfind / 切片的缓冲区（mmap 或 bytes）
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, "rb") as f:
+            with map_osu_source(f) as buf:
+                yield buf
+        return
+
+    try:
+        fileno = source.fileno()
+        buf = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # 无真实文件描述符或文件为空
+        yield source.read()
+        return
+    try:
+        yield buf
+    finally:
+        buf.close()
+
+
+def split_concatenated(buf: Any) -> List[Tuple[int, int]]:
+    """
+    把合集文件按 "osu file format v" 行拆分为各张谱面的字节区间
+
+    Args:
+        buf: 文件缓冲区
+
+    Returns:
+        (起始偏移, 结束偏移) 列表；没有格式行时整个缓冲区视为一张谱面
+    """
+    size = len(buf)
+    starts = []
+    pos = buf.find(_FORMAT_HEADER)
+    while pos != -1:
+        line_start = buf.rfind(b"\n", 0, pos) + 1
+        # 行首允许 UTF-8 BOM 与空白
+        if not buf[line_start:pos].lstrip(b"\xef\xbb\xbf").strip():
+            starts.append(line_start)
+        pos = buf.find(_FORMAT_HEADER, pos + len(_FORMAT_HEADER))
+    if not starts:
+        return [(0, size)] if size else []
+    starts[0] = 0
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def iter_text_blocks(buf: Any, start: int, end: int, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[str]:
+    """
+    按块解码缓冲区的一段，每块在换行处截断，保证不拆开任何一行
+
+    Args:
+        buf: 文件缓冲区
+        start: 起始偏移
+        end: 结束偏移
+        block_size: 每块的目标字节数
+
+    Yields:
+        解码后的文本块
+    """
+    while start < end:
+        stop = min(start + block_size, end)
+        if stop < end:
+            newline = buf.find(b"\n", stop, end)
+            stop = end if newline == -1 else newline + 1
+        yield str(buf[start:stop], "utf-8", "replace")
+        start = stop
+
+
+class StreamedHitObjects:
+    """
+    从映射缓冲区按块解析的物件序列
+
+    不保存解析结果，每次迭代都重新从缓冲区按块解析，可重复迭代；
+    同一时刻只有一个文本块及其解析出的物件驻留内存。
+    底层文件关闭（对应的 stream_* 生成器结束）后不能再迭代。
+    """
+
+    def __init__(self, buf: Any, start: int, end: int, parse_block: Callable[[str], Iterable[Any]],
+                 block_size: int = DEFAULT_BLOCK_SIZE):
+        self._buf = buf
+        self._start = start
+        self._end = end
+        self._parse_block = parse_block
+        self._block_size = block_size
+
+    def __iter__(self) -> Iterator[Any]:
+        parse_block = self._parse_block
+        for text in iter_text_blocks(self._buf, self._start, self._end, self._block_size):
+            yield from parse_block(text)
@@ -0,0 +1,113 @@
+"""共享的时间点索引
+
+对谱面的时间点只排序、整理一次，之后按时间查询当前红线（节拍长度）与
+当前滑条速度倍率都是 bisect 的 O(log n)，避免各转换器在每个物件上线性扫描
+或重新排序整张时间点列表。
+
+兼容本仓库中的几种时间点模型：
+- any.models.TimePoint / FloatTimePoint（start_time，beat_length 可为 Decimal）
+- osu_std.parser.TimingPoint（time）
+"""
+from __future__ import annotations
+from bisect import bisect_right
+from typing import Any, Optional, Sequence
+
+
+def _time_of(tp: Any) -> float:
+    time = getattr(tp, 'time', None)
+    if time is None:
+        time = tp.start_time
+    return float(time)
+
+
+class TimingIndex:
+    """
+    不可变的时间点索引
+
+    规则（与各转换器原有的顺序扫描一致）：
+    - 红线（uninherited）且 beat_length > 0 时生效，并把滑条速度倍率重置为 1
+    - 绿线 beat_length < 0 时速度倍率为 100 / -beat_length
+    - 同一时刻的多个时间点按原列表顺序依次生效，后者覆盖前者
+    - beat_length <= 0 的红线与 beat_length >= 0 的绿线被忽略
+    """
+    __slots__ = ('_red_times', '_red_beat_lengths', '_red_points', '_sv_times', '_sv_values')
+
+    def __init__(self, timing_points: Sequence[Any]):
+        red_times = []
+        red_beat_lengths = []
+        red_points = []
+        sv_times = []
+        sv_values = []
+        keyed = sorted(((_time_of(tp), tp) for tp in timing_points), key=lambda item: item[0])
+        for time, tp in keyed:
+            beat_length = float(tp.beat_length)
+            if tp.uninherited:
+                if beat_length > 0:
+                    red_times.append(time)
+                    red_beat_lengths.append(beat_length)
+                    red_points.append(tp)
+                    sv_times.append(time)
+                    sv_values.append(1.0)
+            elif beat_length < 0:
+                sv_times.append(time)
+                sv_values.append(100.0 / -beat_length)
+        self._red_times = tuple(red_times)
+        self._red_beat_lengths = tuple(red_beat_lengths)
+        self._red_points = tuple(red_points)
+        self._sv_times = tuple(sv_times)
+        self._sv_values = tuple(sv_values)
+
+    @classmethod
+    def from_beatmap(cls, beatmap: Any) -> 'TimingIndex':
+        """
+        由谱面当前的 timing_points 构建索引
+
+        索引是时间点的快照，不会随列表变化更新；转换器在每次转换开始时构建一次。
+
+        Args:
+            beatmap: 任意带 timing_points 属性的谱面对象
+
+        Returns:
+            TimingIndex
+        """
+        return cls(getattr(beatmap, 'timing_points', None) or ())
+
+    def timing_at(self, time: float) -> Optional[Any]:
+        """
+        获取指定时刻生效的红线
+
+        Args:
+            time: 时间（毫秒）
+
+        Returns:
+            原始时间点对象；time 早于所有红线时返回 None
+        """
+        i = bisect_right(self._red_times, time) - 1
+        return self._red_points[i] if i >= 0 else None
+
+    def beat_length_at(self, time: float, default: Optional[float] = None) -> Optional[float]:
+        """
+        获取指定时刻的节拍长度（毫秒每拍）
+
+        Args:
+            time: 时间（毫秒）
+            default: time 早于所有红线时的返回值
+
+        Returns:
+            节拍长度
+        """
+        i = bisect_right(self._red_times, time) - 1
+        return self._red_beat_lengths[i] if i >= 0 else default
+
+    def sv_multiplier_at(self, time: float) -> float:
+        """
+        获取指定时刻的滑条速度倍率（无绿线时为 1.0）
+
+        Args:
+            time: 时间（毫秒）
+
+        Returns:
+            速度倍率
+        """
+        i = bisect_right(self._sv_times, time) - 1
+        return self._sv_values[i] if i >= 0 else 1.0
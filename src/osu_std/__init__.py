@@ -1,2 +1,3 @@
 from .parser import OsuFileParser, OsuBeatmap
-from .hitobjects import HitObject, SliderInfo, SpinnerInfo, CircleInfo, parse_hit_object
+from .hitobjects import HitObject, SliderInfo, SpinnerInfo, CircleInfo, LazyExtras, parse_hit_object
+from .columnar import HitObjectColumns
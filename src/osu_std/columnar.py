@@ -0,0 +1,253 @@
+"""HitObject 的列式（struct-of-arrays）存储
+
+parse_hit_object 为每个物件生成一个 HitObject 及若干嵌套 dict / SliderInfo，
+大量谱面常驻内存时开销很大。HitObjectColumns 把同样的信息保存在若干
+array 列中：
+- x / y / time / type / hit_sound：每个物件一项
+- 滑条：repeat、pixel_length、曲线类型，控制点放在一个扁平缓冲区中（按偏移定位）
+- edge_sounds 同样扁平存储；edge_sets / hitSample 原始字符串放入去重字符串池，列中只存池索引
+
+HitObjectColumns 实现 Sequence 接口，按下标访问时才构造 HitObject 视图，
+与 parse_hit_object 对同一行的结果完全相同，因此现有调用方无需修改。
+"""
+from __future__ import annotations
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, List
+
+from .hitobjects import (HitObject, SliderInfo, SpinnerInfo, CircleInfo, LazyExtras, _parse_slider_path,
+                         decode_hit_sound_flags, decode_node_hit_sounds, parse_hit_sample)
+
+# flags 列
+_HAS_SLIDER = 0b1
+_HAS_SPINNER = 0b10
+
+# 全部 array 列的名称（固定顺序，序列化格式依赖该顺序）
+COLUMN_NAMES = ('x', 'y', 'time', 'type', 'hit_sound', 'flags', 'end_time', 'repeat', 'pixel_length',
+                'curve_type', 'point_offsets', 'points', 'edge_offsets', 'edge_sounds', 'edge_sets', 'sample')
+
+
+class HitObjectColumns(Sequence):
+    """列式存储的 HitObject 序列
+
+    通过 append_line() 逐行填充（规则与 parse_hit_object 一致），
+    下标访问 / 迭代时按需构造 HitObject 视图。
+    """
+
+    def __init__(self, lazy: bool = False):
+        """
+        Args:
+            lazy: 为 True 时视图的音效字段延迟解码，与 parse_hit_object(lazy=True) 相同
+        """
+        self.lazy = lazy
+        self.x = array('i')
+        self.y = array('i')
+        self.time = array('i')
+        self.type = array('i')
+        self.hit_sound = array('i')
+        self.flags = array('B')
+        self.end_time = array('i')          # 转盘结束时间，非转盘为 0
+        self.repeat = array('i')            # 滑条 repeat（字段不足的滑条为 1），非滑条为 0
+        self.pixel_length = array('d')      # 滑条长度，非滑条为 0
+        self.curve_type = array('i')        # 曲线类型字符串在池中的索引，-1 表示无
+        self.point_offsets = array('i', [0])  # 第 i 个物件的控制点位于 points[2*off[i]:2*off[i+1]]
+        self.points = array('i')            # 扁平控制点缓冲区 x0,y0,x1,y1,...
+        self.edge_offsets = array('i', [0])
+        self.edge_sounds = array('i')
+        self.edge_sets = array('i')         # edge_sets 原始字符串的池索引，-1 表示无
+        self.sample = array('i')            # hitSample 原始字符串的池索引，-1 表示无
+        self.strings: List[str] = []
+        self._string_ids: Dict[str, int] = {}
+
+    # ---- 填充 ----
+    def _intern(self, s: str) -> int:
+        idx = self._string_ids.get(s)
+        if idx is None:
+            idx = self._string_ids[s] = len(self.strings)
+            self.strings.append(s)
+        return idx
+
+    def append_line(self, line: str) -> bool:
+        """解析一行 HitObjects 并追加到各列
+
+        Args:
+            line: .osu 文件 [HitObjects] 段中的一行
+
+        Returns:
+            行无效（字段不足或前五个字段不是整数）时返回 False，不追加任何内容
+        """
+        parts = line.split(',')
+        n = len(parts)
+        if n < 5:
+            return False
+        try:
+            x = int(parts[0]); y = int(parts[1]); time = int(parts[2]); type_flag = int(parts[3]); hit_sound_val = int(parts[4])
+        except ValueError:
+            return False
+
+        flags = 0
+        end_time = 0
+        repeat = 0
+        pixel_length = 0.0
+        curve_type = -1
+        edge_sets = -1
+        sample = -1
+        points: List[int] = []
+        edge_sounds: List[int] = []
+
+        # HitCircle
+        if type_flag & 0b1 and not (type_flag & 0b10) and not (type_flag & 0b1000):
+            if n > 5 and ':' in parts[5]:
+                sample = self._intern(parts[5])
+
+        # Slider
+        if type_flag & 0b10:
+            if n >= 8:
+                flags |= _HAS_SLIDER
+                try:
+                    repeat = int(parts[6])
+                    pixel_length = float(parts[7])
+                except ValueError:
+                    repeat = 0
+                    pixel_length = 0.0
+            else:
+                # 字段不足时不是 osu_std 滑条（无 _HAS_SLIDER），仍按 any.osu_parser 的默认值保留
+                # 曲线与重复次数，供 common.ingest 的 any 模型视图使用
+                repeat = 1
+                if n > 6 and parts[6]:
+                    try:
+                        repeat = int(parts[6])
+                    except ValueError:
+                        pass
+            if n > 5:
+                ctype, pts = _parse_slider_path(parts[5])
+                curve_type = self._intern(ctype)
+                for px, py in pts:
+                    points.append(px)
+                    points.append(py)
+            if flags & _HAS_SLIDER:
+                if n > 8 and parts[8]:
+                    try:
+                        edge_sounds = [int(v) for v in parts[8].split('|') if v]
+                    except ValueError:
+                        pass
+                if n > 9 and parts[9]:
+                    edge_sets = self._intern(parts[9])
+                if n > 10 and ':' in parts[10]:
+                    sample = self._intern(parts[10])
+
+        # Spinner（hitSample 可省略，6 个字段即完整）
+        if type_flag & 0b1000 and n >= 6:
+            try:
+                end_time = int(parts[5])
+                flags |= _HAS_SPINNER
+            except ValueError:
+                pass
+            if n > 6 and ':' in parts[6]:
+                sample = self._intern(parts[6])
+
+        self.x.append(x)
+        self.y.append(y)
+        self.time.append(time)
+        self.type.append(type_flag)
+        self.hit_sound.append(hit_sound_val)
+        self.flags.append(flags)
+        self.end_time.append(end_time)
+        self.repeat.append(repeat)
+        self.pixel_length.append(pixel_length)
+        self.curve_type.append(curve_type)
+        self.points.extend(points)
+        self.point_offsets.append(len(self.points) // 2)
+        self.edge_sounds.extend(edge_sounds)
+        self.edge_offsets.append(len(self.edge_sounds))
+        self.edge_sets.append(edge_sets)
+        self.sample.append(sample)
+        return True
+
+    # ---- 视图 ----
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("hit object index out of range")
+        return self._view(index)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._view(i)
+
+    def _view(self, i: int) -> HitObject:
+        x = self.x[i]
+        y = self.y[i]
+        type_flag = self.type[i]
+        hit_sound_val = self.hit_sound[i]
+        flags = self.flags[i]
+
+        lazy = self.lazy
+        if lazy:
+            extras: Dict[str, Any] = LazyExtras()
+            extras.set_raw('hit_sounds', hit_sound_val)
+        else:
+            extras = {'hit_sounds': decode_hit_sound_flags(hit_sound_val)}
+        if type_flag & 0b1 and not (type_flag & 0b10) and not (type_flag & 0b1000):
+            extras['circle'] = CircleInfo(new_combo=bool(type_flag & 0b100))
+        if flags & _HAS_SLIDER:
+            p0 = 2 * self.point_offsets[i]
+            p1 = 2 * self.point_offsets[i + 1]
+            flat = self.points[p0:p1]
+            points = list(zip(flat[0::2], flat[1::2]))
+            edge_sounds = self.edge_sounds[self.edge_offsets[i]:self.edge_offsets[i + 1]].tolist()
+            edge_sets = self.strings[self.edge_sets[i]].split('|') if self.edge_sets[i] >= 0 else []
+            repeat = self.repeat[i]
+            node_hit_sounds = None if lazy else decode_node_hit_sounds(edge_sounds, repeat)
+            end_x = points[-1][0] if points else x
+            end_y = points[-1][1] if points else y
+            extras['slider'] = SliderInfo(self.strings[self.curve_type[i]], points, repeat, self.pixel_length[i],
+                                          edge_sounds, edge_sets, node_hit_sounds, end_x, end_y)
+        if flags & _HAS_SPINNER:
+            extras['spinner'] = SpinnerInfo(self.end_time[i])
+        if self.sample[i] >= 0:
+            if lazy:
+                extras.set_raw('sample', self.strings[self.sample[i]])
+            else:
+                extras['sample'] = parse_hit_sample(self.strings[self.sample[i]])
+        return HitObject(x, y, self.time[i], type_flag, hit_sound_val, extras)
+
+    # ---- 其他 ----
+    def nbytes(self) -> int:
+        """各列缓冲区占用的字节数（不含字符串池）"""
+        total = 0
+        for name in COLUMN_NAMES:
+            col = getattr(self, name)
+            total += col.itemsize * len(col)
+        return total
+
+    def set_strings(self, strings: List[str]):
+        """替换字符串池（用于从序列化数据恢复）"""
+        self.strings = list(strings)
+        self._string_ids = {s: i for i, s in enumerate(self.strings)}
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """以 NumPy 数组形式返回各列（零拷贝，共享底层缓冲区），需要安装 numpy
+
+        返回的数组存活期间不能再 append_line()（array 缓冲区被导出后不可扩容）。
+
+        Returns:
+            列名 -> numpy.ndarray 的字典；points 形状为 (N, 2)
+        """
+        import numpy as np
+
+        columns = {}
+        for name in COLUMN_NAMES:
+            if name == 'points':
+                continue
+            col = getattr(self, name)
+            columns[name] = np.frombuffer(col, dtype=np.dtype(col.typecode)) if len(col) else np.zeros(0, dtype=col.typecode)
+        points = np.frombuffer(self.points, dtype=np.intc) if len(self.points) else np.zeros(0, dtype=np.intc)
+        columns['points'] = points.reshape(-1, 2)
+        return columns
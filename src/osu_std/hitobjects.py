@@ -11,10 +11,21 @@ class SliderInfo:
     pixel_length: float
     edge_sounds: List[int] = field(default_factory=list)
     edge_sets: List[str] = field(default_factory=list)
-    node_hit_sounds: List[Dict[str, Any]] = field(default_factory=list)  # decoded per-node flags
+    node_hit_sounds: List[Dict[str, Any]] = field(default_factory=list)  # decoded per-node flags；传入 None 时首次访问才解码
     end_x: int = 0  # approximate path end position (last control point)
     end_y: int = 0
 
+    def __post_init__(self):
+        # node_hit_sounds 完全由 edge_sounds 与 repeat 决定，延迟模式下不占用实例属性，由 __getattr__ 在读取时解码
+        if self.node_hit_sounds is None:
+            del self.node_hit_sounds
+
+    def __getattr__(self, name: str) -> Any:
+        if name != 'node_hit_sounds':
+            raise AttributeError(name)
+        node_hit_sounds = self.node_hit_sounds = decode_node_hit_sounds(self.edge_sounds, self.repeat)
+        return node_hit_sounds
+
 @dataclass
 class SpinnerInfo:
     end_time: int
@@ -49,6 +60,161 @@ class HitObject:
     def is_new_combo(self) -> bool:
         return bool(self.type & 0b100)
 
+# ---------------- Decoding ---------------- #
+
+def decode_hit_sound_flags(v: int) -> Dict[str, Any]:
+    # https://osu.ppy.sh/wiki/en/Client/File_formats/Osu_(file_format)#hitsounds
+    return {
+        'normal': bool(v & 0b1 == 0 or v & 0b1),  # 基础 normal 隐式存在，但仍保留标志
+        'whistle': bool(v & 0b10),
+        'finish': bool(v & 0b100),
+        'clap': bool(v & 0b1000),
+        'raw': v
+    }
+
+
+def parse_hit_sample(sample_str: str) -> Dict[str, Any]:
+    # 格式: sampleSet:additionSet:customIndex:volume:filename  (filename 可为空)
+    segs = sample_str.split(':')
+    while len(segs) < 5:
+        segs.append('')
+    try:
+        sample_set = int(segs[0]) if segs[0] else 0
+        addition_set = int(segs[1]) if segs[1] else 0
+        custom_index = int(segs[2]) if segs[2] else 0
+        volume = int(segs[3]) if segs[3] else 0
+        filename = segs[4] if len(segs) > 4 else ''
+    except ValueError:
+        sample_set = addition_set = custom_index = volume = 0
+        filename = ''
+    return {
+        'sample_set': sample_set,
+        'addition_set': addition_set,
+        'custom_index': custom_index,
+        'volume': volume,
+        'filename': filename
+    }
+
+
+def decode_node_hit_sounds(edge_sounds: List[int], repeat: int) -> List[Dict[str, Any]]:
+    # Build per-node hit sounds (length should be repeat+1; pad/trim accordingly)
+    # edge_sounds may include tail; spec: exactly node_count entries
+    count = len(edge_sounds)
+    return [decode_hit_sound_flags(edge_sounds[i] if i < count else 0) for i in range(repeat + 1)]
+
+
+# LazyExtras 中延迟解码的键：键 -> (待解码标志位, 解码函数)
+_LAZY_KEYS = {
+    'hit_sounds': (0b1, decode_hit_sound_flags),
+    'sample': (0b10, parse_hit_sample),
+}
+
+
+class LazyExtras(dict):
+    """HitObject.extras 的延迟解码版本
+
+    'hit_sounds' / 'sample' 先以原始值（hitSound 整数 / hitSample 字符串）存放，
+    第一次通过任何读取接口访问时才解码为与普通 extras 相同的 dict。
+    键集合与普通 extras 一致，因此 `'sample' in extras` 等判断不受影响。
+    """
+    __slots__ = ('_pending',)
+
+    def __init__(self):
+        super().__init__()
+        self._pending = 0
+
+    def set_raw(self, key: str, raw: Any):
+        """以原始值写入一个延迟解码的键"""
+        dict.__setitem__(self, key, raw)
+        self._pending |= _LAZY_KEYS[key][0]
+
+    def _decode_all(self):
+        for key in _LAZY_KEYS:
+            if self._pending and key in self:
+                self[key]
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if self._pending:
+            lazy = _LAZY_KEYS.get(key)
+            if lazy is not None and self._pending & lazy[0]:
+                value = lazy[1](value)
+                dict.__setitem__(self, key, value)
+                self._pending &= ~lazy[0]
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        lazy = _LAZY_KEYS.get(key)
+        if lazy is not None:
+            self._pending &= ~lazy[0]
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        lazy = _LAZY_KEYS.get(key)
+        if lazy is not None:
+            self._pending &= ~lazy[0]
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def popitem(self):
+        self._decode_all()
+        return dict.popitem(self)
+
+    def __iter__(self):
+        # 覆盖 __iter__ 使 dict(extras) / {**extras} 走 keys() + __getitem__，拿到解码后的值
+        return dict.__iter__(self)
+
+    def values(self):
+        self._decode_all()
+        return dict.values(self)
+
+    def items(self):
+        self._decode_all()
+        return dict.items(self)
+
+    def copy(self):
+        self._decode_all()
+        return dict(self)
+
+    def __eq__(self, other):
+        self._decode_all()
+        if isinstance(other, LazyExtras):
+            other._decode_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __repr__(self):
+        self._decode_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        self._decode_all()
+        return dict, (dict(self),)
+
+
 # ---------------- Parsing ---------------- #
 
 def _parse_slider_path(path_def: str) -> Tuple[str, List[Tuple[int, int]]]:
@@ -66,7 +232,18 @@ def _parse_slider_path(path_def: str) -> Tuple[str, List[Tuple[int, int]]]:
     return curve_type, pts
 
 
-def parse_hit_object(line: str) -> Optional[HitObject]:
+def parse_hit_object(line: str, lazy: bool = False) -> Optional[HitObject]:
+    """
+    解析 [HitObjects] 段中的一行
+
+    Args:
+        line: 物件行文本
+        lazy: 为 True 时 extras['hit_sounds']、extras['sample'] 与 SliderInfo.node_hit_sounds
+              保留原始值，首次访问时才解码（结构与非延迟模式相同）
+
+    Returns:
+        HitObject；行无效时返回 None
+    """
     parts = line.split(',')
     if len(parts) < 5:
         return None
@@ -75,49 +252,20 @@ def parse_hit_object(line: str) -> Optional[HitObject]:
     except ValueError:
         return None
 
-    extras: Dict[str, Any] = {}
-
     # 解析结尾 hitSample 字段（位置依赖于 hitobject 类型）
-    # 格式: sampleSet:additionSet:customIndex:volume:filename  (filename 可为空)
-    def parse_hit_sample(sample_str: str):
-        segs = sample_str.split(':')
-        while len(segs) < 5:
-            segs.append('')
-        try:
-            sample_set = int(segs[0]) if segs[0] else 0
-            addition_set = int(segs[1]) if segs[1] else 0
-            custom_index = int(segs[2]) if segs[2] else 0
-            volume = int(segs[3]) if segs[3] else 0
-            filename = segs[4] if len(segs) > 4 else ''
-        except ValueError:
-            sample_set = addition_set = custom_index = volume = 0
-            filename = ''
-        return {
-            'sample_set': sample_set,
-            'addition_set': addition_set,
-            'custom_index': custom_index,
-            'volume': volume,
-            'filename': filename
-        }
-
-    def decode_hit_sound_flags(v: int):
-        # https://osu.ppy.sh/wiki/en/Client/File_formats/Osu_(file_format)#hitsounds
-        return {
-            'normal': bool(v & 0b1 == 0 or v & 0b1),  # 基础 normal 隐式存在，但仍保留标志
-            'whistle': bool(v & 0b10),
-            'finish': bool(v & 0b100),
-            'clap': bool(v & 0b1000),
-            'raw': v
-        }
-
-    extras['hit_sounds'] = decode_hit_sound_flags(hit_sound_val)
+    sample_str: Optional[str] = None
+    if lazy:
+        extras: Dict[str, Any] = LazyExtras()
+        extras.set_raw('hit_sounds', hit_sound_val)
+    else:
+        extras = {'hit_sounds': decode_hit_sound_flags(hit_sound_val)}
 
     # HitCircle (普通圆)
     if type_flag & 0b1 and not (type_flag & 0b10) and not (type_flag & 0b1000):
         extras["circle"] = CircleInfo(new_combo=bool(type_flag & 0b100))
         # hitSample 位置 index 5 (如果存在)
         if len(parts) > 5 and ':' in parts[5]:
-            extras['sample'] = parse_hit_sample(parts[5])
+            sample_str = parts[5]
 
     # Slider
     if type_flag & 0b10:
@@ -140,24 +288,7 @@ def parse_hit_object(line: str) -> Optional[HitObject]:
             if len(parts) > 9 and parts[9]:
                 edge_sets = parts[9].split('|')
 
-            # Build per-node hit sounds (length should be repeat+1; pad/trim accordingly)
-            node_count = repeat + 1
-            node_hit_sounds: List[Dict[str, Any]] = []
-            def decode_node(v: int):
-                return {
-                    'normal': bool(v & 0b1 == 0 or v & 0b1),
-                    'whistle': bool(v & 0b10),
-                    'finish': bool(v & 0b100),
-                    'clap': bool(v & 0b1000),
-                    'raw': v
-                }
-            if edge_sounds:
-                # edge_sounds may include tail; spec: exactly node_count entries
-                for i in range(node_count):
-                    val = edge_sounds[i] if i < len(edge_sounds) else 0
-                    node_hit_sounds.append(decode_node(val))
-            else:
-                node_hit_sounds = [decode_node(0) for _ in range(node_count)]
+            node_hit_sounds = None if lazy else decode_node_hit_sounds(edge_sounds, repeat)
 
             # Approximate end position: last control point if exists else start (x,y)
             end_x = points[-1][0] if points else x
@@ -166,11 +297,12 @@ def parse_hit_object(line: str) -> Optional[HitObject]:
             extras["slider"] = slider_info
             # hitSample 位置 index 10 (overall sample for tail per osu format)
             if len(parts) > 10 and ':' in parts[10]:
-                extras['sample'] = parse_hit_sample(parts[10])
+                sample_str = parts[10]
 
     # Spinner
     if type_flag & 0b1000:
-        if len(parts) >= 7:
+        # hitSample 可省略，6 个字段即完整
+        if len(parts) >= 6:
             try:
                 end_time = int(parts[5])
                 extras["spinner"] = SpinnerInfo(end_time)
@@ -178,6 +310,12 @@ def parse_hit_object(line: str) -> Optional[HitObject]:
                 pass
             # hitSample 位置 index 6
             if len(parts) > 6 and ':' in parts[6]:
-                extras['sample'] = parse_hit_sample(parts[6])
+                sample_str = parts[6]
+
+    if sample_str is not None:
+        if lazy:
+            extras.set_raw('sample', sample_str)
+        else:
+            extras['sample'] = parse_hit_sample(sample_str)
 
     return HitObject(x, y, time, type_flag, hit_sound_val, extras)
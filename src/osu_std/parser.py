@@ -19,9 +19,13 @@
 """
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Sequence, Union
 import re, math
 from .hitobjects import HitObject, SliderInfo, SpinnerInfo, parse_hit_object
+from .columnar import HitObjectColumns
+from common.timing import TimingIndex
+from common.sections import build_section_table
+from common.stream import Source, StreamedHitObjects, map_osu_source, split_concatenated
 
 # ---- 数据模型 ----
 
@@ -52,7 +56,8 @@ class OsuBeatmap:
     difficulty: Dict[str, Any] = field(default_factory=dict)
     editor: Dict[str, Any] = field(default_factory=dict)
     timing_points: List[TimingPoint] = field(default_factory=list)
-    hit_objects: List[HitObject] = field(default_factory=list)
+    # 默认为 HitObject 列表；OsuFileParser(columnar=True) 时为 HitObjectColumns（按需生成 HitObject 视图）
+    hit_objects: Sequence[HitObject] = field(default_factory=list)
 
     # 便捷属性
     @property
@@ -90,28 +95,11 @@ class OsuBeatmap:
         slider_multiplier = float(self.difficulty.get('SliderMultiplier', 1.0))
         slider_tick_rate = float(self.difficulty.get('SliderTickRate', 1.0)) or 1.0
 
-        # 预处理 timing points，维护当前 base beat length 与 sv multiplier
-        timing_points_sorted = sorted(self.timing_points, key=lambda t: t.time)
-        base_beat_length = 500.0  # 默认
-        sv_multiplier = 1.0
-        tp_index = 0
-
-        def update_timing(current_time: float):
-            nonlocal tp_index, base_beat_length, sv_multiplier
-            while tp_index + 1 < len(timing_points_sorted) and timing_points_sorted[tp_index + 1].time <= current_time:
-                tp_index += 1
-                tp = timing_points_sorted[tp_index]
-                if tp.uninherited:  # 红线
-                    base_beat_length = tp.beat_length if tp.beat_length > 0 else base_beat_length
-                    sv_multiplier = 1.0  # 重置 SV
-                else:
-                    # 绿线，beat_length 通常为负：真实 SV = 100 / -beat_length
-                    if tp.beat_length < 0:
-                        sv_multiplier = 100.0 / -tp.beat_length
+        # 时间点索引：按物件时间 O(log n) 查询当前 sv multiplier
+        timing = TimingIndex.from_beatmap(self)
 
         max_combo = 0
         for obj in self.hit_objects:
-            update_timing(obj.time)
             # Circle
             if obj.extras.get('circle') is not None:
                 max_combo += 1
@@ -126,7 +114,7 @@ class OsuBeatmap:
                 span_count = max(1, slider_data.repeat)
                 span_length = slider_data.pixel_length / span_count if span_count else slider_data.pixel_length
                 # 计算 tick distance
-                effective_sv = slider_multiplier * sv_multiplier
+                effective_sv = slider_multiplier * timing.sv_multiplier_at(obj.time)
                 # 避免除零
                 if slider_tick_rate <= 0:
                     tick_distance = span_length + 1  # 无 tick
@@ -152,9 +140,22 @@ class OsuFileParser:
     key_value_re = re.compile(r"^([^:]+):\s*(.*)$")
     format_re = re.compile(r"^osu file format v(\d+)\s*$")
 
+    def __init__(self, columnar: bool = False, lazy: bool = False):
+        """
+        Args:
+            columnar: 为 True 时 hit_objects 以 HitObjectColumns 列式存储，
+                      适合大量谱面常驻内存的场景
+            lazy: 为 True 时音效相关字段延迟解码，见 parse_hit_object(lazy=True)
+        """
+        self.columnar = columnar
+        self.lazy = lazy
+
     def parse(self, text: str) -> OsuBeatmap:
         beatmap = OsuBeatmap()
         current_section: Optional[str] = None
+        columns: Optional[HitObjectColumns] = None
+        if self.columnar:
+            columns = beatmap.hit_objects = HitObjectColumns(self.lazy)
 
         lines = text.splitlines()
         for raw in lines:
@@ -192,13 +193,94 @@ class OsuFileParser:
                 continue
 
             if current_section == "HitObjects":
-                ho = parse_hit_object(line)
+                if columns is not None:
+                    columns.append_line(line)
+                    continue
+                ho = parse_hit_object(line, self.lazy)
                 if ho:
                     beatmap.hit_objects.append(ho)
                 continue
 
         return beatmap
 
+    # 章节偏移表中的小写章节名 -> key=value 章节对应的 OsuBeatmap 字段
+    _KEY_VALUE_SECTIONS = {"general": "general", "metadata": "metadata", "difficulty": "difficulty", "editor": "editor"}
+
+    def parse_bytes(self, data: Union[bytes, bytearray, memoryview]) -> OsuBeatmap:
+        """解析 .osu 原始字节（快速路径）
+
+        通过章节偏移表只解码 General / Metadata / Difficulty / Editor / TimingPoints / HitObjects，
+        Events、Colours 等章节整段跳过。结果与 parse() 相同。
+        """
+        return self._parse_byte_range(data, 0, None, stream=False)
+
+    def stream(self, data, start: int = 0, end: Optional[int] = None) -> OsuBeatmap:
+        """流式解析缓冲区中的一张谱面
+
+        除 [HitObjects] 外的章节立即解析；hit_objects 为 StreamedHitObjects，迭代时才按块解析物件
+        （columnar 选项不适用）。
+        """
+        return self._parse_byte_range(data, start, end, stream=True)
+
+    def _parse_byte_range(self, data, start: int, end: Optional[int], stream: bool) -> OsuBeatmap:
+        beatmap = OsuBeatmap()
+        columns: Optional[HitObjectColumns] = None
+        if self.columnar and not stream:
+            columns = beatmap.hit_objects = HitObjectColumns(self.lazy)
+
+        table = build_section_table(data, start, end)
+        head = str(data[start:table[0][1] if table else (len(data) if end is None else end)], 'utf-8', 'replace')
+        for raw in head.splitlines():
+            m_format = self.format_re.match(raw.strip())
+            if m_format:
+                beatmap.format_version = int(m_format.group(1))
+
+        for name, section_start, section_end in table:
+            if name == "hitobjects":
+                if stream:
+                    beatmap.hit_objects = StreamedHitObjects(data, section_start, section_end, self._parse_hit_object_chunk)
+                elif columns is not None:
+                    append_line = columns.append_line
+                    for line in self._section_lines(data, section_start, section_end):
+                        append_line(line)
+                else:
+                    append = beatmap.hit_objects.append
+                    lazy = self.lazy
+                    for line in self._section_lines(data, section_start, section_end):
+                        ho = parse_hit_object(line, lazy)
+                        if ho:
+                            append(ho)
+            elif name == "timingpoints":
+                append = beatmap.timing_points.append
+                for line in self._section_lines(data, section_start, section_end):
+                    tp = self._parse_timing_point(line)
+                    if tp:
+                        append(tp)
+            elif name in self._KEY_VALUE_SECTIONS:
+                target = getattr(beatmap, self._KEY_VALUE_SECTIONS[name])
+                for line in self._section_lines(data, section_start, section_end):
+                    kv = self.key_value_re.match(line)
+                    if kv:
+                        target[kv.group(1).strip()] = self._parse_scalar(kv.group(2).strip())
+
+        return beatmap
+
+    def _parse_hit_object_chunk(self, text: str) -> Iterator[HitObject]:
+        lazy = self.lazy
+        for raw in text.splitlines():
+            line = raw.strip()
+            if line and not line.startswith('//'):
+                ho = parse_hit_object(line, lazy)
+                if ho:
+                    yield ho
+
+    @staticmethod
+    def _section_lines(data: Union[bytes, bytearray, memoryview], start: int, end: int):
+        for raw in str(data[start:end], 'utf-8', 'replace').splitlines():
+            line = raw.strip()
+            if line and not line.startswith('//'):
+                yield line
+
     # ---- 工具方法 ----
     def _parse_scalar(self, val: str) -> Any:
         # 尝试 int -> float -> bool -> 原字符串
@@ -238,3 +320,22 @@ class OsuFileParser:
 
 # 便捷函数
 parse_osu = OsuFileParser().parse
+parse_osu_bytes = OsuFileParser().parse_bytes
+
+
+def stream_osu(source: Source, lazy: bool = True) -> Iterator[OsuBeatmap]:
+    """以内存映射方式流式读取 .osu 文件，支持多张谱面首尾相接的合集文件
+
+    每张谱面的 hit_objects 在迭代时才按块解析；生成器结束后文件关闭，
+    此后不能再迭代之前产出谱面的 hit_objects。
+    """
+    parser = OsuFileParser(lazy=lazy)
+    with map_osu_source(source) as buf:
+        for start, end in split_concatenated(buf):
+            yield parser.stream(buf, start, end)
+
+
+def iter_hit_objects(source: Source, lazy: bool = True) -> Iterator[HitObject]:
+    """以内存映射方式逐个产出文件中所有谱面的物件"""
+    for beatmap in stream_osu(source, lazy):
+        yield from beatmap.hit_objects
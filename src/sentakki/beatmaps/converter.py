@@ -12,6 +12,7 @@ from .slide_paths import PROTOTYPES, SlidePathPrototype
 from .slide_geometry import part_angle, angle_to_lane_delta
 from .flags import ConversionFlags, StreamDirection
 from ..difficulty.beatmap_base import SentakkiBeatmap
+from common.timing import TimingIndex
 
 try:  # External parser data structures
     from osu_std.hitobjects import SliderInfo, SpinnerInfo
@@ -112,6 +113,9 @@ class SentakkiConverter:
         # Pattern
         self._twin_pattern = TwinPattern(self._rng)
 
+        # Timing index, built at the start of each conversion run (see _convert_objects)
+        self._timing: Optional[TimingIndex] = None
+
     # ---------------- Public API ----------------
     def convert(self) -> SentakkiBeatmap:
         objects = self._convert_objects()
@@ -127,10 +131,10 @@ class SentakkiConverter:
 
     # ---------------- Core conversion ----------------
     def _convert_objects(self) -> List[SentakkiObjectBase]:
+        self._timing = TimingIndex.from_beatmap(self.osu)
         hit_objects: List[Any] = list(getattr(self.osu, 'hit_objects', []))
-        timing_points = sorted(getattr(self.osu, 'timing_points', []), key=lambda t: t.time)
         if self.flags & ConversionFlags.OLD_CONVERTER:
-            return self._convert_old(hit_objects, timing_points)
+            return self._convert_old(hit_objects)
         if not hit_objects:
             return []
 
@@ -162,12 +166,12 @@ class SentakkiConverter:
                 created.append(TouchHold(time=start_time, lane=self._current_lane, duration=duration, flags=flags, x=CENTER_X, y=CENTER_Y))
             elif 'slider' in extras or hasattr(ho, 'slider'):
                 slider: SliderInfo = extras.get('slider') or getattr(ho, 'slider')  # type: ignore
-                duration = self._calculate_slider_duration(start_time, slider, timing_points)
+                duration = self._calculate_slider_duration(start_time, slider)
                 flags = 0
                 if hs.get('finish'): flags |= FLAG_BREAK
                 if hs.get('whistle'): flags |= FLAG_EX
                 # curvature-aware lazy slider heuristic
-                event_count = self._slider_event_count(slider, start_time, timing_points)
+                event_count = self._slider_event_count(slider, start_time)
                 pts = getattr(slider,'points', []) or []
                 straight_ratio = 1.0
                 if len(pts) >= 2:
@@ -388,7 +392,7 @@ class SentakkiConverter:
         segs = [SlideSegment(end_lane=new_lane, duration=s.duration, fan=s.fan) for s in slide.segments]
         return Slide(time=slide.time, lane=new_lane, segments=segs, body=body_copy, flags=slide.flags | extra_flags)
 
-    def _convert_old(self, hit_objects: List[Any], timing_points: List[Any]) -> List[SentakkiObjectBase]:
+    def _convert_old(self, hit_objects: List[Any]) -> List[SentakkiObjectBase]:
         out: List[SentakkiObjectBase] = []
         for ho in hit_objects:
             lane = self._rng.randint(0, LANE_COUNT-1)
@@ -400,7 +404,7 @@ class SentakkiConverter:
                 out.append(TouchHold(time=ho.time, lane=lane, duration=dur, flags=FLAG_BREAK if hs.get('finish') else 0, x=CENTER_X, y=CENTER_Y)); continue
             if 'slider' in extras:
                 slider: SliderInfo = extras['slider']  # type: ignore
-                dur = self._calculate_slider_duration(ho.time, slider, timing_points)
+                dur = self._calculate_slider_duration(ho.time, slider)
                 if self._rng.random() < 0.4:
                     out.append(Hold(time=ho.time, lane=lane, duration=dur))
                 else:
@@ -528,31 +532,15 @@ class SentakkiConverter:
         return (b - a) <= beat
 
     def _beat_length_at_time(self, time_ms: int) -> Optional[float]:
-        tps = getattr(self.osu,'timing_points',None)
-        if not tps: return None
-        base_beat = None; last_red = -1; sv_mul = 1.0
-        for tp in sorted(tps, key=lambda tp: tp.time):
-            if tp.time > time_ms: break
-            if tp.uninherited:
-                if tp.beat_length > 0:
-                    base_beat = tp.beat_length; last_red = tp.time; sv_mul = 1.0
-            else:
-                if tp.beat_length < 0 and tp.time >= last_red and base_beat is not None:
-                    sv_mul = 100.0 / -tp.beat_length
-        return base_beat
+        # Bisect lookup in the run's timing index instead of re-sorting per call
+        return self._timing.beat_length_at(time_ms)
 
-    def _calculate_slider_duration(self, start_time: int, slider: Any, timing_points: List[Any]) -> int:
+    def _calculate_slider_duration(self, start_time: int, slider: Any) -> int:
         diff = getattr(self.osu,'difficulty',{})
         slider_multiplier = float(diff.get('SliderMultiplier',1.0)) or 1.0
-        base_beat = 500.0; sv = 1.0; last_red=-1
-        for tp in timing_points:
-            if tp.time > start_time: break
-            if tp.uninherited:
-                if tp.beat_length > 0:
-                    base_beat = tp.beat_length; last_red = tp.time; sv = 1.0
-            else:
-                if tp.beat_length < 0 and tp.time >= last_red:
-                    sv = 100.0 / -tp.beat_length
+        timing = self._timing
+        base_beat = timing.beat_length_at(start_time, 500.0)
+        sv = timing.sv_multiplier_at(start_time)
         scoring_distance = 100.0 * slider_multiplier * sv
         span_count = max(1, slider.repeat + 1)
         beats = slider.pixel_length / scoring_distance
@@ -611,7 +599,7 @@ class SentakkiConverter:
         return round(star,4)
 
     # -------- Slider helpers (improved) --------
-    def _slider_event_count(self, slider: Any, start_time: int, timing_points: List[Any]) -> int:
+    def _slider_event_count(self, slider: Any, start_time: int) -> int:
         """Approximate number of meaningful events (head + ticks + tail + repeats).
         If the count is very small treat as lazy slider.
         """
@@ -0,0 +1,162 @@
+"""Compact binary serialization for converted Sentakki beatmaps.
+
+Conversion is deterministic per seed but expensive (lane lookahead, weighted
+slide prototype selection). The converted objects are stored as array-backed
+columns inside a ``common.binary`` container so they can be cached across
+processes and reloaded without running the converter or its RNG:
+ - one row per object: kind, time, lane, flags, duration, x/y, body index
+ - legacy ``SlideSegment`` rows, indexed by per-object offsets
+ - ``SlideBodyInfo`` rows (slides with a body only) and their ``SlidePathPart``
+   rows, indexed by per-body offsets; part shapes go into a string pool
+
+``SentakkiBeatmap.save`` / ``SentakkiBeatmap.load`` are thin wrappers over
+``dumps`` / ``loads``.
+"""
+from __future__ import annotations
+from array import array
+from typing import Dict, List
+
+from common import binary
+from .objects import (SentakkiObjectBase, Tap, Hold, Slide, SlideSegment, SlidePathPart, SlideBodyInfo,
+                      Touch, TouchHold)
+
+MAGIC = b"GUSK"
+FORMAT_VERSION = 1
+
+# kind column codes; order is part of the format
+_KINDS = (Tap, Hold, Slide, Touch, TouchHold)
+_KIND_CODES = {cls: code for code, cls in enumerate(_KINDS)}
+_HOLD, _SLIDE, _TOUCH, _TOUCH_HOLD = 1, 2, 3, 4
+
+_COLUMN_COUNT = 24
+
+
+def dumps(beatmap) -> bytes:
+    """Serialize a ``SentakkiBeatmap`` to bytes.
+
+    Raises:
+        TypeError: if an object is not one of Tap/Hold/Slide/Touch/TouchHold.
+    """
+    kinds = array('B'); times = array('q'); lanes = array('i'); flags = array('i')
+    durations = array('q'); xs = array('d'); ys = array('d'); body_index = array('i')
+    seg_offsets = array('i', [0]); seg_end_lane = array('i'); seg_duration = array('q'); seg_fan = array('B')
+    body_duration = array('q'); body_shoot_delay = array('q'); body_fan_start = array('d')
+    body_end_lane = array('i'); body_complexity = array('d')
+    part_offsets = array('i', [0]); part_shape = array('i'); part_duration = array('q'); part_mirrored = array('B')
+    part_min_duration = array('q'); part_end_offset = array('q'); part_fan_start = array('d')
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    for obj in beatmap.objects:
+        code = _KIND_CODES.get(type(obj))
+        if code is None:
+            raise TypeError(f"cannot serialize object of type {type(obj).__name__}")
+        kinds.append(code)
+        times.append(obj.time)
+        lanes.append(obj.lane)
+        flags.append(obj.flags)
+        durations.append(obj.duration if code in (_HOLD, _TOUCH_HOLD) else 0)
+        if code >= _TOUCH:
+            xs.append(obj.x); ys.append(obj.y)
+        else:
+            xs.append(0.0); ys.append(0.0)
+
+        if code == _SLIDE:
+            for seg in obj.segments:
+                seg_end_lane.append(seg.end_lane)
+                seg_duration.append(seg.duration)
+                seg_fan.append(seg.fan)
+            body = obj.body
+            if body is not None:
+                body_index.append(len(body_duration))
+                body_duration.append(body.duration)
+                body_shoot_delay.append(body.shoot_delay)
+                body_fan_start.append(body.fan_start_progress)
+                body_end_lane.append(body.end_lane)
+                body_complexity.append(body.complexity)
+                for part in body.parts:
+                    shape = string_ids.get(part.shape)
+                    if shape is None:
+                        shape = string_ids[part.shape] = len(strings)
+                        strings.append(part.shape)
+                    part_shape.append(shape)
+                    part_duration.append(part.duration)
+                    part_mirrored.append(part.mirrored)
+                    part_min_duration.append(part.min_duration)
+                    part_end_offset.append(part.end_offset)
+                    part_fan_start.append(part.fan_start_progress)
+                part_offsets.append(len(part_shape))
+            else:
+                body_index.append(-1)
+        else:
+            body_index.append(-1)
+        seg_offsets.append(len(seg_duration))
+
+    header = {
+        "star_rating": beatmap.star_rating,
+        "max_combo": beatmap.max_combo,
+        "approach_rate": beatmap.approach_rate,
+        "strings": strings,
+    }
+    return binary.pack(MAGIC, FORMAT_VERSION, header, [
+        kinds, times, lanes, flags, durations, xs, ys, body_index,
+        seg_offsets, seg_end_lane, seg_duration, seg_fan,
+        body_duration, body_shoot_delay, body_fan_start, body_end_lane, body_complexity,
+        part_offsets, part_shape, part_duration, part_mirrored, part_min_duration, part_end_offset, part_fan_start,
+    ])
+
+
+def loads(data: bytes):
+    """Rebuild a ``SentakkiBeatmap`` from ``dumps`` output.
+
+    Raises:
+        ValueError: on a foreign/old format or corrupt data.
+    """
+    from ..difficulty.beatmap_base import SentakkiBeatmap
+
+    header, columns = binary.unpack(data, MAGIC, FORMAT_VERSION, _COLUMN_COUNT)
+    (kinds, times, lanes, flags, durations, xs, ys, body_index,
+     seg_offsets, seg_end_lane, seg_duration, seg_fan,
+     body_duration, body_shoot_delay, body_fan_start, body_end_lane, body_complexity,
+     part_offsets, part_shape, part_duration, part_mirrored, part_min_duration, part_end_offset,
+     part_fan_start) = columns
+    strings = header["strings"]
+    if (len(seg_offsets) != len(kinds) + 1 or seg_offsets[-1] != len(seg_duration)
+            or len(part_offsets) != len(body_duration) + 1 or part_offsets[-1] != len(part_shape)):
+        raise ValueError("corrupt data: offsets do not match arrays")
+
+    objects: List[SentakkiObjectBase] = []
+    for i in range(len(kinds)):
+        code = kinds[i]
+        time = times[i]; lane = lanes[i]; flag = flags[i]
+        if code == 0:
+            obj = Tap(time=time, lane=lane, flags=flag)
+        elif code == _HOLD:
+            obj = Hold(time=time, lane=lane, flags=flag, duration=durations[i])
+        elif code == _SLIDE:
+            segments = [SlideSegment(end_lane=seg_end_lane[k], duration=seg_duration[k], fan=bool(seg_fan[k]))
+                        for k in range(seg_offsets[i], seg_offsets[i + 1])]
+            body = None
+            b = body_index[i]
+            if b >= 0:
+                parts = [SlidePathPart(shape=strings[part_shape[k]], duration=part_duration[k],
+                                       mirrored=bool(part_mirrored[k]), min_duration=part_min_duration[k],
+                                       end_offset=part_end_offset[k], fan_start_progress=part_fan_start[k])
+                         for k in range(part_offsets[b], part_offsets[b + 1])]
+                body = SlideBodyInfo(parts=parts, duration=body_duration[b], shoot_delay=body_shoot_delay[b],
+                                     fan_start_progress=body_fan_start[b], end_lane=body_end_lane[b],
+                                     complexity=body_complexity[b])
+            obj = Slide(time=time, lane=lane, flags=flag, segments=segments, body=body)
+        elif code == _TOUCH:
+            obj = Touch(time=time, lane=lane, flags=flag, x=xs[i], y=ys[i])
+        elif code == _TOUCH_HOLD:
+            obj = TouchHold(time=time, lane=lane, flags=flag, x=xs[i], y=ys[i], duration=durations[i])
+        else:
+            raise ValueError(f"corrupt data: unknown object kind {code}")
+        objects.append(obj)
+
+    return SentakkiBeatmap(star_rating=header["star_rating"], max_combo=header["max_combo"],
+                           approach_rate=header["approach_rate"], objects=objects)
+
+
+__all__ = ['dumps', 'loads', 'MAGIC', 'FORMAT_VERSION']
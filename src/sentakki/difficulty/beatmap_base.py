@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Sequence, Optional
+import os
+from typing import BinaryIO, Sequence, Optional, Union
 
 class SentakkiBeatmap:
     def __init__(self, star_rating: float, max_combo: int, approach_rate: float = 5.0, objects: Optional[Sequence[object]] = None):
@@ -8,4 +9,24 @@ class SentakkiBeatmap:
         self.approach_rate = approach_rate
         self.objects: Sequence[object] = objects or []
 
-__all__ = ["SentakkiBeatmap"]
\ No newline at end of file
+    def save(self, target: Union[str, os.PathLike, BinaryIO]) -> None:
+        """Write the converted beatmap in the compact binary format
+        (see ``sentakki.beatmaps.serialization``) to a path or binary file object."""
+        from ..beatmaps.serialization import dumps
+        data = dumps(self)
+        if hasattr(target, 'write'):
+            target.write(data)
+        else:
+            with open(target, 'wb') as f:
+                f.write(data)
+
+    @classmethod
+    def load(cls, source: Union[str, os.PathLike, BinaryIO]) -> SentakkiBeatmap:
+        """Read a beatmap written by ``save`` without re-running the converter."""
+        from ..beatmaps.serialization import loads
+        if hasattr(source, 'read'):
+            return loads(source.read())
+        with open(source, 'rb') as f:
+            return loads(f.read())
+
+__all__ = ["SentakkiBeatmap"]
@@ -14,7 +14,7 @@ from .difficulty.difficultyCalculator import TauDifficultyCalculator
 from .performance import TauPerformanceCalculator, TauPerformanceAttributes
 
 # 转换器相关
-from .convertor import convert_osu_beatmap
+from .convertor import convert_osu_beatmap, create_tau_beatmap, iter_convert
 
 __all__ = [
     # 基础类
@@ -27,6 +27,7 @@ __all__ = [
     "StrictHardBeat",
     "Slider",
     "PolarSliderPath",
+    "ArrayPolarSliderPath",
     "SliderNode",
     "TauMods",
     
@@ -38,5 +39,7 @@ __all__ = [
     "TauPerformanceAttributes",
     
     # 转换器
-    "convert_osu_beatmap"
+    "convert_osu_beatmap",
+    "create_tau_beatmap",
+    "iter_convert"
 ]
\ No newline at end of file
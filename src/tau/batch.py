@@ -0,0 +1,223 @@
+"""
+批量 Tau 难度计算：解析 + 转换 + TauDifficultyCalculator 分发到进程池
+
+逐张串行处理只能用到一个核心。这里把 .osu 文件按 chunk_size 分块提交给
+ProcessPoolExecutor，每个任务在子进程内完成一整块文件的解析、转换与难度计算，
+只把结果（BatchResult）传回主进程；结果按输入顺序返回，进度按块完成情况回调。
+
+单个文件出错不会中断整批，错误记录在对应结果的 error 中。
+
+用法：
+    results = calculate_batch("Songs/", mods=64, workers=8)
+
+命令行：
+    python -m tau.batch Songs/ --mods 64 --workers 8 --chunk-size 32 > stars.tsv
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, asdict
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+from any.osu_parser import parse_osu_bytes
+from .attributes import TauDifficultyAttributes
+from .convertor import convert_osu_beatmap
+from .difficulty.difficultyCalculator import TauDifficultyCalculator
+
+PathLike = Union[str, os.PathLike]
+
+# 每个任务处理的文件数：太小时进程间通信开销占比高，太大时负载不均、进度更新稀疏
+DEFAULT_CHUNK_SIZE = 16
+
+
+@dataclass
+class BatchResult:
+    """单个文件的计算结果"""
+    path: str
+    attributes: Optional[TauDifficultyAttributes] = None
+    object_count: int = 0          # 转换出的 Tau 物件数
+    failed_objects: int = 0        # 转换失败被跳过的物件数
+    error: Optional[str] = None    # 整个文件失败时的异常描述
+    elapsed: float = 0.0           # 子进程内耗时（秒）
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class BatchProgress:
+    """进度与吞吐量"""
+    done: int
+    total: int
+    objects: int
+    elapsed: float
+
+    @property
+    def maps_per_second(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def objects_per_second(self) -> float:
+        return self.objects / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.done}/{self.total} maps, {self.objects} objects in {self.elapsed:.1f}s "
+                f"({self.maps_per_second:.1f} maps/s, {self.objects_per_second:,.0f} objects/s)")
+
+
+def find_osu_files(sources: Union[PathLike, Iterable[PathLike]], recursive: bool = True) -> List[str]:
+    """
+    展开目录为其中的 .osu 文件
+
+    Args:
+        sources: 单个路径，或路径列表；目录展开为其中的 .osu 文件（按路径排序），文件原样保留
+        recursive: 是否递归子目录
+
+    Returns:
+        文件路径列表，顺序与输入一致
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+    paths: List[str] = []
+    for source in sources:
+        source = os.fspath(source)
+        if not os.path.isdir(source):
+            paths.append(source)
+            continue
+        found = []
+        if recursive:
+            for root, _, names in os.walk(source):
+                found.extend(os.path.join(root, name) for name in names if name.endswith(".osu"))
+        else:
+            found.extend(entry.path for entry in os.scandir(source)
+                         if entry.is_file() and entry.name.endswith(".osu"))
+        paths.extend(sorted(found))
+    return paths
+
+
+def calculate_file(path: PathLike, mods: int = 0, use_numpy: bool = False) -> BatchResult:
+    """
+    解析、转换并计算单个 .osu 文件
+
+    Args:
+        path: .osu 文件路径
+        mods: 应用的mods
+        use_numpy: 滑条采样使用 NumPy 实现
+
+    Returns:
+        BatchResult；出错时 attributes 为 None，error 为异常描述
+    """
+    path = os.fspath(path)
+    start = time.perf_counter()
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        tau_beatmap = convert_osu_beatmap(parse_osu_bytes(data), use_numpy=use_numpy)
+        attributes = TauDifficultyCalculator(tau_beatmap, mods).calculate()
+    except Exception as e:
+        return BatchResult(path, error=f"{type(e).__name__}: {e}", elapsed=time.perf_counter() - start)
+    stats = tau_beatmap.conversion_stats
+    return BatchResult(path, attributes, len(tau_beatmap.hit_objects), stats.failed if stats else 0,
+                       elapsed=time.perf_counter() - start)
+
+
+def _calculate_chunk(paths: Sequence[str], mods: int, use_numpy: bool) -> List[BatchResult]:
+    return [calculate_file(path, mods, use_numpy) for path in paths]
+
+
+def calculate_batch(sources: Union[PathLike, Iterable[PathLike]], mods: int = 0, workers: Optional[int] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE, use_numpy: bool = False,
+                    progress: Optional[Callable[[BatchProgress], None]] = None) -> List[BatchResult]:
+    """
+    并行计算多个 .osu 文件的 Tau 难度
+
+    Args:
+        sources: 目录、文件路径或它们的列表（见 find_osu_files）
+        mods: 应用的mods
+        workers: 进程数，None 为 CPU 核心数；1 表示在当前进程内串行处理
+        chunk_size: 每个任务处理的文件数
+        use_numpy: 滑条采样使用 NumPy 实现
+        progress: 每完成一块调用一次
+
+    Returns:
+        与输入文件顺序一致的 BatchResult 列表
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    paths = find_osu_files(sources)
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    results: List[Optional[List[BatchResult]]] = [None] * len(chunks)
+    start = time.perf_counter()
+    done = objects = 0
+
+    def report(chunk_results: List[BatchResult]):
+        nonlocal done, objects
+        done += len(chunk_results)
+        objects += sum(r.object_count for r in chunk_results)
+        if progress is not None:
+            progress(BatchProgress(done, len(paths), objects, time.perf_counter() - start))
+
+    if workers == 1 or len(chunks) <= 1:
+        for index, chunk in enumerate(chunks):
+            results[index] = _calculate_chunk(chunk, mods, use_numpy)
+            report(results[index])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_calculate_chunk, chunk, mods, use_numpy): index
+                       for index, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                report(results[index])
+
+    return [result for chunk_results in results for result in chunk_results]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """命令行入口：每个文件输出一行结果到 stdout，进度与吞吐量输出到 stderr"""
+    parser = argparse.ArgumentParser(prog="python -m tau.batch",
+                                     description="Batch Tau difficulty calculation for .osu files")
+    parser.add_argument("paths", nargs="+", help=".osu files or directories (searched recursively)")
+    parser.add_argument("--mods", type=int, default=0, help="mods bitmask")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="files per task")
+    parser.add_argument("--numpy", action="store_true", help="use the NumPy slider sampler")
+    parser.add_argument("--json", action="store_true", help="write one JSON object per line")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args(argv)
+
+    def progress(state: BatchProgress):
+        print(f"\r{state}", end="", file=sys.stderr, flush=True)
+
+    start = time.perf_counter()
+    results = calculate_batch(args.paths, args.mods, args.workers, args.chunk_size, args.numpy,
+                              None if args.quiet else progress)
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if args.json:
+            print(json.dumps(result.as_dict(), ensure_ascii=False))
+        elif result.ok:
+            print(f"{result.path}\t{result.attributes.star_rating:.4f}\t{result.attributes.max_combo}")
+        else:
+            print(f"{result.path}\terror\t{result.error}")
+
+    failed = sum(1 for r in results if not r.ok)
+    if not args.quiet:
+        summary = BatchProgress(len(results), len(results), sum(r.object_count for r in results), elapsed)
+        print(f"\r{summary}, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,7 @@ class TauBeatmap:
         }
         self.timing_points: List[Any] = []  # 存储时间点信息
         self.file_version: int = 0  # 文件版本
+        self.conversion_stats = None  # 由 convert_osu_beatmap 设置的转换统计（ConversionStats）
     
     def get_statistics(self) -> List[BeatmapStatistics]:
         """
@@ -79,11 +80,8 @@ class TauBeatmap:
         """
         max_combo = 0
         for obj in self.hit_objects:
-            max_combo += 1
-            # 如果是Slider，增加额外的连击点
-            if isinstance(obj, Slider):
-                # 简化处理，实际应该根据滑条的节点数计算
-                max_combo += obj.repeat_count + 1
+            # Slider 的连击数为嵌套物件（头部、刻度、重复点）数加尾部
+            max_combo += obj.max_combo if isinstance(obj, Slider) else 1
         return max_combo
     
     def __str__(self) -> str:
@@ -2,24 +2,44 @@
 Tau谱面转换器，完全遵循taulazer/tau项目中的TauBeatmapConverter.cs逻辑
 """
 
-from typing import List, Optional, Tuple, Union
+from collections import OrderedDict
+from dataclasses import dataclass, asdict, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from .objects import (
-    TauHitObject, Beat, HardBeat, StrictHardBeat, Slider, PolarSliderPath, SliderNode,
+    TauHitObject, Beat, HardBeat, StrictHardBeat, Slider, PolarSliderPath, ArrayPolarSliderPath, SliderNode,
     HitSampleInfo, from_polar_coordinates, normalize_angle, get_delta_angle, remap
 )
 from . import TauBeatmap
 from any.parser import OsuBeatmap
 from any.models.HitObject import Circle, Slider as OsuSlider, Spinner as OsuSpinner
 from any.models.others import HitSound, Curve, Pos, CurveType
+from common.timing import TimingIndex
+from bisect import bisect_left
+import logging
 import math
+import threading
+
+logger = logging.getLogger(__name__)
 
 # Constants from TaubeatmapConverter.cs
 STANDARD_PLAYFIELD_SIZE = (512, 384)
 STANDARD_PLAYFIELD_CENTER = (STANDARD_PLAYFIELD_SIZE[0] / 2, STANDARD_PLAYFIELD_SIZE[1] / 2)
+_CENTER_X, _CENTER_Y = STANDARD_PLAYFIELD_CENTER
+_atan2 = math.atan2
+_degrees = math.degrees
 
 # Bezier曲线容差常量
 BEZIER_TOLERANCE = 0.25
 
+# 滑条节点采样间隔（毫秒）
+SLIDER_SAMPLE_INTERVAL = 20
+
+# use_numpy 时，采样点数不少于该值才使用 NumPy 实现（短滑条的数组开销高于纯 Python 循环）
+NUMPY_MIN_SAMPLES = 64
+
+# use_numpy 时，Catmull-Rom 控制点多于该值才使用 NumPy 求值
+CATMULL_NUMPY_MIN_POINTS = 4
+
 def difficulty_range(approach_rate: float, min_val: float, mid: float, max_val: float) -> float:
     """Difficulty range calculation, mimicking osu! IBeatmapDifficultyInfo.DifficultyRange function"""
     if approach_rate > 5:
@@ -33,15 +53,16 @@ def get_hit_object_angle(pos) -> float:
     if pos is None:
         return 0.0
     
-    # 计算从中心点到目标点的角度 (模仿Vector2.GetDegreesFromPosition)
-    dx = pos.x - STANDARD_PLAYFIELD_CENTER[0]
-    dy = pos.y - STANDARD_PLAYFIELD_CENTER[1]
-    
-    # 使用atan2计算角度并转换为度数
-    angle = math.degrees(math.atan2(dy, dx))
+    # 计算从中心点到目标点的角度 (模仿Vector2.GetDegreesFromPosition)，
+    # 并偏移90度以匹配C#版本；每个物件与滑条采样点都会调用，这里内联常量与 normalize_angle
+    angle = _degrees(_atan2(pos.y - _CENTER_Y, pos.x - _CENTER_X)) + 90
     
-    # 调整到0-360范围并偏移90度以匹配C#版本
-    return normalize_angle(angle + 90)
+    # 调整到0-360范围
+    if angle < 0:
+        angle += 360
+    if angle >= 360:
+        angle %= 360
+    return angle
 
 def get_curve_position_at(curve: Curve, progress: float) -> Pos:
     """获取曲线在指定进度的位置，模仿osu!的CurvePositionAt方法"""
@@ -117,56 +138,184 @@ def _bezier_curve_position_at(points: List[Pos], progress: float) -> Pos:
     return bezier_points[0]
 
 
-def _bezier_is_flat_enough(points: List[Pos]) -> bool:
-    """检查贝塞尔曲线是否足够平坦"""
-    for i in range(1, len(points) - 1):
-        # 计算二阶导数的近似值（使用有限元素）
-        diff = Pos()
-        diff.x = points[i - 1].x - 2 * points[i].x + points[i + 1].x
-        diff.y = points[i - 1].y - 2 * points[i].y + points[i + 1].y
-        
-        # 检查长度平方是否在容差范围内
-        length_squared = diff.x * diff.x + diff.y * diff.y
-        if length_squared > BEZIER_TOLERANCE * BEZIER_TOLERANCE * 4:
-            return False
-    return True
-
-
-def _bezier_subdivide(points: List[Pos], progress: float) -> Tuple[List[Pos], List[Pos]]:
-    """将贝塞尔曲线细分为两部分"""
-    # 创建中间点数组
-    midpoints = list(points)
-    count = len(points)
-    
-    # 执行细分
-    for i in range(count):
-        for j in range(count - i - 1):
-            mid_point = Pos()
-            mid_point.x = (midpoints[j].x + midpoints[j + 1].x) / 2
-            mid_point.y = (midpoints[j].y + midpoints[j + 1].y) / 2
-            midpoints[j] = mid_point
-    
-    # 构建左右两部分
-    left = [points[0]]
-    right = [midpoints[count - 1]]
-    
-    # 重建细分缓冲区以获取左右控制点
-    subdivision_buffer = list(points)
-    for i in range(count):
-        left.append(midpoints[0] if i < len(midpoints) else Pos())
-        right.insert(0, midpoints[count - i - 1] if count - i - 1 < len(midpoints) else Pos())
-        
-        for j in range(count - i - 1):
-            mid_point = Pos()
-            mid_point.x = (subdivision_buffer[j].x + subdivision_buffer[j + 1].x) / 2
-            mid_point.y = (subdivision_buffer[j].y + subdivision_buffer[j + 1].y) / 2
-            subdivision_buffer[j] = mid_point
-    
-    # 修正左右部分的控制点
-    left = left[:count]
-    right = right[:count]
-    
-    return left, right
+def _flatten_bezier_segment(cxs: List[float], cys: List[float], out_xs: List[float], out_ys: List[float]):
+    """
+    把单段贝塞尔曲线展平为折线，追加到 out_xs / out_ys
+
+    迭代实现 osu-framework PathApproximator.BSplineToPiecewiseLinear（degree = 控制点数 - 1）：
+    用显式栈代替递归，细分缓冲区在整个过程中复用，被展平的曲线缓冲区回收给后续的右半部分。
+    """
+    count = len(cxs)
+    if count < 2:
+        if count:
+            out_xs.append(cxs[0])
+            out_ys.append(cys[0])
+        return
+
+    degree = count - 1
+    tolerance = BEZIER_TOLERANCE * BEZIER_TOLERANCE * 4
+    # subdivision_buffer1: count 个点；subdivision_buffer2: 2 * count - 1 个点（兼作细分的左半部分）
+    buf1_x = [0.0] * count
+    buf1_y = [0.0] * count
+    buf2_x = [0.0] * (2 * count - 1)
+    buf2_y = [0.0] * (2 * count - 1)
+    to_flatten = [(list(cxs), list(cys))]
+    free_buffers = []
+
+    while to_flatten:
+        px, py = to_flatten.pop()
+
+        # bezierIsFlatEnough
+        flat = True
+        for i in range(1, degree):
+            dx = px[i - 1] - 2 * px[i] + px[i + 1]
+            dy = py[i - 1] - 2 * py[i] + py[i + 1]
+            if dx * dx + dy * dy > tolerance:
+                flat = False
+                break
+
+        # bezierSubdivide：flat 时 左 -> buf2、右 -> buf1（与中点缓冲区相同）；否则 左 -> buf2、右 -> 新缓冲区
+        if flat:
+            rx, ry = buf1_x, buf1_y
+        elif free_buffers:
+            rx, ry = free_buffers.pop()
+        else:
+            rx, ry = [0.0] * count, [0.0] * count
+        buf1_x[:] = px
+        buf1_y[:] = py
+        for i in range(count):
+            k = count - i - 1
+            buf2_x[i] = buf1_x[0]
+            buf2_y[i] = buf1_y[0]
+            rx[k] = buf1_x[k]
+            ry[k] = buf1_y[k]
+            for j in range(k):
+                buf1_x[j] = (buf1_x[j] + buf1_x[j + 1]) / 2
+                buf1_y[j] = (buf1_y[j] + buf1_y[j + 1]) / 2
+
+        if flat:
+            # bezierApproximate：左右两半拼成 2 * count - 1 个点，取加权平均作为折线顶点
+            for i in range(count - 1):
+                buf2_x[count + i] = buf1_x[i + 1]
+                buf2_y[count + i] = buf1_y[i + 1]
+            out_xs.append(px[0])
+            out_ys.append(py[0])
+            for i in range(1, count - 1):
+                index = 2 * i
+                out_xs.append(0.25 * (buf2_x[index - 1] + 2 * buf2_x[index] + buf2_x[index + 1]))
+                out_ys.append(0.25 * (buf2_y[index - 1] + 2 * buf2_y[index] + buf2_y[index + 1]))
+            free_buffers.append((px, py))
+            continue
+
+        px[:] = buf2_x[:count]
+        py[:] = buf2_y[:count]
+        to_flatten.append((rx, ry))
+        to_flatten.append((px, py))
+
+    out_xs.append(cxs[-1])
+    out_ys.append(cys[-1])
+
+
+def bezier_to_piecewise_linear(control_points: List[Pos]) -> List[Pos]:
+    """
+    把 osu! 贝塞尔滑条（B 类型）的控制点转换为折线
+
+    与 stable 一致，相邻两个重合的控制点（红色锚点）把曲线分成多段独立的贝塞尔曲线，
+    重合点不参与计算，最后一个控制点不开启新段。各段分别展平后依次拼接，
+    段首与上一段末点相同时跳过（osu! SliderPath.calculatePath）。
+
+    Args:
+        control_points: 控制点（绝对坐标，含滑条头）
+
+    Returns:
+        折线顶点
+    """
+    n = len(control_points)
+    if n == 0:
+        return []
+    out_xs: List[float] = []
+    out_ys: List[float] = []
+    seg_xs: List[float] = []
+    seg_ys: List[float] = []
+    sub_xs: List[float] = []
+    sub_ys: List[float] = []
+
+    def flush():
+        sub_xs.clear()
+        sub_ys.clear()
+        _flatten_bezier_segment(seg_xs, seg_ys, sub_xs, sub_ys)
+        skip_first = bool(out_xs) and out_xs[-1] == sub_xs[0] and out_ys[-1] == sub_ys[0]
+        out_xs.extend(sub_xs[1:] if skip_first else sub_xs)
+        out_ys.extend(sub_ys[1:] if skip_first else sub_ys)
+
+    first = control_points[0]
+    seg_xs.append(float(first.x))
+    seg_ys.append(float(first.y))
+    for i in range(1, n):
+        x = float(control_points[i].x)
+        y = float(control_points[i].y)
+        if x == seg_xs[-1] and y == seg_ys[-1] and i != n - 1:
+            # 红色锚点：结束当前段，新段从锚点开始（重合点本身跳过）
+            if len(seg_xs) > 1:
+                flush()
+                del seg_xs[:-1], seg_ys[:-1]
+            continue
+        seg_xs.append(x)
+        seg_ys.append(y)
+    flush()
+    return [Pos(x, y) for x, y in zip(out_xs, out_ys)]
+
+
+# Catmull-Rom 每段的细分步数（与 osu! 的 catmull_detail 一致）
+CATMULL_DETAIL = 50
+
+# 每个细分步的 (t, t², t³)，所有曲线共用；与逐点计算的 t = c / CATMULL_DETAIL 逐位相同
+_CATMULL_BASIS = tuple((t, t * t, t * (t * t)) for t in (c / CATMULL_DETAIL for c in range(CATMULL_DETAIL + 1)))
+
+
+def _catmull_segment_coefficients(points: List[Pos], i: int) -> Tuple[float, ...]:
+    """第 i 段的三次多项式系数 (ax, bx, cx, dx, ay, by, cy, dy)，运算顺序与 _catmull_find_point 相同"""
+    last = len(points) - 1
+    v1 = points[max(0, i - 1)]
+    v2 = points[i]
+    v3 = points[min(last, i + 1)]
+    v4 = points[min(last, i + 2)]
+    return (2 * v2.x, -v1.x + v3.x, 2 * v1.x - 5 * v2.x + 4 * v3.x - v4.x, -v1.x + 3 * v2.x - 3 * v3.x + v4.x,
+            2 * v2.y, -v1.y + v3.y, 2 * v1.y - 5 * v2.y + 4 * v3.y - v4.y, -v1.y + 3 * v2.y - 3 * v3.y + v4.y)
+
+
+def catmull_rom_coordinates(control_points: List[Pos]) -> Tuple[List[float], List[float]]:
+    """
+    Catmull-Rom 曲线的分段线性近似坐标，模仿PathApproximator.CatmullToPiecewiseLinear
+
+    osu! 的实现每个细分步输出起点和终点两个点，相邻两步的共同端点因此重复出现；
+    这里每段只输出 CATMULL_DETAIL + 1 个点，每个点只计算一次。
+    重复点对应零长度线段，去掉后弧长参数化的路径（CurvePath）与原输出逐位相同。
+    """
+    xs: List[float] = []
+    ys: List[float] = []
+    for i in range(len(control_points) - 1):
+        ax, bx, cx, dx, ay, by, cy, dy = _catmull_segment_coefficients(control_points, i)
+        for t, t2, t3 in _CATMULL_BASIS:
+            xs.append(0.5 * (ax + bx * t + cx * t2 + dx * t3))
+            ys.append(0.5 * (ay + by * t + cy * t2 + dy * t3))
+    return xs, ys
+
+
+def catmull_rom_coordinates_numpy(control_points: List[Pos]) -> Tuple[List[float], List[float]]:
+    """
+    catmull_rom_coordinates 的 NumPy 实现（需要安装 numpy），结果逐位相同
+
+    各段系数与预计算的 (t, t², t³) 表逐元素广播求值（不使用矩阵乘法，避免改变求和顺序）。
+    """
+    import numpy as np
+
+    coefficients = np.array([_catmull_segment_coefficients(control_points, i)
+                             for i in range(len(control_points) - 1)], dtype=float).reshape(-1, 8, 1)
+    t, t2, t3 = np.array(_CATMULL_BASIS, dtype=float).T
+    xs = 0.5 * (coefficients[:, 0] + coefficients[:, 1] * t + coefficients[:, 2] * t2 + coefficients[:, 3] * t3)
+    ys = 0.5 * (coefficients[:, 4] + coefficients[:, 5] * t + coefficients[:, 6] * t2 + coefficients[:, 7] * t3)
+    return xs.ravel().tolist(), ys.ravel().tolist()
 
 
 def _catmull_rom_curve_position_at(points: List[Pos], progress: float) -> Pos:
@@ -174,31 +323,15 @@ def _catmull_rom_curve_position_at(points: List[Pos], progress: float) -> Pos:
     if len(points) < 2:
         return points[0] if points else Pos()
     
-    # Catmull-Rom细节参数
-    catmull_detail = 50
-    
-    # 对于Catmull-Rom曲线，我们创建分段线性近似
-    result_points = []
-    for i in range(len(points) - 1):
-        v1 = points[max(0, i - 1)]
-        v2 = points[i]
-        v3 = points[min(len(points) - 1, i + 1)]
-        v4 = points[min(len(points) - 1, i + 2)]
-        
-        for c in range(catmull_detail):
-            # 计算当前点和下一个点
-            p1 = _catmull_find_point(v1, v2, v3, v4, c / catmull_detail)
-            p2 = _catmull_find_point(v1, v2, v3, v4, (c + 1) / catmull_detail)
-            result_points.extend([p1, p2])
-    
-    # 在结果点中找到对应进度的点
-    if not result_points:
-        return _linear_curve_position_at(points, progress)
-    
-    target_index = int(progress * (len(result_points) - 1))
-    target_index = max(0, min(target_index, len(result_points) - 1))
-    
-    return result_points[target_index]
+    # 取 osu! 形式的近似结果（每个细分步输出起点、终点两个点）中第 target_index 个点，
+    # 直接定位到所在段与细分步计算这一个点，不构造整条近似折线
+    count = (len(points) - 1) * CATMULL_DETAIL * 2
+    target_index = int(progress * (count - 1))
+    target_index = max(0, min(target_index, count - 1))
+    segment, offset = divmod(target_index, CATMULL_DETAIL * 2)
+    ax, bx, cx, dx, ay, by, cy, dy = _catmull_segment_coefficients(points, segment)
+    t, t2, t3 = _CATMULL_BASIS[offset // 2 + offset % 2]
+    return Pos(0.5 * (ax + bx * t + cx * t2 + dx * t3), 0.5 * (ay + by * t + cy * t2 + dy * t3))
 
 
 def _catmull_find_point(vec1: Pos, vec2: Pos, vec3: Pos, vec4: Pos, t: float) -> Pos:
@@ -363,43 +496,445 @@ def _interpolate_curve_points(points: List[Pos], progress: float) -> Pos:
     
     return result
 
+@dataclass
+class CurveCacheStats:
+    """曲线近似缓存统计"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        result = asdict(self)
+        result['hit_rate'] = self.hit_rate
+        return result
+
+
+class CurveApproximationCache:
+    """
+    曲线近似结果的有界 LRU 缓存（线程安全）
+
+    同一谱面集的不同难度、重传 / 改编的谱面经常含有完全相同的滑条控制点序列。
+    以 (曲线类型, 控制点坐标元组) 为键缓存近似后的折线，值为不可变的 (xs, ys) 坐标元组，
+    可安全地在多个滑条、多个转换器之间共享。
+
+    Args:
+        max_entries: 最多保留的曲线数
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.stats = CurveCacheStats()
+        self._entries: "OrderedDict[tuple, Tuple[Tuple[float, ...], Tuple[float, ...]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, compute: Callable[[], List[Pos]]) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """
+        获取曲线近似结果，未命中时调用 compute() 计算并缓存
+
+        Args:
+            key: (曲线类型, 控制点坐标元组)
+            compute: 返回近似折线顶点的函数
+
+        Returns:
+            (xs, ys) 不可变坐标元组
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return value
+        points = compute()
+        value = (tuple(float(p.x) for p in points), tuple(float(p.y) for p in points))
+        with self._lock:
+            self.stats.misses += 1
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+            self.stats.entries = len(self._entries)
+        return value
+
+    def clear(self):
+        """清空缓存与统计"""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CurveCacheStats()
+
+
+# 进程内共享的默认曲线近似缓存
+CURVE_CACHE = CurveApproximationCache()
+
+
+class CurvePath:
+    """
+    按弧长参数化的滑条路径，模仿 osu! SliderPath 的 calculateLength / PositionAt
+
+    构造时对近似后的曲线点只计算一次累计长度表；给定 expected_distance（谱面中的滑条长度）时，
+    与 osu! 一样把路径截断或沿最后一段延长到该长度。position_at(progress) 把进度换算为距离后
+    在累计长度表上二分查找，因此采样沿路径均匀分布，每次查询 O(log n)。
+    """
+    __slots__ = ('xs', 'ys', 'cumulative_length', 'distance', '_arrays')
+
+    def __init__(self, points: List[Pos], expected_distance: Optional[float] = None):
+        self._setup([float(p.x) for p in points], [float(p.y) for p in points], expected_distance)
+
+    @classmethod
+    def from_coordinates(cls, xs, ys, expected_distance: Optional[float] = None) -> 'CurvePath':
+        """由坐标序列（如 CurveApproximationCache 返回的不可变元组）构造，不修改输入"""
+        path = cls.__new__(cls)
+        path._setup([float(x) for x in xs], [float(y) for y in ys], expected_distance)
+        return path
+
+    def _setup(self, xs: List[float], ys: List[float], expected_distance: Optional[float]):
+        cumulative = [0.0]
+        length = 0.0
+        for i in range(len(xs) - 1):
+            length += math.hypot(xs[i + 1] - xs[i], ys[i + 1] - ys[i])
+            cumulative.append(length)
+
+        if expected_distance is not None and length != expected_distance and xs:
+            if (len(xs) >= 2 and xs[-1] == xs[-2] and ys[-1] == ys[-2]
+                    and expected_distance > length):
+                # 末尾两点重合时无法确定延长方向，保持原长度
+                pass
+            else:
+                cumulative.pop()
+                end = len(xs) - 1
+                if length > expected_distance:
+                    # 去掉累计长度已达到 expected_distance 的所有尾部点（累计长度单调，二分定位）
+                    end = bisect_left(cumulative, expected_distance)
+                    del cumulative[end:]
+                    del xs[end + 1:], ys[end + 1:]
+                if end <= 0:
+                    cumulative.append(0.0)
+                    del xs[1:], ys[1:]
+                else:
+                    dx = xs[end] - xs[end - 1]
+                    dy = ys[end] - ys[end - 1]
+                    norm = math.hypot(dx, dy)
+                    remaining = expected_distance - cumulative[-1]
+                    if norm > 0:
+                        xs[end] = xs[end - 1] + dx / norm * remaining
+                        ys[end] = ys[end - 1] + dy / norm * remaining
+                    cumulative.append(expected_distance)
+                length = cumulative[-1]
+
+        self.xs = xs
+        self.ys = ys
+        self.cumulative_length = cumulative
+        self.distance = length
+        self._arrays = None
+
+    def position_at(self, progress: float) -> Pos:
+        """
+        获取路径在指定进度（0-1，按弧长）处的位置
+
+        Args:
+            progress: 进度，超出范围时截断
+
+        Returns:
+            Pos
+        """
+        xs = self.xs
+        if not xs:
+            return Pos()
+        if progress <= 0:
+            d = 0.0
+        elif progress >= 1:
+            d = self.distance
+        else:
+            d = progress * self.distance
+        cumulative = self.cumulative_length
+        i = bisect_left(cumulative, d)
+        if i <= 0:
+            return Pos(xs[0], self.ys[0])
+        if i >= len(xs):
+            return Pos(xs[-1], self.ys[-1])
+        d0 = cumulative[i - 1]
+        d1 = cumulative[i]
+        if d1 - d0 <= 1e-7:
+            return Pos(xs[i - 1], self.ys[i - 1])
+        w = (d - d0) / (d1 - d0)
+        ys = self.ys
+        return Pos(xs[i - 1] + (xs[i] - xs[i - 1]) * w, ys[i - 1] + (ys[i] - ys[i - 1]) * w)
+
+    @property
+    def end_position(self) -> Pos:
+        """路径终点（即 position_at(1.0)）"""
+        if not self.xs:
+            return Pos()
+        return Pos(self.xs[-1], self.ys[-1])
+
+    def positions_at(self, progress):
+        """
+        position_at 的 NumPy 向量化版本，逐元素结果与 position_at 完全相同（需要安装 numpy）
+
+        Args:
+            progress: 进度数组
+
+        Returns:
+            (xs, ys) 两个 numpy.ndarray
+        """
+        import numpy as np
+
+        if self._arrays is None:
+            self._arrays = (np.array(self.xs, dtype=float), np.array(self.ys, dtype=float),
+                            np.array(self.cumulative_length, dtype=float))
+        xs, ys, cumulative = self._arrays
+        n = len(xs)
+        progress = np.asarray(progress, dtype=float)
+        if n < 2:
+            x = xs[0] if n else 0.0
+            y = ys[0] if n else 0.0
+            return np.full(progress.shape, x, dtype=float), np.full(progress.shape, y, dtype=float)
+
+        d = np.where(progress <= 0, 0.0, np.where(progress >= 1, self.distance, progress * self.distance))
+        i = np.searchsorted(cumulative, d, side='left')
+        j = np.clip(i, 1, n - 1)
+        x0 = xs[j - 1]; y0 = ys[j - 1]
+        d0 = cumulative[j - 1]
+        span = cumulative[j] - d0
+        degenerate = span <= 1e-7
+        w = (d - d0) / np.where(degenerate, 1.0, span)
+        rx = x0 + (xs[j] - x0) * w
+        ry = y0 + (ys[j] - y0) * w
+        # 与 position_at 的边界分支一致
+        rx = np.where(degenerate, x0, rx)
+        ry = np.where(degenerate, y0, ry)
+        rx = np.where(i <= 0, xs[0], np.where(i >= n, xs[-1], rx))
+        ry = np.where(i <= 0, ys[0], np.where(i >= n, ys[-1], ry))
+        return rx, ry
+
+
+class AngleTable:
+    """
+    游戏区域整数坐标的物件角度预计算表（需要安装 numpy），供 NumPy 滑条采样使用
+
+    覆盖 [0, 512] x [0, 384] 的全部整数坐标，表项由 get_hit_object_angle 计算，逐位相同。
+    angles() 对整数坐标直接查表；曲线近似产生的浮点坐标在所在格子的四个表项之间双线性插值
+    （跨越 0/360 的格子先展开再插值）。插值误差随离中心的距离迅速减小，
+    离中心不足 exact_radius 或落在表外的浮点坐标改用 arctan2 直接计算。
+    默认 exact_radius=32 时误差约 0.007 度，不超过 MAX_INTERPOLATION_ERROR。
+
+    逐点查表在 CPython 中并不比 math.atan2 快，因此纯 Python 采样不使用该表；
+    它替代的是 NumPy 采样中逐元素的 math.atan2。
+    """
+
+    # exact_radius=32 时双线性插值的角度误差上限（度）
+    MAX_INTERPOLATION_ERROR = 0.01
+
+    def __init__(self, exact_radius: float = 32.0):
+        """
+        Args:
+            exact_radius: 离中心小于该距离的浮点坐标不插值，直接用 arctan2 计算
+        """
+        import numpy as np
+
+        self.exact_radius = exact_radius
+        self.width = STANDARD_PLAYFIELD_SIZE[0] + 1
+        self.height = STANDARD_PLAYFIELD_SIZE[1] + 1
+        self.table = np.fromiter(
+            (get_hit_object_angle(Pos(x, y)) for y in range(self.height) for x in range(self.width)),
+            dtype=float, count=self.width * self.height)
+
+    def angles(self, xs, ys):
+        """
+        批量计算物件角度
+
+        Args:
+            xs, ys: 坐标数组
+
+        Returns:
+            numpy.ndarray，整数坐标处与 get_hit_object_angle 逐位相同，其余为插值近似
+        """
+        import numpy as np
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        width = self.width
+        table = self.table
+        inside = (xs >= 0) & (xs <= width - 1) & (ys >= 0) & (ys <= self.height - 1)
+        ix = np.clip(np.floor(np.where(inside, xs, 0.0)).astype(np.intp), 0, width - 2)
+        iy = np.clip(np.floor(np.where(inside, ys, 0.0)).astype(np.intp), 0, self.height - 2)
+        fx = np.where(inside, xs - ix, 0.0)
+        fy = np.where(inside, ys - iy, 0.0)
+        index = iy * width + ix
+        a = table[index]
+        # 相邻表项与 a 相差超过 180 度时说明跨越了 0/360，展开到 a 附近
+        b = table[index + 1]
+        c = table[index + width]
+        d = table[index + width + 1]
+        b = np.where(np.abs(b - a) > 180, a + np.mod(b - a + 180, 360) - 180, b)
+        c = np.where(np.abs(c - a) > 180, a + np.mod(c - a + 180, 360) - 180, c)
+        d = np.where(np.abs(d - a) > 180, a + np.mod(d - a + 180, 360) - 180, d)
+        angles = (a * (1 - fx) + b * fx) * (1 - fy) + (c * (1 - fx) + d * fx) * fy
+        angles = np.where((angles < 0) | (angles >= 360), np.mod(angles, 360), angles)
+
+        dx = xs - _CENTER_X
+        dy = ys - _CENTER_Y
+        exact = ~inside | ((dx * dx + dy * dy < self.exact_radius * self.exact_radius)
+                           & ((fx != 0) | (fy != 0)))
+        if np.any(exact):
+            direct = np.degrees(np.arctan2(dy[exact], dx[exact])) + 90
+            angles[exact] = np.mod(direct, 360)
+        return angles
+
+
+@dataclass(frozen=True)
+class AdaptiveSampling:
+    """
+    自适应滑条采样：在 SLIDER_SAMPLE_INTERVAL 固定步长采样的结果上只保留角度变化显著的节点
+
+    不可能滑条检查仍在完整采样上进行，判定与固定步长完全相同。简化时保留：
+    - 首尾节点（路径持续时间不变）
+    - 自上一个保留节点起角度变化即将超过 angle_tolerance 时的节点
+    - 旋转方向反转的拐点（去掉会使 distance 偏小）
+    - calculate_lazy_distance(lazy_half_tolerance) 即将偏离完整采样超过 error_bound 时的节点
+    相邻保留节点之间角度单调且变化不超过 angle_tolerance，因此 calculated_distance 与完整采样
+    只有浮点舍入差异，按时间插值的角度误差不超过 angle_tolerance。
+    lazy distance 与节点密度有关（每个超出容差的节点都计入一次），lazy_half_tolerance 应与
+    难度计算中 angle_range / 2 一致（转换出的物件 angle_range 为 0）。
+    简化结果最后再整体校验一次，两项距离任一偏差超过 error_bound 时保留完整节点。
+    """
+    angle_tolerance: float = 5.0      # 度，需小于 180
+    error_bound: float = 0.5          # 度，distance 与 lazy distance 的最大允许偏差
+    lazy_half_tolerance: float = 0.0
+
+    def __post_init__(self):
+        if not 0 < self.angle_tolerance < 180:
+            raise ValueError("angle_tolerance must be in (0, 180)")
+        if self.error_bound < 0:
+            raise ValueError("error_bound must not be negative")
+
+    def simplify(self, nodes: List[SliderNode]) -> List[SliderNode]:
+        """
+        简化按时间排序的滑条节点
+
+        Args:
+            nodes: 固定步长采样得到的节点（含最终节点）
+
+        Returns:
+            保留的节点列表（原 SliderNode 对象）；无法满足误差要求时返回 nodes 本身
+        """
+        if len(nodes) <= 2:
+            return nodes
+        tolerance = self.angle_tolerance
+        half = self.lazy_half_tolerance
+        bound = self.error_bound
+
+        first = nodes[0]
+        kept = [first]
+        anchor = first.angle
+        direction = 0.0  # 自上一个保留节点起的旋转方向
+        # 完整节点与保留节点的 lazy distance，逐节点累计（与 calculate_lazy_distance 的运算顺序相同）
+        full_cursor = reduced_cursor = first.angle
+        full_lazy = reduced_lazy = 0.0
+        full_distance = 0.0
+        prev = first
+        for node in nodes[1:]:
+            angle = node.angle
+            step = get_delta_angle(angle, prev.angle)
+            full_distance += abs(step)
+            delta = get_delta_angle(angle, full_cursor)
+            if abs(delta) > half:
+                full_cursor += delta - (half if delta > 0 else -half)
+                full_lazy += abs(delta)
+
+            if prev is not kept[-1]:
+                reversed_direction = step * direction < 0
+                exceeded = abs(get_delta_angle(angle, anchor)) > tolerance
+                delta = get_delta_angle(angle, reduced_cursor)
+                candidate_lazy = reduced_lazy + abs(delta) if abs(delta) > half else reduced_lazy
+                if reversed_direction or exceeded or abs(candidate_lazy - full_lazy) > bound:
+                    kept.append(prev)
+                    anchor = prev.angle
+                    direction = 0.0
+                    delta = get_delta_angle(anchor, reduced_cursor)
+                    if abs(delta) > half:
+                        reduced_cursor += delta - (half if delta > 0 else -half)
+                        reduced_lazy += abs(delta)
+            if step and not direction:
+                direction = step
+            prev = node
+        kept.append(prev)
+
+        if len(kept) < len(nodes):
+            # 完整节点的两项距离已在循环中按相同运算顺序累计，只需计算保留节点的
+            reduced_distance, reduced_lazy = PolarSliderPath(kept).calculate_distances(half)
+            if abs(full_distance - reduced_distance) > bound or abs(full_lazy - reduced_lazy) > bound:
+                return nodes
+        return kept
+
+
+# ConversionStats.failures 最多记录的失败物件数（按类型的计数不受限制）
+MAX_RECORDED_FAILURES = 20
+
+
+@dataclass
+class ConversionStats:
+    """单张谱面的转换统计"""
+    converted: int = 0
+    failed: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)            # 异常类型名 -> 次数
+    failures: List[Tuple[int, float, str]] = field(default_factory=list)  # (物件下标, 时间, 异常描述)
+
+    def record_failure(self, index: int, time: float, error: Exception):
+        name = type(error).__name__
+        self.failed += 1
+        self.errors[name] = self.errors.get(name, 0) + 1
+        if len(self.failures) < MAX_RECORDED_FAILURES:
+            self.failures.append((index, time, f"{name}: {error}"))
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
 class TauBeatmapConverter:
+    # 按 osu! 物件类型分派的转换方法，模仿原版 ConvertHitObject 的 switch 表达式；
+    # 未列出的类型（Circle 等）按 convertToNonSlider 处理
+    _CONVERTERS = {
+        OsuSlider: 'convert_to_slider',
+        OsuSpinner: 'convert_slider_spinner',
+    }
+    # 物件类型 -> 方法名，子类等未登记的类型在首次遇到时解析并缓存；存方法名而非绑定方法，
+    # 与 any.osu_parser 的章节分派表一样避免转换器实例与自身形成引用环。各转换器类各有一份
+    _dispatch: Dict[type, str] = dict(_CONVERTERS)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = dict(cls._CONVERTERS)
+
     def _approximate_bezier_curve(self, control_points: List[Pos]) -> List[Pos]:
-        """使用递归细分近似贝塞尔曲线"""
-        # 直接使用PathApproximator的BezierToPiecewiseLinear方法
-        return self._bezier_to_piecewise_linear(control_points)
+        """近似贝塞尔滑条（按红色锚点分段）"""
+        return bezier_to_piecewise_linear(control_points)
     
     def _bezier_to_piecewise_linear(self, control_points: List[Pos]) -> List[Pos]:
-        """将贝塞尔曲线转换为分段线性曲线"""
-        # 这里简化实现，实际应该使用递归细分算法
-        if len(control_points) < 2:
-            return control_points
-        
-        # 如果曲线已经足够平坦，直接返回
-        if _bezier_is_flat_enough(control_points):
-            return control_points
-        
-        # 细分曲线并递归处理
-        left, right = _bezier_subdivide(control_points, 0.5)
-        
-        # 递归处理左右两部分
-        left_points = self._bezier_to_piecewise_linear(left[:-1])  # 去除重复点
-        right_points = self._bezier_to_piecewise_linear(right)
-        
-        # 合并结果
-        return left_points + right_points
+        """将单段贝塞尔曲线转换为分段线性曲线，模仿PathApproximator.BezierToPiecewiseLinear"""
+        out_xs: List[float] = []
+        out_ys: List[float] = []
+        _flatten_bezier_segment([float(p.x) for p in control_points], [float(p.y) for p in control_points],
+                                out_xs, out_ys)
+        return [Pos(x, y) for x, y in zip(out_xs, out_ys)]
     
     def _approximate_circular_arc(self, control_points: List[Pos]) -> List[Pos]:
         """近似圆形弧线"""
         if len(control_points) != 3:
             # 退化为贝塞尔曲线
-            return self._approximate_bezier_curve(control_points)
+            return self._bezier_to_piecewise_linear(control_points)
         
         # 计算圆弧属性
         arc_props = _circular_arc_properties(control_points)
         if not arc_props["is_valid"]:
             # 退化为贝塞尔曲线
-            return self._approximate_bezier_curve(control_points)
+            return self._bezier_to_piecewise_linear(control_points)
         
         # 圆弧容差
         circular_arc_tolerance = 0.1
@@ -428,34 +963,42 @@ class TauBeatmapConverter:
         return points
     
     def _approximate_catmull_rom(self, control_points: List[Pos]) -> List[Pos]:
-        """近似Catmull-Rom曲线"""
+        """近似Catmull-Rom曲线（每个点只输出一次，见 catmull_rom_coordinates）"""
         if len(control_points) < 2:
             return control_points
         
-        # Catmull-Rom细节参数
-        catmull_detail = 50
-        
-        # 对于Catmull-Rom曲线，我们创建分段线性近似
-        result_points = []
-        for i in range(len(control_points) - 1):
-            v1 = control_points[max(0, i - 1)]
-            v2 = control_points[i]
-            v3 = control_points[min(len(control_points) - 1, i + 1)]
-            v4 = control_points[min(len(control_points) - 1, i + 2)]
-            
-            for c in range(catmull_detail):
-                # 计算当前点和下一个点
-                p1 = _catmull_find_point(v1, v2, v3, v4, c / catmull_detail)
-                p2 = _catmull_find_point(v1, v2, v3, v4, (c + 1) / catmull_detail)
-                result_points.extend([p1, p2])
-        
-        return result_points
+        if self.use_numpy and len(control_points) > CATMULL_NUMPY_MIN_POINTS:
+            xs, ys = catmull_rom_coordinates_numpy(control_points)
+        else:
+            xs, ys = catmull_rom_coordinates(control_points)
+        return [Pos(x, y) for x, y in zip(xs, ys)]
 
     def _interpolate_curve_points(self, points: List[Pos], progress: float) -> Pos:
         """实例方法包装，调用模块级的插值函数，以便兼容代码中对实例方法的调用"""
         return _interpolate_curve_points(points, progress)
     
-    def __init__(self):
+    def __init__(self, *, use_numpy: bool = False, curve_cache: Optional[CurveApproximationCache] = CURVE_CACHE,
+                 angle_table: Optional[AngleTable] = None, adaptive_sampling: Optional[AdaptiveSampling] = None,
+                 array_paths: bool = False):
+        """
+        Args:
+            use_numpy: 为 True 时滑条采样使用 NumPy 向量化实现（需要安装 numpy），结果与默认实现相同
+            curve_cache: 曲线近似缓存，默认使用进程内共享的 CURVE_CACHE；None 表示不缓存
+            angle_table: NumPy 滑条采样用查表插值代替逐点 atan2（需要 use_numpy=True）；
+                         角度为近似值，误差见 AngleTable
+            adaptive_sampling: 滑条节点自适应简化参数，None 表示保留全部 20ms 采样节点
+            array_paths: 为 True 时滑条路径使用数组存储的 ArrayPolarSliderPath
+        """
+        self.curve_cache = curve_cache
+        self._timing: Optional[Tuple[Any, TimingIndex]] = None  # (谱面, 时间点索引)，见 _timing_index
+        if use_numpy:
+            import numpy  # noqa: F401  缺少 numpy 时在构造时报错，而不是在逐个物件转换时被吞掉
+        elif angle_table is not None:
+            raise ValueError("angle_table requires use_numpy=True")
+        self.use_numpy = use_numpy
+        self.angle_table = angle_table
+        self.adaptive_sampling = adaptive_sampling
+        self.array_paths = array_paths
         self.can_convert_to_hard_beats = True
         self.hard_beats_are_strict = False
         self.can_convert_to_sliders = True
@@ -464,6 +1007,40 @@ class TauBeatmapConverter:
         self.locked_direction = None  # None, "clockwise", or "counterclockwise"
         self.last_locked_angle = None
 
+    @classmethod
+    def _resolve_converter(cls, obj_type: type) -> str:
+        """未登记物件类型的转换方法名（按 _CONVERTERS 的基类匹配），结果缓存在类上"""
+        for base, name in cls._CONVERTERS.items():
+            if issubclass(obj_type, base):
+                break
+        else:
+            name = 'convert_to_non_slider'
+        cls._dispatch[obj_type] = name
+        return name
+
+    def _timing_index(self, beatmap) -> TimingIndex:
+        """
+        beatmap 的时间点索引，同一转换器对同一谱面只构建一次
+
+        缓存的是谱面对象本身（用 is 比较），不依赖 id()。转换器对应一次转换：iter_convert、
+        convert_object 每次都创建新的转换器，两次转换之间对时间点的修改因此总会生效。
+        """
+        timing = self._timing
+        if timing is None or timing[0] is not beatmap:
+            timing = self._timing = (beatmap, TimingIndex.from_beatmap(beatmap))
+        return timing[1]
+
+    def convert(self, obj, beatmap=None) -> Union[Beat, HardBeat, StrictHardBeat, Slider]:
+        """
+        转换单个物件，模仿ConvertHitObject主逻辑
+
+        同一转换器依次转换整张谱面时，方向锁定状态（last_locked_angle）在物件之间延续，与原版一致。
+        """
+        name = self._dispatch.get(type(obj))
+        if name is None:
+            name = self._resolve_converter(type(obj))
+        return getattr(self, name)(obj, beatmap)
+
     def next_angle(self, target: float) -> float:
         """计算下一个角度，考虑旋转方向锁定，模仿原版nextAngle方法"""
         if self.last_locked_angle is None or self.locked_direction is None:
@@ -483,6 +1060,170 @@ class TauBeatmapConverter:
         self.last_locked_angle = self.last_locked_angle - diff
         return self.last_locked_angle
 
+    @staticmethod
+    def _curve_kind(curve_type, point_count: int) -> str:
+        """按曲线类型与控制点数选择近似方法：'L' / 'B' / 'P' / 'C'（'L' 表示直接使用控制点）"""
+        if (curve_type in ["L", CurveType.linear] or curve_type == CurveType.linear) and point_count >= 2:
+            return 'L'
+        elif (curve_type in ["B", CurveType.Bezier] or curve_type == CurveType.Bezier) and point_count >= 2:
+            return 'B'
+        elif (curve_type in ["P", CurveType.perfrct] or curve_type == CurveType.perfrct) and point_count == 3:
+            return 'P'
+        elif (curve_type in ["C", CurveType.Catmull_rom] or curve_type == CurveType.Catmull_rom) and point_count >= 2:
+            return 'C'
+        # 默认使用线性近似
+        return 'L'
+
+    def _approximate_points(self, kind: str, control_points: List[Pos]) -> List[Pos]:
+        if kind == 'B':
+            # 使用Bezier曲线近似
+            return self._approximate_bezier_curve(control_points)
+        if kind == 'P':
+            # 使用圆形弧线近似
+            return self._approximate_circular_arc(control_points)
+        if kind == 'C':
+            # 使用Catmull-Rom曲线近似
+            return self._approximate_catmull_rom(control_points)
+        return control_points
+
+    def _approximate_curve(self, curve: Curve) -> List[Pos]:
+        """根据曲线类型选择近似方法，得到分段线性的曲线点"""
+        # 注意：这里的控制点已经是绝对坐标，不需要再加上obj.pos
+        control_points = curve.control_points
+        return self._approximate_points(self._curve_kind(curve.type, len(control_points)), control_points)
+
+    def _approximate_curve_coordinates(self, curve: Curve) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """
+        _approximate_curve 的带缓存版本
+
+        Returns:
+            (xs, ys) 不可变坐标元组；curve_cache 不为 None 时在各转换器之间共享
+        """
+        control_points = curve.control_points
+        kind = self._curve_kind(curve.type, len(control_points))
+        cache = self.curve_cache
+        if kind == 'L' or cache is None:
+            points = self._approximate_points(kind, control_points)
+            return tuple(float(p.x) for p in points), tuple(float(p.y) for p in points)
+        key = (kind, tuple((p.x, p.y) for p in control_points))
+        return cache.get(key, lambda: self._approximate_points(kind, control_points))
+
+    def _curve_path(self, obj) -> Optional[CurvePath]:
+        """
+        构建滑条的弧长参数化路径
+
+        曲线近似结果按控制点经由 curve_cache 在各次调用之间共享，路径本身不缓存。
+
+        Args:
+            obj: osu 滑条物件
+
+        Returns:
+            CurvePath；物件没有控制点时返回 None
+        """
+        curve = getattr(obj, 'curves', None)
+        if not curve or not curve.control_points:
+            return None
+        length = getattr(obj, 'length', None)
+        # 与 osu! 一致：长度不为正时不限制路径长度
+        expected_distance = float(length) if length and length > 0 else None
+        return CurvePath.from_coordinates(*self._approximate_curve_coordinates(curve), expected_distance)
+
+    def _sample_slider(self, path: Optional[CurvePath], duration: float):
+        """
+        按 SLIDER_SAMPLE_INTERVAL 沿路径采样滑条节点（纯 Python 实现）
+
+        Args:
+            path: 滑条路径，None 时所有节点角度为 0
+            duration: 滑条持续时间
+
+        Returns:
+            (节点时间列表, 节点角度列表, 起始角度, 最后节点角度, 最后节点时间)；
+            角度变化过快（不允许不可能滑条时）返回 None
+        """
+        times = []
+        angles = []
+        last_angle = None
+        last_time = None
+        first_angle = 0.0
+        t = 0
+        while t < duration:
+            # 计算当前点的角度
+            angle = 0
+            if path is not None:
+                # 按弧长进度取路径上的点
+                progress = t / duration if duration > 0 else 0
+                curve_pos = path.position_at(progress)
+                
+                # 计算曲线点的角度
+                angle = self.next_angle(get_hit_object_angle(curve_pos))
+            
+            if t == 0:
+                first_angle = angle
+            
+            # 计算相对于起始角度的差值
+            angle = get_delta_angle(angle, first_angle)
+            
+            # 检查是否转换太快
+            if not self.can_convert_impossible_sliders and last_angle is not None:
+                angle_diff = get_delta_angle(last_angle, angle)
+                time_diff = abs(last_time - t) if last_time is not None else 1
+                if time_diff > 0 and abs(angle_diff) / time_diff > 0.6:
+                    return None
+            
+            last_angle = angle
+            last_time = t
+            times.append(t)
+            angles.append(angle)
+            t += SLIDER_SAMPLE_INTERVAL
+        return times, angles, first_angle, last_angle, last_time
+
+    def _sample_slider_numpy(self, path: CurvePath, duration: float):
+        """
+        _sample_slider 的 NumPy 实现，结果与纯 Python 实现逐位相同（使用 angle_table 时角度为近似值）
+
+        采样时间、位置、角度与相对角度、速度检查都以数组一次算出；
+        atan2 逐元素使用 math.atan2（NumPy 的 SIMD arctan2 与 libm 在最后一位上可能不同）。
+        方向锁定（locked_direction）依赖上一个输出，无法向量化，仍按顺序应用于角度数组。
+        """
+        import numpy as np
+
+        count = int(duration // SLIDER_SAMPLE_INTERVAL) + 1
+        while count > 0 and (count - 1) * SLIDER_SAMPLE_INTERVAL >= duration:
+            count -= 1
+        if count == 0:
+            return [], [], 0.0, None, None
+        times = np.arange(count, dtype=np.int64) * SLIDER_SAMPLE_INTERVAL
+        xs, ys = path.positions_at(times / duration)
+
+        # get_hit_object_angle
+        if self.angle_table is not None:
+            angles = self.angle_table.angles(xs, ys)
+        else:
+            dx = (xs - STANDARD_PLAYFIELD_CENTER[0]).tolist()
+            dy = (ys - STANDARD_PLAYFIELD_CENTER[1]).tolist()
+            angles = np.degrees(np.fromiter(map(math.atan2, dy, dx), dtype=float, count=count)) + 90
+            angles = np.where(angles < 0, angles + 360, angles)
+            angles = np.where(angles >= 360, np.mod(angles, 360), angles)
+
+        # next_angle
+        if self.locked_direction is None:
+            self.last_locked_angle = float(angles[-1])
+        else:
+            next_angle = self.next_angle
+            angles = np.array([next_angle(a) for a in angles.tolist()], dtype=float)
+
+        first_angle = float(angles[0])
+        relative = np.mod(angles - first_angle + 180, 360) - 180
+
+        if not self.can_convert_impossible_sliders and count > 1:
+            steps = np.mod(relative[:-1] - relative[1:] + 180, 360) - 180
+            if np.any(np.abs(steps) / SLIDER_SAMPLE_INTERVAL > 0.6):
+                return None
+
+        relative = relative.tolist()
+        times = times.tolist()
+        return times, relative, first_angle, relative[-1], times[-1]
+
     def convert_to_slider(self, obj: OsuSlider, beatmap=None) -> Union[Slider, Beat, HardBeat, StrictHardBeat]:
         """转换滑条物件，严格按照convertToSlider逻辑"""
         start_locked_angle = self.last_locked_angle
@@ -505,15 +1246,10 @@ class TauBeatmapConverter:
         if beatmap and hasattr(beatmap, 'slider_multiplier') and hasattr(obj, 'length'):
             # 计算滑条持续时间
             slider_multiplier = getattr(beatmap, 'slider_multiplier', 1.0)
-            beat_length = 1000  # 默认节拍长度
             slider_velocity = 100 * slider_multiplier
             
-            # 查找最近的timing point
-            if hasattr(beatmap, 'timing_points'):
-                for tp in beatmap.timing_points:
-                    if tp.start_time <= obj.time and tp.uninherited:
-                        beat_length = abs(float(tp.beat_length))
-                        break
+            # 查找当前生效的timing point，默认节拍长度1000
+            beat_length = self._timing_index(beatmap).beat_length_at(obj.time, 1000)
             
             # 根据osu!公式计算持续时间: duration = length / (slider_multiplier * 100) * beat_length
             if slider_velocity > 0:
@@ -522,72 +1258,23 @@ class TauBeatmapConverter:
         if duration < min_duration:
             return convert_to_non_slider()
         
-        nodes = []
-        last_angle = None
-        last_time = None
-        first_angle = 0.0
-        
-        # 使用PathApproximator方法创建分段线性近似
-        # 根据曲线类型选择适当的近似方法
-        curve_points = []
-        if hasattr(obj, 'curves') and obj.curves and obj.curves.control_points:
-            curve_type = obj.curves.type
-            # 注意：这里的控制点已经是绝对坐标，不需要再加上obj.pos
-            control_points = obj.curves.control_points
-            
-            if (curve_type in ["L", CurveType.linear] or curve_type == CurveType.linear) and len(control_points) >= 2:
-                curve_points = control_points
-            elif (curve_type in ["B", CurveType.Bezier] or curve_type == CurveType.Bezier) and len(control_points) >= 2:
-                # 使用Bezier曲线近似
-                curve_points = self._approximate_bezier_curve(control_points)
-            elif (curve_type in ["P", CurveType.perfrct] or curve_type == CurveType.perfrct) and len(control_points) == 3:
-                # 使用圆形弧线近似
-                curve_points = self._approximate_circular_arc(control_points)
-            elif (curve_type in ["C", CurveType.Catmull_rom] or curve_type == CurveType.Catmull_rom) and len(control_points) >= 2:
-                # 使用Catmull-Rom曲线近似
-                curve_points = self._approximate_catmull_rom(control_points)
-            else:
-                # 默认使用线性近似
-                curve_points = control_points
+        # 弧长参数化路径，convert_to_slider 内只构建一次
+        path = self._curve_path(obj)
         
         # 沿着曲线采样点
-        sample_interval = 20  # 20ms采样间隔
-        t = 0
-        while t < duration:
-            # 计算当前点的角度
-            angle = 0
-            if curve_points:
-                # 根据进度在曲线点中插值
-                progress = t / duration if duration > 0 else 0
-                curve_pos = self._interpolate_curve_points(curve_points, progress)
-                
-                # 计算曲线点的角度
-                angle = self.next_angle(get_hit_object_angle(curve_pos))
-            
-            if t == 0:
-                first_angle = angle
-            
-            # 计算相对于起始角度的差值
-            angle = get_delta_angle(angle, first_angle)
-            
-            # 检查是否转换太快
-            if not self.can_convert_impossible_sliders and last_angle is not None:
-                angle_diff = get_delta_angle(last_angle, angle)
-                time_diff = abs(last_time - t) if last_time is not None else 1
-                if time_diff > 0 and abs(angle_diff) / time_diff > 0.6:
-                    return convert_to_non_slider()
-            
-            last_angle = angle
-            last_time = t
-            nodes.append(SliderNode(t, angle))
-            t += sample_interval
+        if self.use_numpy and path is not None and duration > SLIDER_SAMPLE_INTERVAL * NUMPY_MIN_SAMPLES:
+            sampled = self._sample_slider_numpy(path, duration)
+        else:
+            sampled = self._sample_slider(path, duration)
+        if sampled is None:
+            return convert_to_non_slider()
+        times, angles, first_angle, last_angle, last_time = sampled
         
         # 添加最终节点，模仿原版处理
         final_angle = 0
-        if hasattr(obj, 'curves') and obj.curves:
-            # 获取滑条结束点的角度
-            end_pos = get_curve_position_at(obj.curves, 1.0)
-            final_angle = self.next_angle(get_hit_object_angle(end_pos))
+        if path is not None:
+            # 滑条结束点直接取路径终点，不再重新计算曲线
+            final_angle = self.next_angle(get_hit_object_angle(path.end_position))
         
         final_angle = get_delta_angle(final_angle, first_angle)
         
@@ -597,13 +1284,20 @@ class TauBeatmapConverter:
             if time_diff > 0 and abs(angle_diff) / time_diff > 0.6:
                 return convert_to_non_slider()
         
-        nodes.append(SliderNode(float(duration), final_angle))
+        times.append(float(duration))
+        angles.append(final_angle)
         
         # 创建滑条，模仿原版slider创建逻辑
         slider = Slider()
         slider.start_time = obj.time
         slider.new_combo = obj.is_newcombo
-        slider.path = PolarSliderPath(nodes)
+        if self.adaptive_sampling is None and self.array_paths:
+            slider.path = ArrayPolarSliderPath.from_samples(times, angles)
+        else:
+            nodes = [SliderNode(t, a) for t, a in zip(times, angles)]
+            if self.adaptive_sampling is not None:
+                nodes = self.adaptive_sampling.simplify(nodes)
+            slider.path = self._polar_path(nodes)
         slider.angle = first_angle
         slider.repeat_count = getattr(obj, 'repeat_count', 0)
         slider.tick_distance_multiplier = 2.0
@@ -613,6 +1307,7 @@ class TauBeatmapConverter:
         # 由于项目解析器限制，简化处理
         if beatmap and getattr(beatmap, 'file_version', 0) < 8:
             slider.tick_distance_multiplier = 2.0  # 简化处理
+        self._apply_slider_defaults(slider, beatmap)
         
         return slider
 
@@ -643,13 +1338,9 @@ class TauBeatmapConverter:
         control_point_beat_length = 1000  # 默认1000ms每拍
         time_signature_numerator = 4  # 默认4/4拍
         
-        # 如果有beatmap信息，尝试获取实际的控制点信息
-        if beatmap and hasattr(beatmap, 'timing_points') and beatmap.timing_points:
-            # 查找在obj.time时刻的timing point
-            for tp in beatmap.timing_points:
-                if tp.start_time <= obj.time and tp.uninherited:
-                    control_point_beat_length = float(tp.beat_length)
-                    break
+        # 如果有beatmap信息，获取obj.time时刻实际的控制点信息
+        if beatmap:
+            control_point_beat_length = self._timing_index(beatmap).beat_length_at(obj.time, control_point_beat_length)
         
         revolutions = int(duration / (control_point_beat_length * time_signature_numerator))
         if revolutions == 0:
@@ -673,7 +1364,7 @@ class TauBeatmapConverter:
         slider = Slider()
         slider.start_time = obj.time
         slider.new_combo = obj.is_newcombo
-        slider.path = PolarSliderPath(nodes)
+        slider.path = self._polar_path(nodes)
         slider.angle = nodes[0].angle if nodes else 0.0
         slider.tick_distance_multiplier = 2.0
         
@@ -681,11 +1372,32 @@ class TauBeatmapConverter:
         # 由于项目解析器限制，简化处理
         if beatmap and getattr(beatmap, 'file_version', 0) < 8:
             slider.tick_distance_multiplier = 2.0  # 简化处理
+        self._apply_slider_defaults(slider, beatmap)
         
         return slider
 
-    def convert_to_non_slider(self, obj) -> Union[Beat, HardBeat, StrictHardBeat]:
-        """转换为非滑条物件，严格按照convertToNonSlider逻辑"""
+    def _apply_slider_defaults(self, slider: Slider, beatmap):
+        """
+        设置滑条速度与刻度间距，模仿 osu! Slider.ApplyDefaultsToSelf
+
+        与 convert_to_slider 计算持续时间一样只使用红线的节拍长度（不乘绿线倍率），
+        因此 velocity * duration 等于谱面中的滑条长度。
+        """
+        if not beatmap:
+            return
+        scoring_distance = Slider.BASE_SCORING_DISTANCE * getattr(beatmap, 'slider_multiplier', 1.0)
+        beat_length = self._timing_index(beatmap).beat_length_at(slider.start_time, 1000)
+        if beat_length > 0:
+            slider.velocity = scoring_distance / beat_length
+        tick_rate = getattr(beatmap, 'slider_tick_rate', 1.0) or 1.0
+        slider.tick_distance = scoring_distance / tick_rate * slider.tick_distance_multiplier
+
+    def _polar_path(self, nodes: List[SliderNode]) -> PolarSliderPath:
+        """按 array_paths 选择滑条路径的存储方式"""
+        return ArrayPolarSliderPath(nodes) if self.array_paths else PolarSliderPath(nodes)
+
+    def convert_to_non_slider(self, obj, beatmap=None) -> Union[Beat, HardBeat, StrictHardBeat]:
+        """转换为非滑条物件，严格按照convertToNonSlider逻辑（beatmap 未使用，仅为与其他转换方法签名一致）"""
         # 判断是否为HardBeat
         if is_hard_beat(obj) and self.can_convert_to_hard_beats:
             if not self.hard_beats_are_strict:
@@ -709,28 +1421,22 @@ class TauBeatmapConverter:
             beat.angle = self.next_angle(get_hit_object_angle(getattr(obj, 'pos', None)))
             return beat
 
-def convert_object(obj, beatmap=None) -> Union[Beat, HardBeat, StrictHardBeat, Slider]:
-    """转换物件，模仿ConvertHitObject主逻辑"""
-    converter = TauBeatmapConverter()
-    
-    # 根据物件类型进行转换，模仿原版switch表达式
-    if isinstance(obj, OsuSlider):
-        return converter.convert_to_slider(obj, beatmap)
-    elif isinstance(obj, OsuSpinner):
-        return converter.convert_slider_spinner(obj, beatmap)
-    else:
-        # 包括Circle和其他类型，模仿默认情况
-        return converter.convert_to_non_slider(obj)
+def convert_object(obj, beatmap=None, *, use_numpy: bool = False,
+                   curve_cache: Optional[CurveApproximationCache] = CURVE_CACHE,
+                   angle_table: Optional[AngleTable] = None,
+                   adaptive_sampling: Optional[AdaptiveSampling] = None,
+                   array_paths: bool = False) -> Union[Beat, HardBeat, StrictHardBeat, Slider]:
+    """转换单个物件（每次调用创建新的转换器；转换整张谱面请使用 convert_osu_beatmap）"""
+    return TauBeatmapConverter(use_numpy=use_numpy, curve_cache=curve_cache, angle_table=angle_table,
+                               adaptive_sampling=adaptive_sampling, array_paths=array_paths).convert(obj, beatmap)
 
-def convert_osu_beatmap(osu_beatmap: OsuBeatmap) -> 'TauBeatmap':
+def create_tau_beatmap(osu_beatmap: OsuBeatmap) -> 'TauBeatmap':
     """
-    将OsuBeatmap转换为TauBeatmap
-    
-    Args:
-        osu_beatmap: 解析后的osu谱面对象
-        
-    Returns:
-        TauBeatmap: 转换后的Tau谱面对象
+    创建只带难度属性、不含物件的TauBeatmap
+
+    与 iter_convert 搭配，用于流式难度计算：
+        calculator = TauDifficultyCalculator(create_tau_beatmap(osu_beatmap), mods)
+        attributes = calculator.calculate_iter(iter_convert(osu_beatmap))
     """
     from .beatmap import TauBeatmap
     
@@ -745,18 +1451,83 @@ def convert_osu_beatmap(osu_beatmap: OsuBeatmap) -> 'TauBeatmap':
     
     # 设置元数据（如果有的话）
     # 由于any.parser.OsuBeatmap没有元数据字段，这里留空
+    return tau_beatmap
+
+def iter_convert(osu_beatmap: OsuBeatmap, *, use_numpy: bool = False,
+                 curve_cache: Optional[CurveApproximationCache] = CURVE_CACHE,
+                 stats: Optional[ConversionStats] = None, strict: bool = False,
+                 angle_table: Optional[AngleTable] = None,
+                 adaptive_sampling: Optional[AdaptiveSampling] = None,
+                 array_paths: bool = False) -> Iterator[TauHitObject]:
+    """
+    逐个产出转换后的Tau物件，不构造完整的物件列表
+
+    osu_beatmap.hit_objects 可以是任意可迭代对象（如 stream_osu_file 按块解析的物件），
+    解析、转换与难度计算（TauDifficultyCalculator.calculate_iter）由此可以流水线进行。
+
+    Args:
+        osu_beatmap: 解析后的osu谱面对象
+        use_numpy: 滑条采样使用 NumPy 向量化实现（需要安装 numpy）
+        curve_cache: 曲线近似缓存，默认为进程内共享的 CURVE_CACHE；None 表示不缓存
+        stats: 记录转换统计的 ConversionStats，None 表示不记录
+        strict: 为 True 时物件转换失败直接抛出异常，而不是跳过
+        angle_table: NumPy 滑条采样使用的角度预计算表（需要 use_numpy=True），None 表示逐点 atan2
+        adaptive_sampling: 滑条节点自适应简化参数，None 表示保留全部 20ms 采样节点
+        array_paths: 滑条路径使用数组存储的 ArrayPolarSliderPath
+
+    Yields:
+        Tau物件
+    """
+    convert = TauBeatmapConverter(use_numpy=use_numpy, curve_cache=curve_cache, angle_table=angle_table,
+                                  adaptive_sampling=adaptive_sampling, array_paths=array_paths).convert
+    if stats is None:
+        stats = ConversionStats()
     
-    # 创建转换器实例
-    converter = TauBeatmapConverter()
-    
-    # 转换所有物件
-    for obj in getattr(osu_beatmap, 'hit_objects', []):
+    for index, obj in enumerate(getattr(osu_beatmap, 'hit_objects', [])):
         try:
-            tau_obj = convert_object(obj, osu_beatmap)
-            if tau_obj:
-                tau_beatmap.add_hit_object(tau_obj)
+            tau_obj = convert(obj, osu_beatmap)
         except Exception as e:
-            # 跳过转换失败的物件
+            if strict:
+                raise
+            stats.record_failure(index, getattr(obj, 'time', float('nan')), e)
             continue
+        if tau_obj is not None:
+            stats.converted += 1
+            yield tau_obj
+
+def convert_osu_beatmap(osu_beatmap: OsuBeatmap, *, use_numpy: bool = False,
+                        curve_cache: Optional[CurveApproximationCache] = CURVE_CACHE,
+                        strict: bool = False, angle_table: Optional[AngleTable] = None,
+                        adaptive_sampling: Optional[AdaptiveSampling] = None,
+                        array_paths: bool = False) -> 'TauBeatmap':
+    """
+    将OsuBeatmap转换为TauBeatmap
+
+    整张谱面共用一个转换器单趟转换。转换失败的物件会被跳过，但会记录在返回谱面的
+    conversion_stats 中（按异常类型计数，并保留前 MAX_RECORDED_FAILURES 个失败物件），
+    同时输出一条 warning 日志。
     
+    Args:
+        osu_beatmap: 解析后的osu谱面对象
+        use_numpy: 滑条采样使用 NumPy 向量化实现（需要安装 numpy）
+        curve_cache: 曲线近似缓存，默认为进程内共享的 CURVE_CACHE；None 表示不缓存
+        strict: 为 True 时物件转换失败直接抛出异常，而不是跳过
+        angle_table: NumPy 滑条采样使用的角度预计算表（需要 use_numpy=True），None 表示逐点 atan2
+        adaptive_sampling: 滑条节点自适应简化参数，None 表示保留全部 20ms 采样节点
+        array_paths: 滑条路径使用数组存储的 ArrayPolarSliderPath
+        
+    Returns:
+        TauBeatmap: 转换后的Tau谱面对象
+    """
+    tau_beatmap = create_tau_beatmap(osu_beatmap)
+    stats = ConversionStats()
+    tau_beatmap.hit_objects.extend(iter_convert(osu_beatmap, use_numpy=use_numpy, curve_cache=curve_cache,
+                                                 stats=stats, strict=strict, angle_table=angle_table,
+                                                 adaptive_sampling=adaptive_sampling, array_paths=array_paths))
+
+    tau_beatmap.conversion_stats = stats
+    if stats.failed:
+        logger.warning("skipped %d of %d hit objects during Tau conversion: %s",
+                       stats.failed, stats.failed + stats.converted,
+                       ", ".join(f"{name} x{count}" for name, count in stats.errors.items()))
     return tau_beatmap
\ No newline at end of file
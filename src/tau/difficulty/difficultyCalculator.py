@@ -3,7 +3,7 @@ Tau难度计算器，模仿rosu-pp的接口风格
 """
 
 import math
-from typing import List, Type, Any
+from typing import Iterable, Iterator, List, Type, Any
 from ..objects import TauHitObject, AngledTauHitObject, Beat, StrictHardBeat, Slider, SliderRepeat, HardBeat
 from ..attributes import TauDifficultyAttributes
 from ..mods import TauMods
@@ -11,8 +11,14 @@ from ..beatmap import TauBeatmap
 from .skills.aim import Aim
 from .skills.speed import Speed
 from .skills.complexity import Complexity
+from .evaluators.speedEvaluator import SpeedEvaluator
 from .preprocessing.tauDifficultyHitObject import TauDifficultyHitObject
 from .preprocessing.tauAngledDifficultyHitObject import TauAngledDifficultyHitObject
+from .preprocessing.difficultyObjectWindow import DifficultyObjectWindow
+
+# 流式计算保留的难度物件数：SpeedEvaluator 的节奏计算最多回看 33 个物件，
+# previous(0) 实际指向下一个难度物件，因此处理时还需滞后一个物件
+STREAM_WINDOW_SIZE = 64
 
 
 class TauDifficultyCalculator:
@@ -30,10 +36,14 @@ class TauDifficultyCalculator:
         self.mods = TauMods(mods)
         self.difficulty_multiplier = 0.0820
     
-    def calculate(self) -> TauDifficultyAttributes:
+    def calculate(self, fused: bool = True) -> TauDifficultyAttributes:
         """
         计算谱面难度
         
+        Args:
+            fused: 只遍历一次难度物件，共享各技能的公共中间量（见 _process_skills_fused）；
+                False 时逐个技能遍历。两者结果逐位一致
+        
         Returns:
             TauDifficultyAttributes: 难度属性
         """
@@ -47,10 +57,118 @@ class TauDifficultyCalculator:
         skills = self._create_skills(difficulty_hit_objects)
         
         # 计算技能难度值
-        for i, skill in enumerate(skills):
-            for hit_object in difficulty_hit_objects:
-                skill.process(hit_object)
+        if fused:
+            self._process_skills_fused(skills, difficulty_hit_objects)
+        else:
+            for skill in skills:
+                for hit_object in difficulty_hit_objects:
+                    skill.process(hit_object)
+        
+        # 统计物件数量
+        notes_count = sum(1 for obj in self.beatmap.hit_objects if isinstance(obj, Beat))
+        slider_count = sum(1 for obj in self.beatmap.hit_objects if isinstance(obj, Slider))
+        hard_beat_count = sum(1 for obj in self.beatmap.hit_objects if isinstance(obj, HardBeat))
+        
+        return self._create_attributes(skills, notes_count, slider_count, hard_beat_count, self._get_max_combo())
+    
+    def calculate_iter(self, hit_objects: Iterable[TauHitObject]) -> TauDifficultyAttributes:
+        """
+        流式计算难度：逐个消费物件，只保留最近 STREAM_WINDOW_SIZE 个难度物件
+        
+        难度属性（OD / AR 等）取自 self.beatmap，self.beatmap.hit_objects 不会被读取。
+        结果与对相同物件列表调用 calculate() 一致。
+        
+        Args:
+            hit_objects: 按时间顺序产出的Tau物件（如 tau.convertor.iter_convert 的输出）
+            
+        Returns:
+            TauDifficultyAttributes: 难度属性
+        """
+        skills = self._create_skills([])
+        counts = [0, 0, 0, 0, 0]  # 物件数, Beat, Slider, HardBeat, 最大连击
+        
+        def counted(objects: Iterable[TauHitObject]) -> Iterator[TauHitObject]:
+            for obj in objects:
+                counts[0] += 1
+                if isinstance(obj, Beat):
+                    counts[1] += 1
+                if isinstance(obj, Slider):
+                    counts[2] += 1
+                if isinstance(obj, HardBeat):
+                    counts[3] += 1
+                counts[4] += self._combo_of(obj)
+                yield obj
+        
+        # 每个难度物件在下一个产出后才处理（previous(0) 指向下一个物件）
+        pending = None
+        window = DifficultyObjectWindow(STREAM_WINDOW_SIZE, self._release_difficulty_object)
+        for difficulty_object in self._iter_difficulty_hit_objects(counted(hit_objects), window):
+            if pending is not None:
+                for skill in skills:
+                    skill.process(pending)
+            pending = difficulty_object
+        if pending is not None:
+            for skill in skills:
+                skill.process(pending)
+        
+        if counts[0] == 0:
+            return TauDifficultyAttributes()
+        return self._create_attributes(skills, counts[1], counts[2], counts[3], counts[4])
+    
+    @staticmethod
+    def _process_skills_fused(skills: List[Any], difficulty_hit_objects: List[TauDifficultyHitObject]):
+        """
+        单次遍历难度物件，依次推进所有技能
+        
+        各技能的状态互相独立，按物件交错处理与逐个技能遍历结果相同。公共中间量只算一次：
+        Aim 的移动/滑条速度由所有 Aim 技能共用，Speed 的节奏乘数由
+        SpeedEvaluator.evaluate_rhythm_sequence 按整个列表预先算出；其余技能照常调用 strain_value_of。
         
+        Args:
+            skills: _create_skills 创建的技能
+            difficulty_hit_objects: 完整的难度物件列表
+        """
+        # 每个技能的应变来源：(技能, Aim 共用速度 / Speed 节奏乘数 / 自行计算)
+        uses_aim = False
+        rhythms = {}
+        plan = []
+        for skill in skills:
+            if isinstance(skill, Aim):
+                uses_aim = True
+                plan.append((skill, True, None))
+            elif isinstance(skill, Speed):
+                if skill.hit_window_great not in rhythms:
+                    rhythms[skill.hit_window_great] = SpeedEvaluator.evaluate_rhythm_sequence(
+                        difficulty_hit_objects, skill.hit_window_great)
+                plan.append((skill, False, rhythms[skill.hit_window_great]))
+            else:
+                plan.append((skill, False, None))
+        
+        for position, hit_object in enumerate(difficulty_hit_objects):
+            velocities = Aim.shared_velocities(hit_object) if uses_aim else None
+            for skill, is_aim, skill_rhythms in plan:
+                if is_aim:
+                    strain = skill.strain_value_from_velocities(velocities)
+                elif skill_rhythms is not None:
+                    strain = skill.strain_value_with_rhythm(hit_object, skill_rhythms[position])
+                else:
+                    strain = skill.strain_value_of(hit_object)
+                skill.process_strain(hit_object, strain)
+    
+    @staticmethod
+    def _release_difficulty_object(difficulty_object: TauDifficultyHitObject):
+        """已处理并离开窗口的难度物件：断开 last_angled 链，使更早的物件可以被回收"""
+        if isinstance(difficulty_object, TauAngledDifficultyHitObject):
+            difficulty_object.last_angled = None
+    
+    def _create_attributes(self, skills: List[Any], notes_count: int, slider_count: int,
+                           hard_beat_count: int, max_combo: int) -> TauDifficultyAttributes:
+        """
+        由处理完毕的技能与物件统计生成难度属性
+        
+        Returns:
+            TauDifficultyAttributes: 难度属性
+        """
         # 计算各项难度值
         aim = math.sqrt(skills[0].difficulty_value()) * self.difficulty_multiplier
         aim_no_sliders = math.sqrt(skills[1].difficulty_value()) * self.difficulty_multiplier
@@ -85,11 +203,6 @@ class TauDifficultyCalculator:
         if base_performance > 0.00001:
             star_rating = math.pow(1.12, 1/3) * 0.027 * (math.pow(100000 / math.pow(2, 1 / 1.1) * base_performance, 1/3) + 4)
         
-        # 统计物件数量
-        notes_count = sum(1 for obj in self.beatmap.hit_objects if isinstance(obj, Beat))
-        slider_count = sum(1 for obj in self.beatmap.hit_objects if isinstance(obj, Slider))
-        hard_beat_count = sum(1 for obj in self.beatmap.hit_objects if isinstance(obj, HardBeat))
-        
         slider_factor = aim_no_sliders / aim if aim > 0 else 1
         
         return TauDifficultyAttributes(
@@ -104,7 +217,7 @@ class TauDifficultyCalculator:
             notes_count=notes_count,
             slider_count=slider_count,
             hard_beat_count=hard_beat_count,
-            max_combo=self._get_max_combo()
+            max_combo=max_combo
         )
     
     def _create_difficulty_hit_objects(self) -> List[TauDifficultyHitObject]:
@@ -114,13 +227,28 @@ class TauDifficultyCalculator:
         Returns:
             List[TauDifficultyHitObject]: 难度击打物件列表
         """
-        difficulty_objects = []
+        difficulty_objects: List[TauDifficultyHitObject] = []
+        for _ in self._iter_difficulty_hit_objects(self.beatmap.hit_objects, difficulty_objects):
+            pass
+        return difficulty_objects
+    
+    def _iter_difficulty_hit_objects(self, hit_objects: Iterable[TauHitObject], difficulty_objects) -> Iterator[TauDifficultyHitObject]:
+        """
+        逐个创建难度击打物件，追加到 difficulty_objects 后产出
+        
+        Args:
+            hit_objects: Tau物件
+            difficulty_objects: 难度物件容器（完整列表或 DifficultyObjectWindow），作为各物件的 objects
+            
+        Yields:
+            TauDifficultyHitObject: 难度击打物件
+        """
         last_object = None
         last_angled = None
         
         clock_rate = self._get_clock_rate()
         
-        for i, hit_object in enumerate(self.beatmap.hit_objects):
+        for i, hit_object in enumerate(hit_objects):
             if last_object is not None:
                 if isinstance(hit_object, AngledTauHitObject):
                     obj = TauAngledDifficultyHitObject(
@@ -142,10 +270,9 @@ class TauDifficultyCalculator:
                         i
                     )
                     difficulty_objects.append(obj)
+                yield obj
             
             last_object = hit_object
-        
-        return difficulty_objects
     
     def _create_skills(self, difficulty_hit_objects: List[TauDifficultyHitObject]) -> List[Any]:
         """
@@ -238,10 +365,15 @@ class TauDifficultyCalculator:
         """
         max_combo = 0
         for obj in self.beatmap.hit_objects:
-            max_combo += 1
-            # 如果是Slider，增加额外的连击点
-            if isinstance(obj, Slider):
-                # 简化处理，实际应该根据滑条的节点数计算
-                max_combo += obj.repeat_count + 1
+            max_combo += self._combo_of(obj)
         
-        return max_combo
\ No newline at end of file
+        return max_combo
+    
+    @staticmethod
+    def _combo_of(obj: TauHitObject) -> int:
+        """单个物件贡献的连击数"""
+        combo = 1
+        # 如果是Slider，嵌套物件（头部、刻度、重复点）与尾部各计 1
+        if isinstance(obj, Slider):
+            combo = obj.max_combo
+        return combo
\ No newline at end of file
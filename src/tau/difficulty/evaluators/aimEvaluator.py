@@ -3,7 +3,7 @@ AimEvaluator类，用于评估瞄准难度
 """
 
 import math
-from typing import List, Type, TYPE_CHECKING
+from typing import List, Tuple, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..preprocessing.tauAngledDifficultyHitObject import TauAngledDifficultyHitObject
@@ -29,25 +29,50 @@ class AimEvaluator:
         Returns:
             float: 难度值
         """
-        velocity = AimEvaluator._calculate_velocity(current.distance, current.strain_time)
-        
-        # 检查是否允许Slider类型但上一个物件不是Slider
-        slider_allowed = any(hasattr(t, '__name__') and 'Slider' in t.__name__ for t in allowed_hit_objects)
-        last_is_not_slider = not (hasattr(last.base_object, '__class__') and 
-                                 hasattr(last.base_object.__class__, '__name__') and
-                                 'Slider' in last.base_object.__class__.__name__)
-        
-        if slider_allowed and last_is_not_slider:
-            return velocity
+        return AimEvaluator.combine_velocities(*AimEvaluator.evaluate_velocities(current, last),
+                                               AimEvaluator.slider_allowed(allowed_hit_objects))
+    
+    @staticmethod
+    def slider_allowed(allowed_hit_objects: List[Type]) -> bool:
+        """允许的物件类型中是否包含滑条类"""
+        return any(hasattr(t, '__name__') and 'Slider' in t.__name__ for t in allowed_hit_objects)
+    
+    @staticmethod
+    def evaluate_velocities(current: 'TauAngledDifficultyHitObject',
+                            last: 'TauAngledDifficultyHitObject') -> Tuple[float, float, bool]:
+        """
+        evaluate_difficulty 中与允许物件类型无关的部分，多个 Aim 技能可共用
         
-        # Slider计算
+        Args:
+            current: 当前角度难度击打物件
+            last: 上一个角度难度击打物件
+            
+        Returns:
+            Tuple[float, float, bool]: (移动速度, 上一个物件的滑条速度, 上一个物件是否为滑条)
+        """
+        velocity = AimEvaluator._calculate_velocity(current.distance, current.strain_time)
         travel_velocity = AimEvaluator._calculate_velocity(last.lazy_travel_distance, last.travel_time)
-        movement_velocity = AimEvaluator._calculate_velocity(current.distance, current.strain_time)
-        
-        velocity = max(velocity, movement_velocity + travel_velocity)
-        velocity += AimEvaluator._calculate_velocity(last.lazy_travel_distance, last.travel_time) * AimEvaluator.SLIDER_MULTIPLIER
+        last_is_slider = 'Slider' in last.base_object.__class__.__name__
+        return velocity, travel_velocity, last_is_slider
+    
+    @staticmethod
+    def combine_velocities(velocity: float, travel_velocity: float, last_is_slider: bool,
+                           slider_allowed: bool) -> float:
+        """
+        由 evaluate_velocities 的结果得到难度值
         
-        return velocity
+        Args:
+            velocity: 移动速度
+            travel_velocity: 上一个物件的滑条速度
+            last_is_slider: 上一个物件是否为滑条
+            slider_allowed: 见 slider_allowed
+            
+        Returns:
+            float: 难度值
+        """
+        if slider_allowed and not last_is_slider:
+            return velocity
+        return max(velocity, velocity + travel_velocity) + travel_velocity * AimEvaluator.SLIDER_MULTIPLIER
     
     @staticmethod
     def _calculate_velocity(distance: float, time: float) -> float:
@@ -3,7 +3,7 @@ SpeedEvaluator类，用于评估速度难度
 """
 
 import math
-from typing import TYPE_CHECKING
+from typing import List, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..preprocessing.tauDifficultyHitObject import TauDifficultyHitObject
@@ -17,6 +17,9 @@ class SpeedEvaluator:
     SINGLE_SPACING_THRESHOLD = 125
     MIN_SPEED_BONUS = 75  # ~200BPM
     SPEED_BALANCING_FACTOR = 40
+    HISTORY_TIME_MAX = 5000  # 节奏计算最多回看 5 秒
+    HISTORY_OBJECTS_MAX = 32  # 节奏计算最多回看的物件数
+    RHYTHM_MULTIPLIER = 0.75
     
     @staticmethod
     def evaluate_difficulty(current: 'TauDifficultyHitObject', great_window: float) -> float:
@@ -75,6 +78,25 @@ class SpeedEvaluator:
         """
         return SpeedEvaluator._evaluate_rhythm(current, great_window)
     
+    @staticmethod
+    def evaluate_rhythm_sequence(objects: Sequence['TauDifficultyHitObject'], great_window: float) -> List[float]:
+        """
+        一次算出 objects 中每个物件的节奏乘数，结果与逐个调用 evaluate_rhythm_difficulty 逐位一致
+        
+        逐个计算时，相邻两物件的节奏比率与窗口惩罚会被约 30 个物件的回看重复计算；
+        这里对整个列表只建一次 _rhythm_tables，所有物件共用。
+        
+        Args:
+            objects: 完整的难度物件列表（各物件的 objects）
+            great_window: Great判定窗口大小
+            
+        Returns:
+            List[float]: 与 objects 一一对应的节奏乘数
+        """
+        tables = SpeedEvaluator._rhythm_tables(objects, 0, len(objects), great_window)
+        rhythm_multiplier = SpeedEvaluator._rhythm_multiplier
+        return [rhythm_multiplier(obj.index, obj.start_time, 0, tables) for obj in objects]
+    
     @staticmethod
     def _evaluate_rhythm(current: 'TauDifficultyHitObject', great_window: float) -> float:
         """
@@ -87,8 +109,77 @@ class SpeedEvaluator:
         Returns:
             float: 节奏乘数
         """
-        HISTORY_TIME_MAX = 5000  # 5秒最大计算时间
-        RHYTHM_MULTIPLIER = 0.75
+        # 回看从 objects[index] 向前，遇到早于 HISTORY_TIME_MAX 的物件（或回看上限）为止，
+        # 之后还会读取再前一个物件；tables 只需覆盖这一段
+        objects = current.objects
+        index = current.index
+        end = min(len(objects), index + 1)
+        lower = max(0, index - SpeedEvaluator.HISTORY_OBJECTS_MAX)
+        boundary = end - 1
+        while boundary >= lower and current.start_time - objects[boundary].start_time < SpeedEvaluator.HISTORY_TIME_MAX:
+            boundary -= 1
+        first = max(0, boundary - 1)
+        tables = SpeedEvaluator._rhythm_tables(objects, first, end, great_window)
+        return SpeedEvaluator._rhythm_multiplier(index, current.start_time, first, tables)
+    
+    @staticmethod
+    def _rhythm_tables(objects: Sequence['TauDifficultyHitObject'], first: int, end: int,
+                       great_window: float) -> Tuple[List[float], List[float], List[bool], List[float]]:
+        """
+        objects[first:end] 的节奏计算用数据
+        
+        Returns:
+            (start_time, strain_time, 是否为滑条, effective_ratio) 四个列表，第 k 项对应 objects[first + k]；
+            effective_ratio[k] 是以 k - 1 为 prev_obj、k 为 curr_obj 的节奏比率乘窗口惩罚（物件类型惩罚之前）
+        """
+        start_times = []
+        deltas = []
+        is_slider = []
+        effective_ratios = []
+        prev_delta = None
+        for i in range(first, end):
+            obj = objects[i]
+            curr_delta = getattr(obj, 'strain_time', 0)
+            start_times.append(obj.start_time)
+            deltas.append(curr_delta)
+            is_slider.append('Slider' in obj.base_object.__class__.__name__)
+            if prev_delta is None:
+                effective_ratios.append(0.0)
+                prev_delta = curr_delta
+                continue
+            
+            # 计算节奏比率
+            curr_ratio = 1.0 + 6.0 * min(0.5, math.pow(
+                math.sin(math.pi / (min(prev_delta, curr_delta) / max(prev_delta, curr_delta))), 2))
+            
+            # 窗口惩罚
+            window_penalty = min(1, max(0, abs(prev_delta - curr_delta) - great_window * 0.6) / (great_window * 0.6))
+            window_penalty = min(1, window_penalty)
+            
+            effective_ratios.append(window_penalty * curr_ratio)
+            prev_delta = curr_delta
+        return start_times, deltas, is_slider, effective_ratios
+    
+    @staticmethod
+    def _rhythm_multiplier(index: int, start_time: float, first: int,
+                           tables: Tuple[List[float], List[float], List[bool], List[float]]) -> float:
+        """
+        节奏乘数的核心计算
+        
+        previous(k) 即 objects[index - k]；tables 覆盖 objects[first : first + len]，范围外的物件视为 None。
+        
+        Args:
+            index: 当前物件的 index
+            start_time: 当前物件的开始时间
+            first: tables 第 0 项对应的 objects 下标
+            tables: _rhythm_tables 的结果
+            
+        Returns:
+            float: 节奏乘数
+        """
+        start_times, deltas, is_slider, effective_ratios = tables
+        count = len(deltas)
+        HISTORY_TIME_MAX = SpeedEvaluator.HISTORY_TIME_MAX
         
         previous_island_size = 0
         rhythm_complexity_sum = 0
@@ -98,41 +189,33 @@ class SpeedEvaluator:
         first_delta_switch = False
         rhythm_start = 0
         
-        historical_note_count = min(current.index, 32)
+        historical_note_count = min(index, SpeedEvaluator.HISTORY_OBJECTS_MAX)
         
         # 确定节奏计算的起始点
-        while (rhythm_start < historical_note_count - 2):
-            prev = current.previous(rhythm_start)
-            if prev is None or current.start_time - prev.start_time >= HISTORY_TIME_MAX:
+        while rhythm_start < historical_note_count - 2:
+            prev = index - rhythm_start - first
+            if prev < 0 or prev >= count or start_time - start_times[prev] >= HISTORY_TIME_MAX:
                 break
             rhythm_start += 1
         
         # 反向遍历历史物件计算节奏复杂度
         for i in range(rhythm_start, 0, -1):
-            curr_obj = current.previous(i - 1)
-            prev_obj = current.previous(i)
-            last_obj = current.previous(i + 1)
+            curr = index - i + 1 - first
+            prev = curr - 1
+            last = curr - 2
             
             # 如果任一对象为None，跳过此次循环
-            if curr_obj is None or prev_obj is None or last_obj is None:
+            if last < 0 or curr >= count:
                 continue
             
-            curr_historical_decay = (HISTORY_TIME_MAX - (current.start_time - curr_obj.start_time)) / HISTORY_TIME_MAX
+            curr_historical_decay = (HISTORY_TIME_MAX - (start_time - start_times[curr])) / HISTORY_TIME_MAX
             curr_historical_decay = min((historical_note_count - i) / historical_note_count, curr_historical_decay)
             
-            curr_delta = getattr(curr_obj, 'strain_time', 0)
-            prev_delta = getattr(prev_obj, 'strain_time', 0)
-            last_delta = getattr(last_obj, 'strain_time', 0)
-            
-            # 计算节奏比率
-            curr_ratio = 1.0 + 6.0 * min(0.5, math.pow(
-                math.sin(math.pi / (min(prev_delta, curr_delta) / max(prev_delta, curr_delta))), 2))
-            
-            # 窗口惩罚
-            window_penalty = min(1, max(0, abs(prev_delta - curr_delta) - great_window * 0.6) / (great_window * 0.6))
-            window_penalty = min(1, window_penalty)
+            curr_delta = deltas[curr]
+            prev_delta = deltas[prev]
+            last_delta = deltas[last]
             
-            effective_ratio = window_penalty * curr_ratio
+            effective_ratio = effective_ratios[curr]
             
             if first_delta_switch:
                 if not (prev_delta > 1.25 * curr_delta or prev_delta * 1.25 < curr_delta):
@@ -141,10 +224,10 @@ class SpeedEvaluator:
                         island_size += 1
                 else:
                     # 根据物件类型应用惩罚
-                    if curr_obj is not None and hasattr(curr_obj, 'base_object') and curr_obj.base_object is not None and hasattr(curr_obj.base_object, '__class__') and 'Slider' in curr_obj.base_object.__class__.__name__:
+                    if is_slider[curr]:
                         effective_ratio *= 0.125  # BPM变化到滑条，这是简单的acc窗口
                     
-                    if prev_obj is not None and hasattr(prev_obj, 'base_object') and prev_obj.base_object is not None and hasattr(prev_obj.base_object, '__class__') and 'Slider' in prev_obj.base_object.__class__.__name__:
+                    if is_slider[prev]:
                         effective_ratio *= 0.25  # BPM变化来自滑条，这通常比circle->circle简单
                     
                     if previous_island_size == island_size:
@@ -176,4 +259,4 @@ class SpeedEvaluator:
                 island_size = 1
         
         # 产生可以应用于应变的乘数。范围[1, infinity)（实际上不是）
-        return math.sqrt(4 + rhythm_complexity_sum * RHYTHM_MULTIPLIER) / 2
\ No newline at end of file
+        return math.sqrt(4 + rhythm_complexity_sum * SpeedEvaluator.RHYTHM_MULTIPLIER) / 2
@@ -0,0 +1,47 @@
+"""
+DifficultyObjectWindow类，流式难度计算时代替完整的难度物件列表
+"""
+
+from typing import Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+class DifficultyObjectWindow(Generic[T]):
+    """
+    只保留最近若干个难度物件的滑动窗口
+
+    按绝对下标访问（与完整列表的下标一致），TauDifficultyHitObject.previous 可以直接使用；
+    超出已追加范围的下标抛出 IndexError（previous 返回 None），与完整列表末尾的行为相同。
+    """
+
+    def __init__(self, capacity: int, on_evict: Optional[Callable[[T], None]] = None):
+        """
+        Args:
+            capacity: 至少保留的最近物件数，需不小于评估器的最大回看距离
+            on_evict: 物件离开窗口时调用，可用于断开物件之间的引用链
+        """
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self._items: List[T] = []
+        self._offset = 0  # _items[0] 的绝对下标
+
+    def append(self, item: T):
+        self._items.append(item)
+        # 攒够一倍容量再整体丢弃，均摊 O(1)
+        if len(self._items) >= 2 * self.capacity:
+            drop = len(self._items) - self.capacity
+            if self.on_evict is not None:
+                for evicted in self._items[:drop]:
+                    self.on_evict(evicted)
+            del self._items[:drop]
+            self._offset += drop
+
+    def __len__(self) -> int:
+        return self._offset + len(self._items)
+
+    def __getitem__(self, index: int) -> T:
+        if index < self._offset:
+            raise LookupError(f"difficulty object {index} has left the window "
+                              f"(capacity {self.capacity}, oldest retained {self._offset})")
+        return self._items[index - self._offset]
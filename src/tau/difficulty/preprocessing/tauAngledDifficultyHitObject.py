@@ -63,9 +63,14 @@ class TauAngledDifficultyHitObject(TauDifficultyHitObject):
         
         # 如果是滑条
         if hasattr(hit_object, 'path') and hit_object.path is not None and hasattr(hit_object.path, 'calculated_distance'):
-            self.travel_distance = hit_object.path.calculated_distance
-            if hasattr(hit_object.path, 'calculate_lazy_distance'):
-                self.lazy_travel_distance = hit_object.path.calculate_lazy_distance(self.angle_range / 2)
+            if hasattr(hit_object.path, 'calculate_distances'):
+                # 一次遍历同时得到两项距离
+                self.travel_distance, self.lazy_travel_distance = \
+                    hit_object.path.calculate_distances(self.angle_range / 2)
+            else:
+                self.travel_distance = hit_object.path.calculated_distance
+                if hasattr(hit_object.path, 'calculate_lazy_distance'):
+                    self.lazy_travel_distance = hit_object.path.calculate_lazy_distance(self.angle_range / 2)
             self.travel_time = getattr(hit_object, 'duration', 0) / clock_rate if hasattr(hit_object, 'duration') else 0
     
     def _get_delta_angle(self, a: float, b: float) -> float:
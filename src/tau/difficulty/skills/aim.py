@@ -6,7 +6,7 @@ Aim技能类，用于计算瞄准难度
 """
 
 import math
-from typing import List, Type
+from typing import List, Optional, Tuple, Type
 from .tauStrainSkill import BaseStrainSkill
 from ..preprocessing.tauAngledDifficultyHitObject import TauAngledDifficultyHitObject
 from ...mods import TauMods
@@ -26,6 +26,7 @@ class Aim(BaseStrainSkill):
         """
         super().__init__(mods)
         self.allowed_hit_objects = allowed_hit_objects
+        self.slider_allowed = AimEvaluator.slider_allowed(allowed_hit_objects)
         self.skill_multiplier = 7.4
         self.strain_decay_base = 0.25  # decay base (<1 表示衰减)
     
@@ -49,6 +50,30 @@ class Aim(BaseStrainSkill):
         
         return AimEvaluator.evaluate_difficulty(current, current.last_angled, self.allowed_hit_objects)
     
+    @staticmethod
+    def shared_velocities(current: 'TauDifficultyHitObject') -> Optional[Tuple[float, float, bool]]:
+        """
+        strain_value_of 中与 allowed_hit_objects 无关的部分，融合遍历时各 Aim 技能共用
+        
+        Args:
+            current: 当前难度击打物件
+            
+        Returns:
+            Optional[Tuple[float, float, bool]]: AimEvaluator.evaluate_velocities 的结果；应变值为 0 时为 None
+        """
+        if current.index <= 1 or not isinstance(current, TauAngledDifficultyHitObject) or current.last_angled is None:
+            return None
+        if current.distance < current.angle_range:
+            return None
+        return AimEvaluator.evaluate_velocities(current, current.last_angled)
+    
+    def strain_value_from_velocities(self, velocities: Optional[Tuple[float, float, bool]]) -> float:
+        """由 shared_velocities 的结果计算应变值，与 strain_value_of 一致"""
+        if velocities is None:
+            return 0
+        velocity, travel_velocity, last_is_slider = velocities
+        return AimEvaluator.combine_velocities(velocity, travel_velocity, last_is_slider, self.slider_allowed)
+    
     def _evaluate_difficulty(self, current: TauAngledDifficultyHitObject, last: TauAngledDifficultyHitObject) -> float:
         """
         评估难度
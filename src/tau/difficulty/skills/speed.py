@@ -35,4 +35,8 @@ class Speed(TauStrainSkill):
         # 将节奏复杂度作为 multiplier 融合到单物件应变值中
         base = SpeedEvaluator.evaluate_difficulty(current, self.hit_window_great)
         rhythm = SpeedEvaluator.evaluate_rhythm_difficulty(current, self.hit_window_great)
-        return base * rhythm
\ No newline at end of file
+        return base * rhythm
+
+    def strain_value_with_rhythm(self, current: TauDifficultyHitObject, rhythm: float) -> float:
+        """使用预先算好的节奏乘数（SpeedEvaluator.evaluate_rhythm_sequence）计算应变值"""
+        return SpeedEvaluator.evaluate_difficulty(current, self.hit_window_great) * rhythm
\ No newline at end of file
@@ -43,6 +43,10 @@ class BaseStrainSkill(ABC):
     strain_decay_base: float = 1.0  # <1 会衰减；=1 不衰减
 
     def process(self, current: TauDifficultyHitObject):
+        self.process_strain(current, self.strain_value_of(current))
+
+    def process_strain(self, current: TauDifficultyHitObject, strain: float):
+        """以已算好的单物件应变值（未乘 skill_multiplier）推进，供多技能融合遍历使用"""
         # 初始化第一个 section 结束时间
         if not self.section_peaks and self.current_section_end == 0:
             self.current_section_end = self._round_up_section_end(current.start_time)
@@ -56,7 +60,7 @@ class BaseStrainSkill(ABC):
         self.current_strain *= self._strain_decay(current.delta_time)
 
         # 叠加当前物件应变
-        self.current_strain += self.strain_value_of(current) * self.skill_multiplier
+        self.current_strain += strain * self.skill_multiplier
 
         # 更新 section 峰值
         if self.current_strain > self.current_section_peak:
@@ -3,8 +3,11 @@ Tau游戏物件数据结构的Python定义
 """
 
 import math
-from typing import List, Optional, Tuple, TypeVar
+from array import array
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 from dataclasses import dataclass
+from enum import Enum
 from abc import ABC, abstractmethod
 
 
@@ -19,6 +22,7 @@ class HitSampleInfo:
 
 class IHasAngle(ABC):
     """具有角度属性的接口"""
+    __slots__ = ()
     
     @property
     @abstractmethod
@@ -33,6 +37,7 @@ class IHasAngle(ABC):
 
 class IHasOffsetAngle(IHasAngle):
     """具有偏移角度的接口"""
+    __slots__ = ()
     
     @abstractmethod
     def get_offset_angle(self) -> float:
@@ -52,14 +57,67 @@ class SliderNode:
         return f"T: {self.time} | A: {self.angle}"
 
 
+class _NodeList(list):
+    """
+    PolarSliderPath.nodes 使用的列表：记录增删改次数，路径据此判断缓存是否过期
+
+    只能感知列表本身的修改；直接修改某个 SliderNode 的 time/angle 后需调用 PolarSliderPath.invalidate()。
+    """
+    version = 0
+
+    def _mutating(method):
+        def wrapper(self, *args, **kwargs):
+            result = method(self, *args, **kwargs)
+            self.version += 1
+            return result
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    append = _mutating(list.append)
+    extend = _mutating(list.extend)
+    insert = _mutating(list.insert)
+    pop = _mutating(list.pop)
+    remove = _mutating(list.remove)
+    clear = _mutating(list.clear)
+    sort = _mutating(list.sort)
+    reverse = _mutating(list.reverse)
+    __setitem__ = _mutating(list.__setitem__)
+    __delitem__ = _mutating(list.__delitem__)
+    __iadd__ = _mutating(list.__iadd__)
+    __imul__ = _mutating(list.__imul__)
+    del _mutating
+
+
 class PolarSliderPath:
-    """极坐标滑条路径"""
+    """
+    极坐标滑条路径
+
+    calculated_distance 与 calculate_lazy_distance 的结果会被缓存（后者按 half_tolerance 分别缓存），
+    节点列表被修改时失效；calculate_distances 在一次遍历中同时计算两者。
+    """
     
     def __init__(self, nodes: List[SliderNode]):
-        self.nodes: List[SliderNode] = sorted(nodes, key=lambda node: node.time) if nodes else []
+        self._nodes = _NodeList(sorted(nodes, key=lambda node: node.time) if nodes else ())
         self._version: int = 0
-        self._calculated_length: float = 0
+        self._valid_version: int = -1  # 缓存对应的 _version + nodes.version，-1 表示无缓存
+        self._calculated_length: Optional[float] = None
+        self._lazy_distances: Dict[float, float] = {}
         self._node_index: int = 0
+
+    @property
+    def nodes(self) -> List[SliderNode]:
+        """按时间排序的节点列表"""
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, value: List[SliderNode]):
+        self._nodes = value if isinstance(value, _NodeList) else _NodeList(value)
+        self._node_index = 0
+        self._valid_version = -1
+
+    def invalidate(self):
+        """使缓存的距离失效；直接修改节点的 time/angle 后调用"""
+        self._version += 1
     
     @property
     def duration(self) -> float:
@@ -82,29 +140,40 @@ class PolarSliderPath:
     def calculated_distance(self) -> float:
         """计算路径距离"""
         self._ensure_valid()
+        if self._calculated_length is None:
+            self._calculate_length()
         return self._calculated_length
     
     def _ensure_valid(self):
-        """确保路径有效"""
-        self._calculate_length()
+        """确保路径有效：节点修改过时丢弃缓存的距离"""
+        version = self._version + self._nodes.version
+        if version != self._valid_version:
+            self._calculated_length = None
+            self._lazy_distances.clear()
+            self._valid_version = version
+    
+    def _angle_sequence(self) -> Sequence[float]:
+        """按节点顺序的角度序列，供距离计算遍历"""
+        return [node.angle for node in self._nodes]
     
     def _calculate_length(self):
         """计算路径长度"""
         self._calculated_length = 0
         
-        if len(self.nodes) <= 0:
+        angles = self._angle_sequence()
+        if len(angles) <= 0:
             return
         
-        last_angle = self.nodes[0].angle
+        last_angle = angles[0]
         
-        for node in self.nodes:
-            delta = get_delta_angle(node.angle, last_angle)
+        for angle in angles:
+            delta = get_delta_angle(angle, last_angle)
             self._calculated_length += abs(delta)
-            last_angle = node.angle
+            last_angle = angle
     
     def seek_to(self, time: float):
-        """寻找指定时间的节点"""
-        while self._node_index > 0 and self.nodes[self._node_index - 1].time > time:
+        """寻找指定时间的节点：游标移动到最后一个 time 不大于给定时间的节点（没有时为 0）"""
+        while self._node_index > 0 and self.nodes[self._node_index].time > time:
             self._node_index -= 1
         while (self._node_index + 1 < len(self.nodes) and 
                self.nodes[self._node_index + 1].time <= time):
@@ -186,34 +255,257 @@ class PolarSliderPath:
     
     def calculate_lazy_distance(self, half_tolerance: float) -> float:
         """计算懒人距离"""
-        if len(self.nodes) <= 0:
-            return 0
+        self._ensure_valid()
+        cached = self._lazy_distances.get(half_tolerance)
+        if cached is not None:
+            return cached
 
-        length = 0.0
-        last_angle = self.nodes[0].angle
+        angles = self._angle_sequence()
+        if len(angles) <= 0:
+            length = 0
+        else:
+            length = 0.0
+            last_angle = angles[0]
 
-        for node in self.nodes:
-            delta = get_delta_angle(node.angle, last_angle)
+            for angle in angles:
+                delta = get_delta_angle(angle, last_angle)
 
-            if abs(delta) > half_tolerance:
-                last_angle += delta - (half_tolerance if delta > 0 else -half_tolerance)
-                length += abs(delta)
+                if abs(delta) > half_tolerance:
+                    last_angle += delta - (half_tolerance if delta > 0 else -half_tolerance)
+                    length += abs(delta)
 
+        self._lazy_distances[half_tolerance] = length
         return length
 
+    def calculate_distances(self, half_tolerance: float) -> Tuple[float, float]:
+        """
+        一次遍历同时计算路径距离与懒人距离
+
+        结果与分别调用 calculated_distance、calculate_lazy_distance(half_tolerance) 逐位相同，并写入两者的缓存。
+
+        Returns:
+            (路径距离, 懒人距离)
+        """
+        self._ensure_valid()
+        distance = self._calculated_length
+        lazy = self._lazy_distances.get(half_tolerance)
+        if distance is not None and lazy is not None:
+            return distance, lazy
+
+        angles = self._angle_sequence()
+        if len(angles) <= 0:
+            distance, lazy = 0, 0
+        else:
+            distance = 0
+            lazy = 0.0
+            first_angle = angles[0]
+            last_angle = first_angle
+            lazy_angle = first_angle
+
+            # get_delta_angle 内联：除数为正时 % 的结果不小于 0，只剩 m - 180 一个分支
+            for angle in angles:
+                distance += abs((angle - last_angle + 180) % 360 - 180)
+                last_angle = angle
+
+                delta = (angle - lazy_angle + 180) % 360 - 180
+                if abs(delta) > half_tolerance:
+                    lazy_angle += delta - (half_tolerance if delta > 0 else -half_tolerance)
+                    lazy += abs(delta)
+
+        self._calculated_length = distance
+        self._lazy_distances[half_tolerance] = lazy
+        return distance, lazy
+
+
+class ArrayPolarSliderPath(PolarSliderPath):
+    """
+    数组存储的极坐标滑条路径
+
+    节点的时间与角度保存在两个并行的 array('d')（times、angles）中，可由转换器的采样结果直接构造，
+    不为每个节点创建 SliderNode。按时间查询使用 bisect 二分查找，不读写游标状态，
+    多个读者可以同时查询同一条路径；angle_at 直接返回 float。查询与距离结果与 PolarSliderPath 相同。
+
+    nodes 返回按需创建的 SliderNode 元组，修改它不影响路径；直接修改 times/angles 后需调用 invalidate()。
+    """
+
+    def __init__(self, nodes: List[SliderNode]):
+        ordered = sorted(nodes, key=lambda node: node.time) if nodes else ()
+        self._init_arrays(array('d', [node.time for node in ordered]), array('d', [node.angle for node in ordered]))
+
+    @classmethod
+    def from_samples(cls, times: Iterable[float], angles: Iterable[float]) -> 'ArrayPolarSliderPath':
+        """
+        由采样时间与角度序列构造
+
+        Args:
+            times: 按升序排列的节点时间（不再排序）
+            angles: 与 times 一一对应的节点角度
+        """
+        path = cls.__new__(cls)
+        path._init_arrays(array('d', times), array('d', angles))
+        return path
+
+    def _init_arrays(self, times: array, angles: array):
+        if len(times) != len(angles):
+            raise ValueError(f"times and angles differ in length ({len(times)} != {len(angles)})")
+        self.times = times
+        self.angles = angles
+        self._version = 0
+        self._valid_version = -1
+        self._calculated_length = None
+        self._lazy_distances = {}
+        self._node_index = 0
+
+    @property
+    def nodes(self) -> Tuple[SliderNode, ...]:
+        """按时间排序的节点（每次访问新建）"""
+        return tuple(SliderNode(t, a) for t, a in zip(self.times, self.angles))
+
+    def _ensure_valid(self):
+        if self._version != self._valid_version:
+            self._calculated_length = None
+            self._lazy_distances.clear()
+            self._valid_version = self._version
+
+    def _angle_sequence(self) -> Sequence[float]:
+        return self.angles
+
+    def _index_at(self, time: float) -> int:
+        """最后一个 time 不大于给定时间的节点下标（没有时为 0）"""
+        return max(bisect_right(self.times, time) - 1, 0)
+
+    @property
+    def duration(self) -> float:
+        """路径持续时间"""
+        return self.times[-1] - self.times[0] if self.times else 0
+
+    @property
+    def end_node(self) -> Optional[SliderNode]:
+        """结束节点"""
+        return SliderNode(self.times[-1], self.angles[-1]) if self.times else None
+
+    @property
+    def start_node(self) -> Optional[SliderNode]:
+        """起始节点"""
+        return SliderNode(self.times[0], self.angles[0]) if self.times else None
+
+    def seek_to(self, time: float):
+        """移动游标（仅为兼容保留，本类的查询方法不使用游标）"""
+        self._node_index = self._index_at(time)
+
+    def nodes_between(self, start: float, end: float) -> List[SliderNode]:
+        """获取指定时间范围内的节点"""
+        times, angles = self.times, self.angles
+        return [SliderNode(times[i], angles[i])
+                for i in range(self._index_at(start) + 1, bisect_right(times, end))]
+
+    def segments_between(self, start: float, end: float) -> List[Tuple[SliderNode, SliderNode]]:
+        """获取指定时间范围内的段"""
+        times, angles = self.times, self.angles
+        result = []
+
+        for i in range(max(self._index_at(start) - 1, 0), len(times) - 1):
+            from_time, from_angle = times[i], angles[i]
+            to_time, to_angle = times[i + 1], angles[i + 1]
+
+            # 如果下一个节点时间超过结束时间，则调整
+            if to_time > end and to_time != from_time:
+                to_angle = from_angle + get_delta_angle(to_angle, from_angle) * (end - from_time) / (to_time - from_time)
+                to_time = end
+
+            # 如果当前节点时间小于开始时间，则调整
+            if from_time < start and to_time != from_time:
+                from_angle = (from_angle + get_delta_angle(to_angle, from_angle)
+                              * (start - from_time) / (to_time - from_time))
+                from_time = start
+
+            result.append((SliderNode(from_time, from_angle), SliderNode(to_time, to_angle)))
+            if to_time >= end:
+                break
+
+        return result
+
+    def node_at(self, time: float) -> Optional[SliderNode]:
+        """获取指定时间的插值节点"""
+        times = self.times
+        if not times:
+            return None
+        if time <= times[0]:
+            return SliderNode(times[0], self.angles[0])
+        if time >= times[-1]:
+            return SliderNode(times[-1], self.angles[-1])
+        return SliderNode(time, self.angle_at(time))
+
+    def angle_at(self, time: float) -> Optional[float]:
+        """获取指定时间的角度"""
+        times, angles = self.times, self.angles
+        if not times:
+            return None
+        if time <= times[0]:
+            return angles[0]
+        if time >= times[-1]:
+            return angles[-1]
+
+        i = bisect_right(times, time) - 1
+        from_time, from_angle = times[i], angles[i]
+        to_time = times[i + 1]
+        if to_time == from_time:
+            return from_angle
+        return from_angle + get_delta_angle(angles[i + 1], from_angle) * (time - from_time) / (to_time - from_time)
+
+
+class _LazyList:
+    """
+    按需创建的列表属性，值保存在同名加下划线的槽中
+
+    samples 等列表在转换与难度计算中通常不被使用，首次访问时才创建空列表，
+    不为每个物件预先分配；读写行为与普通列表属性相同。
+    给出 factory 时首次访问的初始值为 factory(物件) 的结果，而不是空列表。
+    """
+    __slots__ = ('_slot', '_factory')
+
+    def __init__(self, factory: Optional[Callable[[Any], list]] = None):
+        self._factory = factory
+
+    def __set_name__(self, owner, name):
+        self._slot = owner.__dict__['_' + name]
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self._slot.__get__(obj, owner)
+        if value is None:
+            value = self._factory(obj) if self._factory is not None else []
+            self._slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self._slot.__set__(obj, value)
+
 
 class HitObject:
-    """基础击打物件"""
+    """
+    基础击打物件
+
+    击打物件及其子类都使用 __slots__：大谱面批量计算时物件数量多，
+    不为每个物件分配 __dict__，属性访问也更快；因此不能添加未声明的属性。
+    """
+    __slots__ = ('start_time', '_samples')
+    samples: List[HitSampleInfo] = _LazyList()
     
     def __init__(self):
         self.start_time: float = 0
-        self.samples: List[HitSampleInfo] = []
+        self._samples = None
 
 
 class TauHitObject(HitObject):
+    """Tau游戏基础物件"""
+    __slots__ = ('_angle', '_range', 'time_preempt', 'time_fade_in', 'new_combo', 'combo_offset',
+                 'index_in_current_combo', 'combo_index', 'combo_index_with_offsets', 'last_in_combo')
+
     @property
     def angle(self) -> float:
-        return getattr(self, '_angle', 0.0)
+        return self._angle
 
     @angle.setter
     def angle(self, value: float):
@@ -224,15 +516,16 @@ class TauHitObject(HitObject):
 
     @property
     def range(self) -> float:
-        return getattr(self, '_range', 0.0)
+        return self._range
 
     @range.setter
     def range(self, value: float):
         self._range = value
-    """Tau游戏基础物件"""
     
     def __init__(self):
         super().__init__()
+        self._angle: float = 0.0
+        self._range: float = 0.0
         self.time_preempt: float = 600
         self.time_fade_in: float = 400
         self.new_combo: bool = False
@@ -246,13 +539,16 @@ class TauHitObject(HitObject):
 
 class AngledTauHitObject(TauHitObject, IHasAngle):
     """具有角度的Tau物件"""
+
+    # path / duration 以类属性提供默认值：Slider 把 duration 定义为只读属性，
+    # 在 __init__ 中赋值会导致 Slider() 抛出 AttributeError
+    path = None  # 补充 path 属性，滑条相关
+    duration: float = 0.0  # 补充 duration 属性
+    __slots__ = ('angle_range',)
     
     def __init__(self):
         super().__init__()
-        self._angle: float = 0.0
         self.angle_range: float = 0.0
-        self.path = None  # 补充 path 属性，滑条相关
-        self.duration: float = 0.0  # 补充 duration 属性
     
     @property
     def angle(self) -> float:
@@ -265,16 +561,17 @@ class AngledTauHitObject(TauHitObject, IHasAngle):
 
 class Beat(AngledTauHitObject):
     """节拍物件"""
-    pass
+    __slots__ = ()
 
 
 class HardBeat(TauHitObject):
     """硬节拍物件"""
-    pass
+    __slots__ = ()
 
 
 class StrictHardBeat(HardBeat):
     """严格硬节拍物件"""
+    __slots__ = ()
     
     def __init__(self):
         super().__init__()
@@ -285,20 +582,26 @@ class Slider(AngledTauHitObject, IHasOffsetAngle):
     """滑条物件"""
     
     BASE_SCORING_DISTANCE: int = 100
+    __slots__ = ('is_hard', 'path', 'head_beat', '_tail_samples', 'velocity', 'tick_distance',
+                 'tick_distance_multiplier', 'repeat_count', '_node_samples', '_span_duration', '_nested_hit_objects')
+    tail_samples: List[HitSampleInfo] = _LazyList()
+    node_samples: List[List[HitSampleInfo]] = _LazyList()
+    # 首次访问时由 iter_nested_hit_objects 生成；转换器设置完速度、刻度间距与路径后才会被读取
+    nested_hit_objects: List[HitObject] = _LazyList(lambda slider: list(slider.iter_nested_hit_objects()))
     
     def __init__(self):
         super().__init__()
         self.is_hard: bool = False
         self.path: Optional[PolarSliderPath] = None
         self.head_beat: Optional[AngledTauHitObject] = None
-        self.tail_samples: List[HitSampleInfo] = []
+        self._tail_samples = None
         self.velocity: float = 0
         self.tick_distance: float = 0
         self.tick_distance_multiplier: float = 2
         self.repeat_count: int = 0
-        self.node_samples: List[List[HitSampleInfo]] = []
+        self._node_samples = None
         self._span_duration: float = 0
-        self.nested_hit_objects: List[HitObject] = []
+        self._nested_hit_objects = None
     # self.duration: float = 0.0  # 移除重复声明，避免与 @property 冲突
     
     @property
@@ -323,9 +626,65 @@ class Slider(AngledTauHitObject, IHasOffsetAngle):
             return self.path.end_node.angle
         return 0
 
+    def iter_slider_events(self) -> Iterator['SliderEvent']:
+        """按时间顺序生成滑条事件，跨度长度取 velocity * span_duration（见 generate_slider_events）"""
+        span_duration = self.span_duration
+        return generate_slider_events(self.start_time, span_duration, self.velocity, self.tick_distance,
+                                      self.velocity * span_duration, self.repeat_count + 1)
+
+    def iter_nested_hit_objects(self) -> Iterator[HitObject]:
+        """
+        逐个生成嵌套物件，模仿 osu!tau Slider.CreateNestedHitObjects
+
+        头部为 SliderHeadBeat（is_hard 时为 SliderHardBeat）并记录到 head_beat，之后按时间顺序为
+        SliderTick 与 SliderRepeat，角度取路径在对应进度处的角度（相对于滑条起始角度）。
+        尾部由滑条本身判定，不生成物件。
+        """
+        path = self.path
+        if path is not None and path.start_node is not None:
+            path_start, path_duration = path.start_node.time, path.duration
+        for event in self.iter_slider_events():
+            kind = event.type
+            if kind is SliderEventType.HEAD:
+                head = SliderHardBeat() if self.is_hard else SliderHeadBeat()
+                head.parent_slider = self
+                head.start_time = event.time
+                self.head_beat = head
+                yield head
+            elif kind is not SliderEventType.TAIL:
+                if kind is SliderEventType.TICK:
+                    nested = SliderTick()
+                else:
+                    nested = SliderRepeat()
+                    nested.repeat_index = event.span_index
+                nested.parent_slider = self
+                nested.start_time = event.time
+                if path is not None and path.start_node is not None:
+                    nested.angle = path.angle_at(path_start + event.path_progress * path_duration)
+                yield nested
+
+    def create_nested_hit_objects(self) -> List[HitObject]:
+        """
+        重新生成全部嵌套物件并保存到 nested_hit_objects
+
+        nested_hit_objects 首次访问时会自动生成；生成后修改了速度、刻度间距、重复次数或路径时调用。
+        """
+        self.nested_hit_objects = list(self.iter_nested_hit_objects())
+        return self.nested_hit_objects
+
+    @property
+    def max_combo(self) -> int:
+        """
+        滑条贡献的最大连击数
+
+        嵌套物件（头部、刻度、重复点）各计 1，再加上由滑条本身判定的尾部。
+        """
+        return len(self.nested_hit_objects) + 1
+
 
 class SliderHeadBeat(Beat, IHasOffsetAngle):
     """滑条头部节拍"""
+    __slots__ = ('parent_slider',)
     
     def __init__(self):
         super().__init__()
@@ -338,6 +697,7 @@ class SliderHeadBeat(Beat, IHasOffsetAngle):
 
 class SliderHardBeat(StrictHardBeat, IHasOffsetAngle):
     """滑条硬节拍"""
+    __slots__ = ('parent_slider',)
     
     def __init__(self):
         super().__init__()
@@ -350,6 +710,7 @@ class SliderHardBeat(StrictHardBeat, IHasOffsetAngle):
 
 class SliderRepeat(AngledTauHitObject, IHasOffsetAngle):
     """滑条重复点"""
+    __slots__ = ('parent_slider', 'repeat_index')
     
     def __init__(self):
         super().__init__()
@@ -363,6 +724,7 @@ class SliderRepeat(AngledTauHitObject, IHasOffsetAngle):
 
 class SliderTick(AngledTauHitObject, IHasOffsetAngle):
     """滑条刻度点"""
+    __slots__ = ('parent_slider',)
     
     def __init__(self):
         super().__init__()
@@ -373,6 +735,88 @@ class SliderTick(AngledTauHitObject, IHasOffsetAngle):
         return self.parent_slider.angle if self.parent_slider else 0
 
 
+class SliderEventType(Enum):
+    """滑条事件类型"""
+    HEAD = "Head"
+    TICK = "Tick"
+    REPEAT = "Repeat"
+    TAIL = "Tail"
+
+
+@dataclass
+class SliderEvent:
+    """滑条事件，模仿 osu! SliderEventDescriptor"""
+    type: SliderEventType
+    span_index: int
+    span_start_time: float
+    time: float
+    path_progress: float
+
+
+# 生成刻度的最大滑条长度（osu! 中的宽松上限）
+MAX_SLIDER_EVENT_LENGTH = 100000
+
+
+def generate_slider_events(start_time: float, span_duration: float, velocity: float, tick_distance: float,
+                           total_distance: float, span_count: int) -> Iterator[SliderEvent]:
+    """
+    按时间顺序逐个生成滑条事件，模仿 osu! SliderEventGenerator.Generate
+
+    刻度从路径起点按 tick_distance 排列，离跨度终点不足 velocity * 10 的刻度被省略；
+    反向跨度的刻度位置与正向相同、时间顺序翻转。与 osu! 一样，tick_distance 为 0 时只产生头部与尾部。
+
+    Args:
+        start_time: 滑条开始时间
+        span_duration: 单个跨度的持续时间
+        velocity: 滑条速度（距离/毫秒）
+        tick_distance: 刻度间距
+        total_distance: 单个跨度的路径长度
+        span_count: 跨度数（repeat_count + 1）
+
+    Yields:
+        SliderEvent：头部、各跨度的刻度与重复点、尾部
+    """
+    length = min(MAX_SLIDER_EVENT_LENGTH, total_distance)
+    tick_distance = min(max(tick_distance, 0), length)
+    min_distance_from_end = velocity * 10
+
+    yield SliderEvent(SliderEventType.HEAD, 0, start_time, start_time, 0)
+
+    if tick_distance != 0:
+        for span in range(span_count):
+            span_start_time = start_time + span * span_duration
+            reversed_span = span % 2 == 1
+
+            ticks = _generate_ticks(span, span_start_time, span_duration, reversed_span, length,
+                                    tick_distance, min_distance_from_end)
+            if reversed_span:
+                # 反向跨度的刻度按时间倒序产生，翻转为时间顺序
+                ticks = reversed(list(ticks))
+            yield from ticks
+
+            if span < span_count - 1:
+                yield SliderEvent(SliderEventType.REPEAT, span, span_start_time,
+                                  span_start_time + span_duration, (span + 1) % 2)
+
+    final_span_index = span_count - 1
+    yield SliderEvent(SliderEventType.TAIL, final_span_index, start_time + final_span_index * span_duration,
+                      start_time + span_count * span_duration, span_count % 2)
+
+
+def _generate_ticks(span_index: int, span_start_time: float, span_duration: float, reversed_span: bool,
+                    length: float, tick_distance: float, min_distance_from_end: float) -> Iterator[SliderEvent]:
+    d = tick_distance
+    while d <= length:
+        if d >= length - min_distance_from_end:
+            break
+        # 刻度总是从路径起点开始排列，反向跨度中的刻度与正向跨度位置相同
+        path_progress = d / length
+        time_progress = 1 - path_progress if reversed_span else path_progress
+        yield SliderEvent(SliderEventType.TICK, span_index, span_start_time,
+                          span_start_time + time_progress * span_duration, path_progress)
+        d += tick_distance
+
+
 def from_polar_coordinates(distance: float, angle: float) -> Tuple[float, float]:
     """从极坐标获取笛卡尔坐标位置"""
     x = -(distance * math.cos(math.radians(angle + 90)))
@@ -0,0 +1,188 @@
+"""
+TauBeatmap 的紧凑二进制序列化
+
+convert_osu_beatmap 的开销主要在滑条上（曲线近似、20ms 极坐标采样、逐点 atan2）。
+把转换结果保存下来，之后直接读取即可跳过整个转换过程。
+
+格式（common.binary 容器，版本号变化时旧数据会被拒绝）：
+- 头部 JSON：metadata、difficulty_attributes、file_version、timing_points
+- 每个物件一项的列：类型、start_time、new_combo / is_hard 标志、angle、range、
+  repeat_count、tick_distance_multiplier、velocity、tick_distance
+- 滑条路径：所有 SliderNode 的 time / angle 扁平存放，按 node_offsets 定位；
+  ArrayPolarSliderPath 读取时直接由这两列构造，路径类型保持不变
+
+只保存转换器会设置的状态；嵌套物件、采样等运行时字段读取后为默认值。
+
+用法：
+    data = dumps(convert_osu_beatmap(osu_beatmap))
+    tau_beatmap = loads(data)
+"""
+
+from array import array
+from typing import BinaryIO
+
+from any.models.TimePoint import FloatTimePoint
+from common import binary
+from .beatmap import TauBeatmap
+from .objects import Beat, HardBeat, StrictHardBeat, Slider, PolarSliderPath, ArrayPolarSliderPath, SliderNode
+
+MAGIC = b"GUTB"
+FORMAT_VERSION = 2
+
+# 物件类型编码（顺序固定，属于格式的一部分）
+_KINDS = (Beat, HardBeat, StrictHardBeat, Slider)
+_KIND_CODES = {cls: code for code, cls in enumerate(_KINDS)}
+
+# flags 列
+_NEW_COMBO = 0b1
+_IS_HARD = 0b10
+_HAS_PATH = 0b100
+_ARRAY_PATH = 0b1000  # 路径为 ArrayPolarSliderPath（不带此位的旧数据按 PolarSliderPath 读取）
+
+_COLUMN_COUNT = 12
+
+
+def _timing_point_fields(tp) -> list:
+    time = getattr(tp, 'time', None)
+    if time is None:
+        time = tp.start_time
+    return [float(time), float(tp.beat_length), tp.meter, tp.sample_set, tp.sample_index,
+            tp.volume, bool(tp.uninherited), tp.effects]
+
+
+def dumps(beatmap: TauBeatmap) -> bytes:
+    """
+    序列化 TauBeatmap
+
+    Args:
+        beatmap: 转换后的 Tau 谱面
+
+    Returns:
+        二进制数据
+
+    Raises:
+        TypeError: 谱面中含有无法序列化的物件类型
+    """
+    kinds = array('B')
+    start_times = array('d')
+    flags = array('B')
+    angles = array('d')
+    ranges = array('d')
+    repeat_counts = array('i')
+    tick_multipliers = array('d')
+    velocities = array('d')
+    tick_distances = array('d')
+    node_offsets = array('i', [0])
+    node_times = array('d')
+    node_angles = array('d')
+
+    for obj in beatmap.hit_objects:
+        code = _KIND_CODES.get(type(obj))
+        if code is None:
+            raise TypeError(f"cannot serialize hit object of type {type(obj).__name__}")
+        kinds.append(code)
+        start_times.append(obj.start_time)
+        flag = _NEW_COMBO if obj.new_combo else 0
+        angles.append(obj.angle)
+        ranges.append(obj.range)
+        if code == 3:
+            if obj.is_hard:
+                flag |= _IS_HARD
+            repeat_counts.append(obj.repeat_count)
+            tick_multipliers.append(obj.tick_distance_multiplier)
+            velocities.append(obj.velocity)
+            tick_distances.append(obj.tick_distance)
+            path = obj.path
+            if path is not None:
+                flag |= _HAS_PATH
+                if isinstance(path, ArrayPolarSliderPath):
+                    flag |= _ARRAY_PATH
+                    node_times.extend(path.times)
+                    node_angles.extend(path.angles)
+                else:
+                    for node in path.nodes:
+                        node_times.append(node.time)
+                        node_angles.append(node.angle)
+        else:
+            repeat_counts.append(0)
+            tick_multipliers.append(0.0)
+            velocities.append(0.0)
+            tick_distances.append(0.0)
+        flags.append(flag)
+        node_offsets.append(len(node_times))
+
+    header = {
+        "metadata": beatmap.metadata,
+        "difficulty_attributes": beatmap.difficulty_attributes,
+        "file_version": beatmap.file_version,
+        "timing_points": [_timing_point_fields(tp) for tp in beatmap.timing_points],
+    }
+    return binary.pack(MAGIC, FORMAT_VERSION, header, [
+        kinds, start_times, flags, angles, ranges, repeat_counts, tick_multipliers, velocities, tick_distances,
+        node_offsets, node_times, node_angles,
+    ])
+
+
+def loads(data: bytes) -> TauBeatmap:
+    """
+    反序列化 dumps() 的输出
+
+    Args:
+        data: 二进制数据
+
+    Returns:
+        TauBeatmap
+
+    Raises:
+        ValueError: 格式或版本不匹配、数据损坏
+    """
+    header, columns = binary.unpack(data, MAGIC, FORMAT_VERSION, _COLUMN_COUNT)
+    (kinds, start_times, flags, angles, ranges, repeat_counts, tick_multipliers, velocities, tick_distances,
+     node_offsets, node_times, node_angles) = columns
+    if len(node_offsets) != len(kinds) + 1 or node_offsets[-1] != len(node_times):
+        raise ValueError("corrupt data: node offsets do not match node arrays")
+
+    beatmap = TauBeatmap()
+    beatmap.metadata = header["metadata"]
+    beatmap.difficulty_attributes = header["difficulty_attributes"]
+    beatmap.file_version = header["file_version"]
+    beatmap.timing_points = [FloatTimePoint(int(f[0]), *f[1:]) for f in header["timing_points"]]
+
+    hit_objects = beatmap.hit_objects
+    for i in range(len(kinds)):
+        code = kinds[i]
+        if code >= len(_KINDS):
+            raise ValueError(f"corrupt data: unknown hit object kind {code}")
+        obj = _KINDS[code]()
+        obj.start_time = start_times[i]
+        obj.new_combo = bool(flags[i] & _NEW_COMBO)
+        if code != 1:  # HardBeat 不带角度
+            obj.angle = angles[i]
+            if code == 2:
+                obj.range = ranges[i]
+            elif code == 3:
+                obj.is_hard = bool(flags[i] & _IS_HARD)
+                obj.repeat_count = repeat_counts[i]
+                obj.tick_distance_multiplier = tick_multipliers[i]
+                obj.velocity = velocities[i]
+                obj.tick_distance = tick_distances[i]
+                if flags[i] & _HAS_PATH:
+                    start = node_offsets[i]
+                    end = node_offsets[i + 1]
+                    if flags[i] & _ARRAY_PATH:
+                        obj.path = ArrayPolarSliderPath.from_samples(node_times[start:end], node_angles[start:end])
+                    else:
+                        obj.path = PolarSliderPath([SliderNode(t, a) for t, a in
+                                                    zip(node_times[start:end], node_angles[start:end])])
+        hit_objects.append(obj)
+    return beatmap
+
+
+def dump(beatmap: TauBeatmap, fp: BinaryIO):
+    """把 TauBeatmap 写入二进制文件对象"""
+    fp.write(dumps(beatmap))
+
+
+def load(fp: BinaryIO) -> TauBeatmap:
+    """从二进制文件对象读取 TauBeatmap"""
+    return loads(fp.read())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 测试共用的辅助模块（如 sample_beatmap）与测试文件放在同一目录，不依赖 pytest 的导入模式
+sys.path.insert(0, os.path.dirname(__file__))
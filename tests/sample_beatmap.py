@@ -0,0 +1,52 @@
+"""测试共用的 .osu 样例谱面与 any 模型快照"""
+
+SAMPLE = "\r\n".join([
+    "osu file format v14",
+    "",
+    "[General]",
+    "Mode: 0",
+    "",
+    "[Metadata]",
+    "Title:Song [TV Size]",
+    "",
+    "[Difficulty]",
+    "HPDrainRate:5",
+    "CircleSize:4",
+    "OverallDifficulty:8",
+    "ApproachRate:9",
+    "SliderMultiplier:1.4",
+    "SliderTickRate:1",
+    "",
+    "[Events]",
+    "// comment",
+    "Sprite,Foreground,Centre,\"sb/a.png\",320,240",
+    "",
+    "[TimingPoints]",
+    "0,500,4,2,0,60,1,0",
+    "1000,-50,4,2,0,60,0,1",
+    "",
+    "[HitObjects]",
+    "256,192,0,5,0,0:0:0:0:",
+    "100,100,500,2,0,L|200:100,1,100",
+    "100,100,900,6,2,B|150:50|150:50|250:100,2,150,2|0|8,0:0|1:0|0:0,0:0:0:0:",
+    "256,192,1500,12,0,2500,0:0:0:0:",
+    "10,20,3000,1",
+    "",
+])
+
+
+def snapshot(beatmap):
+    """any 模型谱面的可比较快照：难度字段、时间点与物件属性"""
+    def obj(o):
+        d = dict(vars(o))
+        d["pos"] = vars(o.pos)
+        if getattr(o, "curves", None) is not None:
+            d["curves"] = (o.curves.type, [vars(p) for p in o.curves.control_points])
+        return d
+    return (
+        [(k, getattr(beatmap, k)) for k in ("hp", "cs", "od", "ar", "slider_multiplier", "slider_tick_rate", "bpm",
+                                           "play_time", "drain_time", "ncircles", "nsliders", "nspinners",
+                                           "total_hits")],
+        [vars(t) for t in beatmap.timing_points],
+        [obj(o) for o in beatmap.hit_objects],
+    )
@@ -0,0 +1,72 @@
+from any.osu_parser import parse_osu_file
+from common.ingest import ingest
+from osu_std.parser import parse_osu
+from sentakki.beatmaps.converter import SentakkiConverter
+from tau.convertor import convert_osu_beatmap
+from tau.objects import Slider
+from sample_beatmap import SAMPLE, snapshot
+
+# 省略可选字段的物件行：无 hitSample 的转盘、缺少重复次数 / 长度 / 曲线的滑条
+SHORT_ROWS = SAMPLE + "\n".join([
+    "256,192,4000,12,0,6000",
+    "100,100,7000,2,0,B|200:200|300:100",
+    "100,100,7500,2,0,L|150:100,2",
+    "100,100,8000,2,0",
+    "",
+])
+
+
+def _timing(beatmap):
+    return [(t.start_time, float(t.beat_length), t.meter, t.sample_set, t.sample_index, t.volume,
+             t.uninherited, t.effects) for t in beatmap.timing_points]
+
+
+def test_tau_view_matches_any_parser():
+    expected = parse_osu_file(SAMPLE)
+    view = ingest(SAMPLE).for_tau()
+    assert _timing(view) == _timing(expected)
+    view.timing_points = expected.timing_points
+    assert snapshot(view) == snapshot(expected)
+    tau_a = convert_osu_beatmap(expected)
+    tau_b = convert_osu_beatmap(view)
+    assert [(type(o).__name__, o.start_time) for o in tau_a.hit_objects] == \
+        [(type(o).__name__, o.start_time) for o in tau_b.hit_objects]
+
+
+def test_sentakki_view_matches_osu_std_parser():
+    expected = parse_osu(SAMPLE)
+    view = ingest(SAMPLE.encode()).for_sentakki()
+    assert list(view.hit_objects) == expected.hit_objects
+    assert view.timing_points == expected.timing_points
+    assert view.difficulty == expected.difficulty
+    a = SentakkiConverter(expected).convert()
+    b = SentakkiConverter(view).convert()
+    assert [(o.kind, o.time, o.lane) for o in a.objects] == [(o.kind, o.time, o.lane) for o in b.objects]
+
+
+def test_rows_without_optional_fields_match_parsers():
+    expected = parse_osu_file(SHORT_ROWS)
+    view = ingest(SHORT_ROWS).for_tau()
+    view.timing_points = expected.timing_points
+    assert snapshot(view) == snapshot(expected)
+    spinner = view.hit_objects[-4]
+    assert spinner.end_time == 6000
+    assert [(o.repeat_count, o.length) for o in view.hit_objects[-3:]] == [(1, 0), (2, 0), (1, 0)]
+    assert view.hit_objects[-1].curves.control_points[0].x == 100
+    # 转盘转换为 Tau 的转盘滑条
+    converted = convert_osu_beatmap(view).hit_objects
+    assert any(isinstance(o, Slider) and o.start_time == 4000 for o in converted)
+    assert [(type(o).__name__, o.start_time) for o in converted] == \
+        [(type(o).__name__, o.start_time) for o in convert_osu_beatmap(expected).hit_objects]
+
+    std = parse_osu(SHORT_ROWS)
+    assert list(ingest(SHORT_ROWS).for_sentakki().hit_objects) == std.hit_objects
+    assert std.hit_objects[-4].extras["spinner"].end_time == 6000
+
+
+def test_tau_view_builds_each_object_once():
+    hit_objects = ingest(SAMPLE).for_tau().hit_objects
+    second = hit_objects[1]
+    assert hit_objects[1] is second and hit_objects[-3] is second
+    assert list(hit_objects)[1] is second
+    assert hit_objects[1:3][0] is second
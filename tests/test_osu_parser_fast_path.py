@@ -0,0 +1,47 @@
+from any.models.others import CurveType
+from any.osu_parser import OsuFileParser, build_section_table, parse_osu_bytes
+from sample_beatmap import SAMPLE, snapshot
+
+
+def test_section_table_skips_brackets_inside_lines():
+    names = [name for name, _, _ in build_section_table(SAMPLE.encode())]
+    assert names == ["general", "metadata", "difficulty", "events", "timingpoints", "hitobjects"]
+
+
+def test_bytes_fast_path_matches_text_parser():
+    expected = snapshot(OsuFileParser().parse(SAMPLE))
+    data = SAMPLE.encode()
+    assert snapshot(parse_osu_bytes(data)) == expected
+    assert snapshot(parse_osu_bytes(memoryview(data))) == expected
+
+
+def test_float_timing_points_match_decimal():
+    expected = [(t.start_time, float(t.beat_length), t.meter, t.sample_set, t.sample_index,
+                 t.volume, t.uninherited, t.effects) for t in OsuFileParser().parse(SAMPLE).timing_points]
+    for beatmap in (OsuFileParser(float_timing=True).parse(SAMPLE), parse_osu_bytes(SAMPLE.encode(), float_timing=True)):
+        assert [(t.start_time, t.beat_length, t.meter, t.sample_set, t.sample_index,
+                 t.volume, t.uninherited, t.effects) for t in beatmap.timing_points] == expected
+        assert all(type(t.beat_length) is float for t in beatmap.timing_points)
+
+
+def test_slider_fields_are_read_from_their_own_columns():
+    for beatmap in (OsuFileParser().parse(SAMPLE), parse_osu_bytes(SAMPLE.encode())):
+        short, full = beatmap.hit_objects[1], beatmap.hit_objects[2]
+        assert short.curves.type == CurveType.linear
+        assert [(p.x, p.y) for p in short.curves.control_points] == [(100, 100), (200, 100)]
+        assert (short.repeat_count, short.length, short.hit_sample) == (1, 100.0, "")
+        assert full.curves.type == CurveType.Bezier
+        assert [(p.x, p.y) for p in full.curves.control_points] == [(100, 100), (150, 50), (150, 50), (250, 100)]
+        assert (full.repeat_count, full.length) == (2, 150.0)
+        assert type(full.length) is float
+        assert (full.edge_hitsounds, full.edge_sets) == ([2, 0, 8], ["0:0", "1:0", "0:0"])
+        assert full.hit_sample == "0:0:0:0:"
+
+
+def test_slider_without_curve_field_gets_defaults():
+    text = SAMPLE.replace("10,20,3000,1", "10,20,3000,2,0")
+    for beatmap in (OsuFileParser().parse(text), parse_osu_bytes(text.encode())):
+        slider = beatmap.hit_objects[-1]
+        assert slider.curves.type == CurveType.linear
+        assert [(p.x, p.y) for p in slider.curves.control_points] == [(10, 20)]
+        assert (slider.repeat_count, slider.length) == (1, 0)
@@ -0,0 +1,47 @@
+from osu_std import OsuFileParser, HitObjectColumns, parse_hit_object
+
+LINES = [
+    "256,192,0,5,0,0:0:0:0:",
+    "256,192,100,1,2",
+    "100,100,500,2,0,L|200:100,1,100",
+    "100,100,900,6,2,B|150:50|150:50|250:100,2,150,2|0|8,0:0|1:0|0:0,1:2:0:70:clap.wav",
+    "100,100,1000,2,0,P|bad|120:80,x,y",
+    "100,100,1100,2,0,L|200:100",
+    "256,192,1500,12,0,2500,0:0:0:0:",
+    "256,192,1600,8,0,oops,0:0:0:0:",
+    "256,192,2000,8,0,2800",
+    "10,20,3000",
+    "a,b,c,d,e",
+]
+
+
+def test_views_match_parse_hit_object():
+    columns = HitObjectColumns()
+    expected = []
+    for line in LINES:
+        ho = parse_hit_object(line)
+        assert columns.append_line(line) == (ho is not None)
+        if ho is not None:
+            expected.append(ho)
+    assert len(columns) == len(expected)
+    assert list(columns) == expected
+    assert columns[-1] == expected[-1]
+    assert columns[1:3] == expected[1:3]
+
+
+def test_spinner_without_hit_sample():
+    columns = HitObjectColumns()
+    columns.append_line("256,192,2000,8,0,2800")
+    for ho in (parse_hit_object("256,192,2000,8,0,2800"), columns[0]):
+        assert ho.extras["spinner"].end_time == 2800
+        assert "sample" not in ho.extras
+
+
+def test_parser_columnar_switch():
+    text = "\n".join(["osu file format v14", "[Difficulty]", "SliderMultiplier:1.4",
+                      "[TimingPoints]", "0,500,4,2,0,60,1,0", "[HitObjects]"] + LINES)
+    plain = OsuFileParser().parse(text)
+    columnar = OsuFileParser(columnar=True).parse(text)
+    assert isinstance(columnar.hit_objects, HitObjectColumns)
+    assert list(columnar.hit_objects) == plain.hit_objects
+    assert columnar.compute_max_combo() == plain.compute_max_combo()
@@ -0,0 +1,30 @@
+import pickle
+
+from osu_std import LazyExtras, parse_hit_object
+from test_osu_std_columnar import LINES
+
+
+def test_lazy_mode_matches_eager():
+    for line in LINES:
+        eager = parse_hit_object(line)
+        lazy = parse_hit_object(line, lazy=True)
+        assert (lazy is None) == (eager is None)
+        if eager is None:
+            continue
+        assert isinstance(lazy.extras, LazyExtras)
+        assert set(lazy.extras) == set(eager.extras)
+        assert lazy == eager
+        assert pickle.loads(pickle.dumps(lazy)) == eager
+
+
+def test_lazy_fields_decode_on_access():
+    ho = parse_hit_object("100,100,900,6,2,B|150:50|250:100,2,150,2|0|8,0:0|1:0|0:0,1:2:0:70:clap.wav", lazy=True)
+    assert dict.__getitem__(ho.extras, 'hit_sounds') == 2
+    assert dict.__getitem__(ho.extras, 'sample') == "1:2:0:70:clap.wav"
+    assert ho.extras.get('sample')['filename'] == "clap.wav"
+    assert ho.extras['hit_sounds']['whistle'] is True
+    slider = ho.extras['slider']
+    assert 'node_hit_sounds' not in vars(slider)
+    assert [node['raw'] for node in slider.node_hit_sounds] == [2, 0, 8]
+    ho.extras['sample'] = {'filename': 'x'}
+    assert dict(ho.extras)['sample'] == {'filename': 'x'}
@@ -0,0 +1,55 @@
+import os
+
+from common.ingest import ingest
+from common.parse_cache import ParseCache, dump_canonical, load_canonical
+from sample_beatmap import SAMPLE
+
+
+def test_binary_round_trip_matches_fresh_parse():
+    expected = ingest(SAMPLE).for_sentakki()
+    restored = load_canonical(dump_canonical(ingest(SAMPLE))).for_sentakki()
+    assert list(restored.hit_objects) == list(expected.hit_objects)
+    assert restored.timing_points == expected.timing_points
+    assert restored.difficulty == expected.difficulty
+    assert restored.metadata == expected.metadata
+    assert restored.format_version == expected.format_version
+
+
+def test_lru_hits_and_eviction():
+    cache = ParseCache(max_entries=1)
+    other = SAMPLE.replace("Title:", "Title:other ")
+    first = cache.get(SAMPLE)
+    assert cache.get(SAMPLE.encode()) is first
+    cache.get(other)
+    assert cache.get(SAMPLE) is not first
+    stats = cache.stats
+    assert (stats.hits, stats.misses, stats.evictions, stats.entries) == (1, 3, 2, 1)
+
+
+def test_disk_layer_survives_restart(tmp_path):
+    ParseCache(cache_dir=tmp_path).get(SAMPLE)
+    cache = ParseCache(cache_dir=tmp_path)
+    canonical = cache.get(SAMPLE)
+    assert (cache.stats.disk_hits, cache.stats.misses) == (1, 0)
+    assert list(canonical.for_sentakki().hit_objects) == list(ingest(SAMPLE).for_sentakki().hit_objects)
+
+
+def test_corrupt_disk_entry_is_reparsed(tmp_path):
+    cache = ParseCache(cache_dir=tmp_path)
+    cache.get(SAMPLE)
+    path = os.path.join(tmp_path, ParseCache.key_for(SAMPLE.encode()) + ".bin")
+    with open(path, "r+b") as f:
+        f.truncate(40)
+    cache = ParseCache(cache_dir=tmp_path)
+    cache.get(SAMPLE)
+    assert (cache.stats.disk_hits, cache.stats.misses, cache.stats.disk_writes) == (0, 1, 1)
+
+
+def test_disk_eviction_keeps_size_bounded(tmp_path):
+    size = len(dump_canonical(ingest(SAMPLE)))
+    cache = ParseCache(cache_dir=tmp_path, max_disk_bytes=size * 2 + size // 2)
+    for i in range(4):
+        cache.get(SAMPLE.replace("Title:", f"Title:{i}"))
+    assert cache.stats.disk_evictions >= 2
+    assert cache.stats.disk_bytes <= cache.max_disk_bytes
+    assert sum(os.path.getsize(os.path.join(tmp_path, n)) for n in os.listdir(tmp_path)) == cache.stats.disk_bytes
@@ -0,0 +1,54 @@
+import io
+
+import pytest
+
+from osu_std.parser import parse_osu
+from sentakki.beatmaps import ConversionFlags, Slide, SlideSegment, Touch, TouchHold
+from sentakki.beatmaps.objects import SlideBodyInfo, SlidePathPart
+from sentakki.beatmaps.serialization import dumps, loads
+from sentakki.converter import SentakkiConverter
+from sentakki.difficulty.beatmap_base import SentakkiBeatmap
+from sample_beatmap import SAMPLE
+
+
+def _converted():
+    flags = ConversionFlags.TWIN_NOTES | ConversionFlags.FAN_SLIDES | ConversionFlags.TWIN_SLIDES
+    beatmap = SentakkiConverter(parse_osu(SAMPLE), flags=flags).convert()
+    beatmap.objects.extend([
+        Touch(time=9000, lane=3, x=12.5, y=-4.0),
+        TouchHold(time=9100, lane=0, duration=400, x=1.0, y=2.0),
+        Slide(time=9600, lane=5, segments=[SlideSegment(end_lane=1, duration=300, fan=True)]),
+        Slide(time=9800, lane=2, flags=3, body=SlideBodyInfo(
+            parts=[SlidePathPart('circle_cw', 400, True, 320, 400), SlidePathPart('fan', 500, False, 500, 900, 0.44)],
+            duration=900, shoot_delay=120, fan_start_progress=0.44, end_lane=6, complexity=3.5)),
+    ])
+    return beatmap
+
+
+def test_round_trip_preserves_objects():
+    expected = _converted()
+    assert any(isinstance(o, Slide) and o.body for o in expected.objects)
+    restored = loads(dumps(expected))
+    assert restored.objects == expected.objects
+    assert [type(o) for o in restored.objects] == [type(o) for o in expected.objects]
+    assert (restored.star_rating, restored.max_combo, restored.approach_rate) == \
+        (expected.star_rating, expected.max_combo, expected.approach_rate)
+
+
+def test_save_and_load(tmp_path):
+    expected = _converted()
+    path = tmp_path / "map.sentakki"
+    expected.save(path)
+    assert SentakkiBeatmap.load(path).objects == expected.objects
+    buf = io.BytesIO()
+    expected.save(buf)
+    buf.seek(0)
+    assert SentakkiBeatmap.load(buf).objects == expected.objects
+
+
+def test_rejects_other_formats():
+    data = dumps(_converted())
+    with pytest.raises(ValueError):
+        loads(data[:4] + b"\x09\x00" + data[6:])
+    with pytest.raises(ValueError):
+        loads(data[:-3])
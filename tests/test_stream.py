@@ -0,0 +1,49 @@
+import io
+
+from any.osu_parser import parse_osu_file, stream_osu_file, iter_hit_objects as iter_any_hit_objects
+from common.stream import iter_text_blocks, split_concatenated
+from osu_std.parser import parse_osu, stream_osu
+from tau.convertor import convert_osu_beatmap
+from sample_beatmap import SAMPLE, snapshot
+
+SECOND = SAMPLE.replace("256,192,0,5,0,0:0:0:0:", "300,100,100,1,0,0:0:0:0:")
+
+
+def test_split_and_blocks():
+    data = (SAMPLE + SECOND).encode()
+    ranges = split_concatenated(data)
+    assert [data[s:e].decode() for s, e in ranges] == [SAMPLE, SECOND]
+    blocks = list(iter_text_blocks(data, 0, len(data), block_size=7))
+    assert "".join(blocks) == SAMPLE + SECOND
+    assert all(block.endswith("\n") for block in blocks)
+
+
+def test_stream_pack_from_path(tmp_path):
+    path = tmp_path / "pack.osu"
+    path.write_bytes((SAMPLE + SECOND).encode())
+
+    streamed = [(_snapshot_streamed(b)) for b in stream_osu_file(str(path))]
+    assert streamed == [_hit_objects(parse_osu_file(SAMPLE)), _hit_objects(parse_osu_file(SECOND))]
+    assert len(list(iter_any_hit_objects(path))) == 2 * len(parse_osu_file(SAMPLE).hit_objects)
+
+    for beatmap, text in zip(stream_osu(path, lazy=False), (SAMPLE, SECOND)):
+        expected = parse_osu(text)
+        assert list(beatmap.hit_objects) == expected.hit_objects
+        assert beatmap.timing_points == expected.timing_points
+        assert beatmap.difficulty == expected.difficulty
+
+
+def test_stream_file_object_feeds_converter():
+    for beatmap in stream_osu_file(io.BytesIO(SAMPLE.encode())):
+        tau = convert_osu_beatmap(beatmap)
+        expected = convert_osu_beatmap(parse_osu_file(SAMPLE))
+        assert [type(o).__name__ for o in tau.hit_objects] == [type(o).__name__ for o in expected.hit_objects]
+
+
+def _hit_objects(beatmap):
+    return snapshot(beatmap)[2]
+
+
+def _snapshot_streamed(beatmap):
+    beatmap.hit_objects = list(beatmap.hit_objects)
+    return _hit_objects(beatmap)
@@ -0,0 +1,56 @@
+import pytest
+
+from tau.convertor import AdaptiveSampling, TauBeatmapConverter
+from tau.objects import PolarSliderPath, Slider, SliderNode, get_delta_angle
+from test_tau_slider_sampling import _Beatmap, _random_sliders
+
+
+def _convert(sliders, adaptive_sampling=None, impossible=False):
+    converter = TauBeatmapConverter(curve_cache=None, adaptive_sampling=adaptive_sampling)
+    converter.can_convert_impossible_sliders = impossible
+    return [converter.convert_to_slider(slider, _Beatmap()) for slider in sliders]
+
+
+@pytest.mark.parametrize("impossible", [False, True])
+def test_adaptive_sampling_keeps_path_metrics(impossible):
+    sliders = _random_sliders()
+    sampling = AdaptiveSampling(angle_tolerance=5.0, error_bound=0.01)
+    full = _convert(sliders, impossible=impossible)
+    adaptive = _convert(sliders, sampling, impossible=impossible)
+    # 不可能滑条判定在完整采样上进行，结果类型与角度不变
+    assert [(type(a), a.angle) for a in full] == [(type(b), b.angle) for b in adaptive]
+
+    full_nodes = reduced_nodes = 0
+    for a, b in zip(full, adaptive):
+        if not isinstance(a, Slider):
+            continue
+        full_nodes += len(a.path.nodes)
+        reduced_nodes += len(b.path.nodes)
+        assert b.path.duration == a.path.duration
+        assert (b.path.start_node, b.path.end_node) == (a.path.start_node, a.path.end_node)
+        assert abs(b.path.calculated_distance - a.path.calculated_distance) <= sampling.error_bound
+        assert abs(b.path.calculate_lazy_distance(0) - a.path.calculate_lazy_distance(0)) <= sampling.error_bound
+        # 保留节点之间按时间插值的角度误差不超过 angle_tolerance
+        for node in a.path.nodes:
+            assert abs(get_delta_angle(b.path.angle_at(node.time), node.angle)) <= sampling.angle_tolerance + 1e-9
+    assert reduced_nodes * 3 < full_nodes
+
+
+def test_lazy_distance_bound_with_half_tolerance():
+    # 单调匀速转动：lazy distance 与节点数有关，简化受 error_bound 限制
+    nodes = [SliderNode(t * 20, t * 1.0) for t in range(200)]
+    sampling = AdaptiveSampling(angle_tolerance=10.0, error_bound=4.0, lazy_half_tolerance=1.5)
+    kept = sampling.simplify(nodes)
+    assert len(kept) < len(nodes)
+    expected = PolarSliderPath(nodes).calculate_lazy_distance(1.5)
+    assert abs(PolarSliderPath(kept).calculate_lazy_distance(1.5) - expected) <= 4.0
+    assert abs(PolarSliderPath(kept).calculated_distance - PolarSliderPath(nodes).calculated_distance) < 1e-9
+
+
+def test_turning_points_are_kept():
+    angles = [0, 1, 2, 3, 2, 1, 0, 1, 2]
+    kept = AdaptiveSampling(angle_tolerance=30.0).simplify([SliderNode(i * 20, a) for i, a in enumerate(angles)])
+    assert [n.angle for n in kept] == [0, 3, 0, 2]
+
+    with pytest.raises(ValueError):
+        AdaptiveSampling(angle_tolerance=180)
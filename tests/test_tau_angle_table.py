@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from any.models.others import Pos
+from tau import convertor
+from tau.convertor import AngleTable, TauBeatmapConverter, get_hit_object_angle
+from tau.objects import Slider
+from test_tau_slider_sampling import _Beatmap, _random_sliders
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture(scope="module")
+def table():
+    return AngleTable()
+
+
+def _angle_error(a, b):
+    return np.abs(np.mod(np.asarray(a) - np.asarray(b) + 180, 360) - 180)
+
+
+def test_integer_coordinates_are_exact(table):
+    rng = random.Random(1)
+    points = [(rng.randint(0, 512), rng.randint(0, 384)) for _ in range(2000)] + [(256, 192), (0, 0), (512, 384)]
+    xs, ys = zip(*points)
+    expected = [get_hit_object_angle(Pos(x, y)) for x, y in points]
+    assert table.angles(xs, ys).tolist() == expected
+
+
+def test_float_coordinates_within_error_bound(table):
+    rng = np.random.default_rng(2)
+    # 含游戏区域外与中心附近的点
+    xs = rng.uniform(-100, 612, 20000)
+    ys = rng.uniform(-100, 484, 20000)
+    expected = [get_hit_object_angle(Pos(x, y)) for x, y in zip(xs.tolist(), ys.tolist())]
+    angles = table.angles(xs, ys)
+    assert ((angles >= 0) & (angles < 360)).all()
+    assert _angle_error(angles, expected).max() <= AngleTable.MAX_INTERPOLATION_ERROR
+
+
+def test_converter_uses_table_for_numpy_sampling(table, monkeypatch):
+    monkeypatch.setattr(convertor, "NUMPY_MIN_SAMPLES", 0)
+    sliders = _random_sliders()
+    exact = TauBeatmapConverter(use_numpy=True)
+    approx = TauBeatmapConverter(use_numpy=True, angle_table=table)
+    compared = 0
+    for slider in sliders:
+        a = exact.convert_to_slider(slider, _Beatmap())
+        b = approx.convert_to_slider(slider, _Beatmap())
+        if isinstance(a, Slider) and isinstance(b, Slider):
+            assert [n.time for n in a.path.nodes] == [n.time for n in b.path.nodes]
+            # 相对角度由两个近似角度相减得到
+            error = _angle_error([n.angle for n in a.path.nodes], [n.angle for n in b.path.nodes])
+            assert error.max() <= 2 * AngleTable.MAX_INTERPOLATION_ERROR
+            compared += 1
+    assert compared > 0
+
+    with pytest.raises(ValueError):
+        TauBeatmapConverter(angle_table=table)
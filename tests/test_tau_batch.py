@@ -0,0 +1,37 @@
+from tau.batch import calculate_batch, find_osu_files, main
+from sample_beatmap import SAMPLE
+
+
+def _write_maps(tmp_path):
+    paths = []
+    for i in range(5):
+        folder = tmp_path / ("nested" if i % 2 else "")
+        folder.mkdir(exist_ok=True)
+        path = folder / f"map{i}.osu"
+        path.write_text(SAMPLE, encoding="utf-8")
+        paths.append(str(path))
+    (tmp_path / "notes.txt").write_text("ignored")
+    return paths
+
+
+def test_batch_results_in_input_order(tmp_path):
+    paths = _write_maps(tmp_path)
+    assert sorted(find_osu_files(tmp_path)) == sorted(paths)
+    missing = str(tmp_path / "missing.osu")
+    ordered = paths[::-1] + [missing]
+
+    serial = calculate_batch(ordered, workers=1)
+    progress = []
+    parallel = calculate_batch(ordered, workers=2, chunk_size=2, progress=progress.append)
+    assert [r.path for r in parallel] == ordered
+    assert [r.attributes for r in parallel] == [r.attributes for r in serial]
+    assert all(r.ok and r.object_count > 0 for r in parallel[:-1])
+    assert not parallel[-1].ok and parallel[-1].error.startswith("FileNotFoundError")
+    assert progress[-1].done == progress[-1].total == len(ordered)
+
+
+def test_cli_writes_one_line_per_file(tmp_path, capsys):
+    _write_maps(tmp_path)
+    assert main([str(tmp_path), "--workers", "1", "--quiet"]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 5 and all(len(line.split("\t")) == 3 for line in lines)
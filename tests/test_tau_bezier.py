@@ -0,0 +1,83 @@
+import math
+
+from any.models.others import Pos
+from tau.convertor import BEZIER_TOLERANCE, TauBeatmapConverter, bezier_to_piecewise_linear
+
+
+def _reference(points):
+    """osu-framework PathApproximator.BezierToPiecewiseLinear 的直译（逐次分配，无缓冲区复用）"""
+    count = len(points)
+    if count < 2:
+        return list(points)
+
+    def subdivide(cp):
+        mid = list(cp)
+        left = [None] * count
+        right = [None] * count
+        for i in range(count):
+            left[i] = mid[0]
+            right[count - i - 1] = mid[count - i - 1]
+            for j in range(count - i - 1):
+                mid[j] = ((mid[j][0] + mid[j + 1][0]) / 2, (mid[j][1] + mid[j + 1][1]) / 2)
+        return left, right
+
+    def flat_enough(cp):
+        for i in range(1, count - 1):
+            dx = cp[i - 1][0] - 2 * cp[i][0] + cp[i + 1][0]
+            dy = cp[i - 1][1] - 2 * cp[i][1] + cp[i + 1][1]
+            if dx * dx + dy * dy > BEZIER_TOLERANCE * BEZIER_TOLERANCE * 4:
+                return False
+        return True
+
+    output = []
+    stack = [list(points)]
+    while stack:
+        parent = stack.pop()
+        if flat_enough(parent):
+            left, right = subdivide(parent)
+            joined = left + right[1:]
+            output.append(parent[0])
+            for i in range(1, count - 1):
+                a, b, c = joined[2 * i - 1], joined[2 * i], joined[2 * i + 1]
+                output.append((0.25 * (a[0] + 2 * b[0] + c[0]), 0.25 * (a[1] + 2 * b[1] + c[1])))
+            continue
+        left, right = subdivide(parent)
+        stack.append(right)
+        stack.append(left)
+    output.append(points[-1])
+    return output
+
+
+def _xy(points):
+    return [(p.x, p.y) for p in points]
+
+
+def test_single_segment_matches_reference():
+    converter = TauBeatmapConverter()
+    for control in ([(0, 0), (100, 0)],
+                    [(0, 0), (200, 300), (400, 0)],
+                    [(10, 380), (60, 20), (300, 350), (500, 10), (256, 192)],
+                    [(i * 23 % 512, i * 71 % 384) for i in range(24)]):
+        result = _xy(converter._bezier_to_piecewise_linear([Pos(x, y) for x, y in control]))
+        assert result == [(float(x), float(y)) for x, y in _reference([(float(x), float(y)) for x, y in control])]
+
+
+def test_flattened_points_lie_on_curve():
+    control = [(0.0, 0.0), (200.0, 300.0), (400.0, 0.0)]
+    result = _xy(bezier_to_piecewise_linear([Pos(x, y) for x, y in control]))
+    assert len(result) > 10
+    for x, y in result:
+        # 二次贝塞尔：x = 400t，y = 600t(1-t)
+        t = x / 400.0
+        assert math.isclose(y, 600 * t * (1 - t), abs_tol=BEZIER_TOLERANCE)
+
+
+def test_red_anchors_split_segments():
+    a, b, c, d = (0.0, 0.0), (100.0, 200.0), (300.0, 50.0), (400.0, 300.0)
+    result = _xy(bezier_to_piecewise_linear([Pos(*p) for p in (a, b, c, c, d)]))
+    first = _reference([a, b, c])
+    second = _reference([c, d])
+    assert result == first + second[1:]
+    # 首尾重复点不开启新段
+    assert _xy(bezier_to_piecewise_linear([Pos(*p) for p in (a, a, b)])) == [a, b]
+    assert _xy(bezier_to_piecewise_linear([Pos(*p) for p in (a, b, b)])) == _reference([a, b, b])
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from any.models.others import Pos
+from tau import convertor
+from tau.convertor import CurvePath, TauBeatmapConverter, _catmull_find_point, _catmull_rom_curve_position_at
+
+
+def _reference(points):
+    """原实现：每个细分步输出起点、终点两个点（与 osu! CatmullToPiecewiseLinear 相同）"""
+    result = []
+    for i in range(len(points) - 1):
+        v1 = points[max(0, i - 1)]
+        v2 = points[i]
+        v3 = points[min(len(points) - 1, i + 1)]
+        v4 = points[min(len(points) - 1, i + 2)]
+        for c in range(50):
+            result.extend([_catmull_find_point(v1, v2, v3, v4, c / 50),
+                           _catmull_find_point(v1, v2, v3, v4, (c + 1) / 50)])
+    return result
+
+
+def _random_control_points(rng):
+    return [Pos(rng.uniform(0, 512), rng.uniform(0, 384)) for _ in range(rng.randint(2, 8))]
+
+
+def test_each_point_emitted_once():
+    rng = random.Random(11)
+    converter = TauBeatmapConverter()
+    for _ in range(50):
+        control = _random_control_points(rng)
+        reference = _reference(control)
+        # 去掉每段内相邻细分步的重复端点
+        expected = [(p.x, p.y) for i, p in enumerate(reference) if i % 100 == 0 or i % 2 == 1]
+        points = converter._approximate_catmull_rom(control)
+        assert [(p.x, p.y) for p in points] == expected
+        assert len(points) == (len(control) - 1) * (convertor.CATMULL_DETAIL + 1)
+
+        old_path = CurvePath(reference, 300.0)
+        new_path = CurvePath(points, 300.0)
+        assert new_path.distance == old_path.distance
+        for progress in (0.0, 0.1, 0.33, 0.5, 0.77, 1.0):
+            old, new = old_path.position_at(progress), new_path.position_at(progress)
+            assert (new.x, new.y) == (old.x, old.y)
+
+
+def test_position_at_matches_reference():
+    rng = random.Random(12)
+    for _ in range(100):
+        control = _random_control_points(rng)
+        reference = _reference(control)
+        for progress in (-0.5, 0.0, 0.004, 0.25, rng.random(), 0.999, 1.0, 1.5):
+            index = max(0, min(int(progress * (len(reference) - 1)), len(reference) - 1))
+            point = _catmull_rom_curve_position_at(control, progress)
+            assert (point.x, point.y) == (reference[index].x, reference[index].y)
+
+
+def test_numpy_matches_python():
+    pytest.importorskip("numpy")
+    rng = random.Random(13)
+    for _ in range(50):
+        control = _random_control_points(rng) + [Pos(rng.randint(0, 512), rng.randint(0, 384)) for _ in range(4)]
+        assert convertor.catmull_rom_coordinates_numpy(control) == convertor.catmull_rom_coordinates(control)
@@ -0,0 +1,74 @@
+import gc
+import logging
+import weakref
+
+import pytest
+
+from any.osu_parser import parse_osu_file
+from tau.convertor import ConversionStats, TauBeatmapConverter, convert_object, convert_osu_beatmap, iter_convert
+from sample_beatmap import SAMPLE
+
+
+def _fields(obj):
+    path = getattr(obj, 'path', None)
+    nodes = [(n.time, n.angle) for n in path.nodes] if path is not None else None
+    return type(obj), obj.start_time, obj.angle, obj.new_combo, nodes
+
+
+def test_single_pass_matches_per_object_conversion():
+    beatmap = parse_osu_file(SAMPLE)
+    expected = [_fields(convert_object(obj, beatmap)) for obj in beatmap.hit_objects]
+    tau = convert_osu_beatmap(parse_osu_file(SAMPLE))
+    assert [_fields(obj) for obj in tau.hit_objects] == expected
+    assert tau.conversion_stats == ConversionStats(converted=len(expected))
+
+
+def test_dispatch_resolves_subclasses_once():
+    beatmap = parse_osu_file(SAMPLE)
+    converter = TauBeatmapConverter()
+    slider = next(obj for obj in beatmap.hit_objects if type(obj).__name__ == 'Slider')
+    sub = type('CustomSlider', (type(slider),), {})
+    slider.__class__ = sub
+    assert _fields(converter.convert(slider, beatmap)) == _fields(convert_object(slider, beatmap))
+    assert TauBeatmapConverter._dispatch[sub] == 'convert_to_slider'
+
+
+def test_converter_is_freed_without_cycle_collection():
+    beatmap = parse_osu_file(SAMPLE)
+    converter = TauBeatmapConverter()
+    for obj in beatmap.hit_objects:
+        converter.convert(obj, beatmap)
+    ref = weakref.ref(converter)
+    gc.disable()
+    try:
+        del converter
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_failures_are_counted_and_reported(caplog):
+    beatmap = parse_osu_file(SAMPLE)
+    total = len(beatmap.hit_objects)
+    beatmap.hit_objects.insert(1, object())
+    with caplog.at_level(logging.WARNING, logger="tau.convertor"):
+        tau = convert_osu_beatmap(beatmap)
+    stats = tau.conversion_stats
+    assert (stats.converted, stats.failed, stats.errors) == (total, 1, {"AttributeError": 1})
+    assert stats.failures[0][0] == 1
+    assert "AttributeError x1" in caplog.text
+
+    with pytest.raises(AttributeError):
+        convert_osu_beatmap(beatmap, strict=True)
+
+
+def test_options_are_keyword_only():
+    beatmap = parse_osu_file(SAMPLE)
+    with pytest.raises(TypeError):
+        TauBeatmapConverter(False)
+    with pytest.raises(TypeError):
+        convert_object(beatmap.hit_objects[0], beatmap, False)
+    with pytest.raises(TypeError):
+        next(iter_convert(beatmap, False))
+    with pytest.raises(TypeError):
+        convert_osu_beatmap(beatmap, False)
@@ -0,0 +1,39 @@
+from any.models.HitObject import Slider as OsuSlider
+from any.models.others import Curve, CurveType, Pos
+from tau.convertor import CurveApproximationCache, TauBeatmapConverter
+
+
+def _slider(curve_type, points, length=300.0):
+    slider = OsuSlider()
+    slider.curves = Curve()
+    slider.curves.type = curve_type
+    slider.curves.control_points = [Pos(x, y) for x, y in points]
+    slider.length = length
+    return slider
+
+
+def test_identical_curves_hit_across_converters():
+    cache = CurveApproximationCache()
+    points = [(0, 0), (120, 300), (300, 40), (400, 380)]
+    first = TauBeatmapConverter(curve_cache=cache)._curve_path(_slider(CurveType.Bezier, points))
+    # 另一张难度中的相同滑条（不同物件、不同长度）
+    second = TauBeatmapConverter(curve_cache=cache)._curve_path(_slider("B", points, 200.0))
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.entries) == (1, 1, 1)
+    assert first.xs[:3] == second.xs[:3]
+
+    uncached = TauBeatmapConverter(curve_cache=None)._curve_path(_slider(CurveType.Bezier, points))
+    assert (uncached.xs, uncached.ys, uncached.distance) == (first.xs, first.ys, first.distance)
+
+    # 线性曲线无需近似，不进入缓存
+    TauBeatmapConverter(curve_cache=cache)._curve_path(_slider(CurveType.linear, points))
+    assert cache.stats.hits + cache.stats.misses == 2
+
+
+def test_cached_value_is_immutable_and_bounded():
+    cache = CurveApproximationCache(max_entries=2)
+    converter = TauBeatmapConverter(curve_cache=cache)
+    for i in range(4):
+        xs, ys = converter._approximate_curve_coordinates(_slider(CurveType.Catmull_rom, [(0, 0), (i, 50), (100, 100)]).curves)
+        assert isinstance(xs, tuple) and isinstance(ys, tuple)
+    assert (cache.stats.misses, cache.stats.evictions, cache.stats.entries) == (4, 2, 2)
+    assert cache.stats.as_dict()["hit_rate"] == 0.0
@@ -0,0 +1,47 @@
+from any.models.HitObject import Slider as OsuSlider
+from any.models.others import Curve, CurveType, Pos
+from tau.convertor import CurvePath, TauBeatmapConverter
+
+
+def _pos(p):
+    return (round(p.x, 6), round(p.y, 6))
+
+
+def test_position_at_is_arc_length_parameterized():
+    # 第一段 100、第二段 300：按点下标插值时 0.5 会落在拐点，按弧长应位于第二段中部
+    path = CurvePath([Pos(0, 0), Pos(100, 0), Pos(100, 300)])
+    assert path.distance == 400
+    assert _pos(path.position_at(0.5)) == (100, 100)
+    assert _pos(path.position_at(0.25)) == (100, 0)
+    assert _pos(path.position_at(-1)) == (0, 0)
+    assert _pos(path.position_at(2)) == (100, 300)
+
+
+def test_expected_distance_truncates_and_extends():
+    points = [Pos(0, 0), Pos(100, 0), Pos(100, 100)]
+    truncated = CurvePath(points, 150)
+    assert truncated.distance == 150
+    assert _pos(truncated.end_position) == (100, 50)
+    assert _pos(truncated.position_at(0.5)) == (75, 0)
+    extended = CurvePath(points, 250)
+    assert _pos(extended.end_position) == (100, 150)
+    short = CurvePath(points, 40)
+    assert _pos(short.end_position) == (40, 0)
+
+
+def test_path_follows_slider_changes():
+    slider = OsuSlider()
+    slider.curves = Curve()
+    slider.curves.type = CurveType.Bezier
+    slider.curves.control_points = [Pos(0, 0), Pos(200, 0), Pos(200, 200)]
+    slider.length = 250.0
+    converter = TauBeatmapConverter()
+    path = converter._curve_path(slider)
+    assert abs(path.distance - 250.0) < 1e-9
+    assert not hasattr(slider, '_tau_curve_path')
+    slider.length = 200.0
+    shortened = converter._curve_path(slider)
+    assert abs(shortened.distance - 200.0) < 1e-9
+    # 控制点原地修改（数量不变）后路径随之更新
+    slider.curves.control_points[1] = Pos(0, 200)
+    assert _pos(converter._curve_path(slider).position_at(0.5)) != _pos(shortened.position_at(0.5))
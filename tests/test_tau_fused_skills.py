@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from any.osu_parser import parse_osu_file
+from tau.convertor import create_tau_beatmap
+from tau.difficulty.difficultyCalculator import TauDifficultyCalculator
+from tau.difficulty.evaluators.aimEvaluator import AimEvaluator
+from tau.difficulty.evaluators.speedEvaluator import SpeedEvaluator
+from tau.difficulty.skills.aim import Aim
+from tau.objects import Beat, HardBeat, PolarSliderPath, Slider, SliderNode, StrictHardBeat
+from sample_beatmap import SAMPLE
+
+
+def _mixed_map(count=600, seed=5):
+    """节奏多变、含滑条与重击的谱面，覆盖节奏 island 与滑条速度的各个分支"""
+    rng = random.Random(seed)
+    beatmap = create_tau_beatmap(parse_osu_file(SAMPLE))
+    time = 0.0
+    for _ in range(count):
+        time += rng.choice((30.0, 60.0, 75.0, 90.0, 120.0, 180.0, 240.0, 1200.0))
+        kind = rng.random()
+        if kind < 0.2:
+            obj = Slider()
+            duration = rng.choice((60.0, 120.0, 300.0))
+            angle = rng.uniform(0, 360)
+            obj.path = PolarSliderPath([SliderNode(0.0, angle), SliderNode(duration, angle + rng.uniform(-120, 120))])
+            obj.repeat_count = rng.randint(0, 2)
+        elif kind < 0.3:
+            obj = HardBeat()
+        elif kind < 0.35:
+            obj = StrictHardBeat()
+        else:
+            obj = Beat()
+        obj.start_time = time
+        if not isinstance(obj, HardBeat):
+            obj.angle = rng.uniform(0, 360)
+        beatmap.add_hit_object(obj)
+        if isinstance(obj, Slider):
+            time = obj.end_time
+    return beatmap
+
+
+@pytest.mark.parametrize("mods", [0, 64, 256])
+def test_fused_pass_is_bit_identical(mods):
+    calculator = TauDifficultyCalculator(_mixed_map(), mods)
+    fused = calculator.calculate()
+    assert fused.slider_count > 0 and fused.hard_beat_count > 0
+    assert vars(fused) == vars(calculator.calculate(fused=False))
+
+
+def test_rhythm_sequence_matches_per_object():
+    difficulty_hit_objects = TauDifficultyCalculator(_mixed_map(seed=8))._create_difficulty_hit_objects()
+    for great_window in (50.0, 97.0, 127.0):
+        expected = [SpeedEvaluator.evaluate_rhythm_difficulty(obj, great_window) for obj in difficulty_hit_objects]
+        assert SpeedEvaluator.evaluate_rhythm_sequence(difficulty_hit_objects, great_window) == expected
+        assert any(value > 1 for value in expected)
+
+
+def test_shared_velocities_match_each_aim_skill():
+    difficulty_hit_objects = TauDifficultyCalculator(_mixed_map(seed=9))._create_difficulty_hit_objects()
+    skills = [Aim(0, [Beat, StrictHardBeat, Slider]), Aim(0, [Beat, StrictHardBeat])]
+    assert [skill.slider_allowed for skill in skills] == [True, False]
+    for obj in difficulty_hit_objects:
+        velocities = Aim.shared_velocities(obj)
+        for skill in skills:
+            assert skill.strain_value_from_velocities(velocities) == skill.strain_value_of(obj)
+        if velocities is not None:
+            assert AimEvaluator.combine_velocities(*velocities, True) == \
+                AimEvaluator.evaluate_difficulty(obj, obj.last_angled, skills[0].allowed_hit_objects)
@@ -0,0 +1,33 @@
+import pickle
+
+import pytest
+
+from tau.objects import (Beat, HardBeat, Slider, SliderHardBeat, SliderHeadBeat, SliderRepeat, SliderTick,
+                         StrictHardBeat)
+
+TYPES = [Beat, HardBeat, StrictHardBeat, Slider, SliderHeadBeat, SliderHardBeat, SliderRepeat, SliderTick]
+
+
+@pytest.mark.parametrize("cls", TYPES)
+def test_objects_have_no_instance_dict(cls):
+    obj = cls()
+    assert not hasattr(obj, '__dict__')
+    with pytest.raises(AttributeError):
+        obj.undeclared = 1
+    assert (obj.start_time, obj.angle, obj.range, obj.new_combo, obj.time_preempt, obj.samples) == \
+           (0.0, 0.0, 0.0, False, 600, [])
+
+
+def test_lazy_lists_behave_like_attributes():
+    a, b = Slider(), Slider()
+    a.samples.append("hit")
+    a.nested_hit_objects.append(SliderTick())
+    # 嵌套物件首次访问时生成：没有路径与刻度的滑条只有头部
+    assert b.samples == [] and [type(obj) for obj in b.nested_hit_objects] == [SliderHeadBeat]
+    assert a.samples == ["hit"] and a.samples is a.samples
+    b.tail_samples = ["tail"]
+    assert b.tail_samples == ["tail"] and a.tail_samples == []
+
+    a.angle = 12.5
+    restored = pickle.loads(pickle.dumps(a))
+    assert (restored.angle, restored.samples, len(restored.nested_hit_objects)) == (12.5, ["hit"], 2)
@@ -0,0 +1,70 @@
+from itertools import islice
+
+from any.osu_parser import parse_osu_file
+from tau.convertor import convert_osu_beatmap
+from tau.difficulty.difficultyCalculator import TauDifficultyCalculator
+from tau.objects import (PolarSliderPath, Slider, SliderEventType, SliderHardBeat, SliderHeadBeat, SliderNode,
+                         SliderRepeat, SliderTick, generate_slider_events)
+from sample_beatmap import SAMPLE
+
+HEAD, TICK, REPEAT, TAIL = SliderEventType.HEAD, SliderEventType.TICK, SliderEventType.REPEAT, SliderEventType.TAIL
+
+
+def _events(*args):
+    return [(e.type, e.span_index, e.time, e.path_progress) for e in generate_slider_events(*args)]
+
+
+def test_events_match_osu_generator():
+    assert _events(1000, 1000, 0.2, 50, 200, 2) == [
+        (HEAD, 0, 1000, 0),
+        (TICK, 0, 1250.0, 0.25), (TICK, 0, 1500.0, 0.5), (TICK, 0, 1750.0, 0.75),
+        (REPEAT, 0, 2000, 1),
+        # 反向跨度：刻度位置相同，按时间顺序产生
+        (TICK, 1, 2250.0, 0.75), (TICK, 1, 2500.0, 0.5), (TICK, 1, 2750.0, 0.25),
+        (TAIL, 1, 3000, 0),
+    ]
+    # 离跨度终点不足 velocity * 10 的刻度被省略
+    assert [e[0] for e in _events(0, 1000, 6.0, 50, 200, 1)] == [HEAD, TICK, TICK, TAIL]
+    # tick_distance 为 0 时（与 osu! 相同）只有头部与尾部
+    assert [e[0] for e in _events(0, 1000, 0.2, 0, 200, 3)] == [HEAD, TAIL]
+
+
+def test_events_are_generated_lazily():
+    events = generate_slider_events(0, 1000, 0.001, 1e-3, 1, 10 ** 9)
+    assert [e.type for e in islice(events, 3)] == [HEAD, TICK, TICK]
+
+
+def test_nested_objects_follow_events():
+    slider = Slider()
+    slider.start_time = 500
+    slider.repeat_count = 1
+    slider.velocity = 0.25
+    slider.tick_distance = 100
+    slider.path = PolarSliderPath([SliderNode(0, 0.0), SliderNode(1000, 40.0), SliderNode(2000, 60.0)])
+    nested = slider.create_nested_hit_objects()
+    assert [type(obj) for obj in nested] == [SliderHeadBeat, SliderTick, SliderTick, SliderRepeat, SliderTick, SliderTick]
+    assert slider.head_beat is nested[0]
+    assert all(obj.parent_slider is slider for obj in nested)
+    assert [obj.start_time for obj in nested] == sorted(obj.start_time for obj in nested)
+    # 跨度长度 0.25 * 1000 = 250，刻度间距 100 -> 进度 0.4、0.8 处的路径角度
+    assert [obj.angle for obj in nested[1:3]] == [slider.path.angle_at(800.0), slider.path.angle_at(1600.0)]
+    assert [obj.start_time for obj in nested[1:3]] == [900.0, 1300.0]
+    assert nested[3].angle == slider.path.angle_at(2000) and nested[3].repeat_index == 0
+    assert [obj.angle for obj in nested[4:]] == [slider.path.angle_at(1600.0), slider.path.angle_at(800.0)]
+    assert slider.max_combo == len(nested) + 1
+
+    slider.is_hard = True
+    assert isinstance(next(slider.iter_nested_hit_objects()), SliderHardBeat)
+
+
+def test_max_combo_shared_with_calculator():
+    tau = convert_osu_beatmap(parse_osu_file(SAMPLE))
+    sliders = [obj for obj in tau.hit_objects if isinstance(obj, Slider)]
+    assert sliders and all(s.velocity > 0 and s.tick_distance > 0 for s in sliders)
+    # 转换后的滑条无需显式调用即带有嵌套物件，连击数由它们得出
+    assert all(isinstance(s.nested_hit_objects[0], SliderHeadBeat) and s.head_beat is s.nested_hit_objects[0]
+               for s in sliders)
+    assert any(isinstance(obj, SliderRepeat) for s in sliders for obj in s.nested_hit_objects)
+    expected = sum(len(s.nested_hit_objects) + 1 if isinstance(s, Slider) else 1 for s in tau.hit_objects)
+    assert tau.get_max_combo() == expected
+    assert TauDifficultyCalculator(tau).calculate().max_combo == expected
@@ -0,0 +1,136 @@
+import random
+
+from any.osu_parser import parse_osu_file
+from tau.convertor import convert_osu_beatmap
+from tau.difficulty.difficultyCalculator import TauDifficultyCalculator
+from tau.objects import ArrayPolarSliderPath, PolarSliderPath, Slider, SliderNode, get_delta_angle
+from sample_beatmap import SAMPLE
+
+
+def _walk(nodes, half_tolerance):
+    """缓存前的实现：每次访问都遍历全部节点"""
+    distance = 0
+    last_angle = nodes[0].angle
+    for node in nodes:
+        distance += abs(get_delta_angle(node.angle, last_angle))
+        last_angle = node.angle
+    lazy = 0.0
+    last_angle = nodes[0].angle
+    for node in nodes:
+        delta = get_delta_angle(node.angle, last_angle)
+        if abs(delta) > half_tolerance:
+            last_angle += delta - (half_tolerance if delta > 0 else -half_tolerance)
+            lazy += abs(delta)
+    return distance, lazy
+
+
+def _random_nodes(rng, count):
+    angle = rng.uniform(0, 360)
+    nodes = []
+    for i in range(count):
+        angle = (angle + rng.uniform(-40, 40)) % 360
+        nodes.append(SliderNode(float(i * 20), angle))
+    return nodes
+
+
+def test_fused_pass_matches_separate_walks():
+    rng = random.Random(21)
+    for _ in range(200):
+        nodes = _random_nodes(rng, rng.randint(1, 60))
+        half = rng.choice([0.0, 0.5, 5.0, 20.0])
+        expected = _walk(nodes, half)
+        assert PolarSliderPath(nodes).calculate_distances(half) == expected
+        path = PolarSliderPath(nodes)
+        assert (path.calculated_distance, path.calculate_lazy_distance(half)) == expected
+        # 先分别计算再走融合路径时直接返回缓存
+        assert path.calculate_distances(half) == expected
+    empty = PolarSliderPath([])
+    assert empty.calculate_distances(1.0) == (0, 0)
+    assert empty.calculated_distance == 0 and empty.calculate_lazy_distance(1.0) == 0
+
+
+def test_lazy_distance_cached_per_tolerance():
+    nodes = [SliderNode(0, 0.0), SliderNode(10, 30.0), SliderNode(20, 10.0), SliderNode(30, 80.0)]
+    path = PolarSliderPath(nodes)
+    assert path.calculate_lazy_distance(0) == _walk(nodes, 0)[1]
+    assert path.calculate_lazy_distance(15) == _walk(nodes, 15)[1]
+    assert path.calculate_lazy_distance(0) != path.calculate_lazy_distance(15)
+
+
+def test_node_mutation_invalidates_cache():
+    rng = random.Random(22)
+    path = PolarSliderPath(_random_nodes(rng, 20))
+
+    def check():
+        expected = _walk(list(path.nodes), 2.0)
+        assert (path.calculated_distance, path.calculate_lazy_distance(2.0)) == expected
+        assert path.calculate_distances(2.0) == expected
+
+    check()
+    path.nodes.append(SliderNode(400.0, 10.0))
+    check()
+    path.nodes[3] = SliderNode(path.nodes[3].time, (path.nodes[3].angle + 90) % 360)
+    check()
+    del path.nodes[5:8]
+    check()
+    path.nodes.pop()
+    check()
+    path.nodes = _random_nodes(rng, 10)
+    check()
+    # 直接修改节点属性无法被列表感知，需要显式失效
+    path.nodes[2].angle = (path.nodes[2].angle + 120) % 360
+    path.invalidate()
+    check()
+
+
+def _queries(rng, nodes):
+    end = nodes[-1].time
+    return [rng.uniform(-50, end + 50) for _ in range(40)] + [n.time for n in nodes]
+
+
+def test_array_path_matches_list_path():
+    rng = random.Random(23)
+    for _ in range(100):
+        nodes = _random_nodes(rng, rng.randint(1, 40))
+        if rng.random() < 0.3 and len(nodes) > 2:
+            # 时间相同的相邻节点
+            nodes[1] = SliderNode(nodes[2].time, nodes[1].angle)
+        path = PolarSliderPath(nodes)
+        array_path = ArrayPolarSliderPath.from_samples([n.time for n in nodes], [n.angle for n in nodes])
+        assert array_path.nodes == tuple(path.nodes)
+        assert (array_path.duration, array_path.start_node, array_path.end_node) == \
+               (path.duration, path.start_node, path.end_node)
+        assert array_path.calculate_distances(3.0) == path.calculate_distances(3.0)
+        for time in _queries(rng, nodes):
+            assert array_path.angle_at(time) == path.angle_at(time)
+            assert array_path.node_at(time) == path.node_at(time)
+            start = time - rng.uniform(0, 200)
+            assert array_path.nodes_between(start, time) == path.nodes_between(start, time)
+            assert array_path.segments_between(start, time) == path.segments_between(start, time)
+    assert ArrayPolarSliderPath([]).angle_at(0) is None
+
+
+def test_queries_do_not_depend_on_previous_seeks():
+    rng = random.Random(24)
+    nodes = _random_nodes(rng, 30)
+    times = _queries(rng, nodes)
+    expected = [PolarSliderPath(nodes).angle_at(t) for t in times]
+    shuffled = list(zip(times, expected))
+    rng.shuffle(shuffled)
+    path = PolarSliderPath(nodes)
+    array_path = ArrayPolarSliderPath(nodes)
+    for time, angle in shuffled:
+        assert path.angle_at(time) == angle
+        assert array_path.angle_at(time) == angle
+
+
+def test_converter_array_paths():
+    beatmap = parse_osu_file(SAMPLE)
+    plain = convert_osu_beatmap(beatmap)
+    arrays = convert_osu_beatmap(beatmap, array_paths=True)
+    sliders = [(a.path, b.path) for a, b in zip(plain.hit_objects, arrays.hit_objects) if isinstance(a, Slider)]
+    assert sliders
+    for path, array_path in sliders:
+        assert isinstance(array_path, ArrayPolarSliderPath)
+        assert array_path.nodes == tuple(path.nodes)
+    assert vars(TauDifficultyCalculator(arrays).calculate()) == vars(TauDifficultyCalculator(plain).calculate())
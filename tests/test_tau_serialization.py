@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+from any.osu_parser import parse_osu_file
+from tau.convertor import convert_osu_beatmap
+from tau.objects import ArrayPolarSliderPath, PolarSliderPath, Slider
+from tau.serialization import dump, dumps, load, loads
+from sample_beatmap import SAMPLE
+
+
+def _objects(beatmap):
+    result = []
+    for obj in beatmap.hit_objects:
+        row = (type(obj).__name__, obj.start_time, obj.new_combo, obj.angle, obj.range)
+        if isinstance(obj, Slider):
+            row += (obj.is_hard, obj.repeat_count, obj.tick_distance_multiplier, obj.velocity, obj.tick_distance,
+                    [(n.time, n.angle) for n in obj.path.nodes])
+        result.append(row)
+    return result
+
+
+def test_round_trip_preserves_converted_beatmap():
+    expected = convert_osu_beatmap(parse_osu_file(SAMPLE))
+    assert any(isinstance(obj, Slider) for obj in expected.hit_objects)
+    restored = loads(dumps(expected))
+    assert _objects(restored) == _objects(expected)
+    assert restored.difficulty_attributes == expected.difficulty_attributes
+    assert restored.get_max_combo() == expected.get_max_combo()
+
+    buf = io.BytesIO()
+    dump(expected, buf)
+    buf.seek(0)
+    assert _objects(load(buf)) == _objects(expected)
+
+
+def test_round_trip_keeps_path_type():
+    for array_paths, path_type in ((False, PolarSliderPath), (True, ArrayPolarSliderPath)):
+        expected = convert_osu_beatmap(parse_osu_file(SAMPLE), array_paths=array_paths)
+        restored = loads(dumps(expected))
+        assert _objects(restored) == _objects(expected)
+        paths = [obj.path for obj in restored.hit_objects if isinstance(obj, Slider)]
+        assert paths and all(type(path) is path_type for path in paths)
+
+
+def test_rejects_other_formats():
+    data = dumps(convert_osu_beatmap(parse_osu_file(SAMPLE)))
+    with pytest.raises(ValueError):
+        loads(b"XXXX" + data[4:])
+    with pytest.raises(ValueError):
+        loads(data[:len(data) // 2])
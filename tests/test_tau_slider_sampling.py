@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from any.models.HitObject import Slider as OsuSlider
+from any.models.others import Curve, CurveType, Pos
+from tau import convertor
+from tau.convertor import TauBeatmapConverter
+from tau.objects import Slider
+
+pytest.importorskip("numpy")
+
+
+class _Beatmap:
+    ar = 9.0
+    slider_multiplier = 1.4
+    file_version = 14
+    timing_points = []
+
+
+def _random_sliders(count=150, seed=7):
+    rng = random.Random(seed)
+    sliders = []
+    for i in range(count):
+        slider = OsuSlider()
+        slider.time = i * 1000
+        slider.pos = Pos(rng.randint(0, 512), rng.randint(0, 384))
+        slider.hitsound = 0
+        slider.is_newcombo = False
+        slider.repeat_count = 0
+        slider.curves = Curve()
+        slider.curves.type = rng.choice(list(CurveType))
+        n = 3 if slider.curves.type == CurveType.perfrct else rng.randint(2, 6)
+        slider.curves.control_points = [slider.pos] + [Pos(rng.randint(0, 512), rng.randint(0, 384)) for _ in range(n - 1)]
+        slider.length = rng.uniform(80, 1200)
+        sliders.append(slider)
+    return sliders
+
+
+def _convert(sliders, use_numpy, locked_direction, impossible):
+    converter = TauBeatmapConverter(use_numpy=use_numpy)
+    converter.locked_direction = locked_direction
+    converter.can_convert_impossible_sliders = impossible
+    result = []
+    for slider in sliders:
+        obj = converter.convert_to_slider(slider, _Beatmap())
+        row = (type(obj).__name__, obj.angle, converter.last_locked_angle)
+        if isinstance(obj, Slider):
+            row += (tuple((n.time, n.angle) for n in obj.path.nodes),)
+        result.append(row)
+    return result
+
+
+@pytest.mark.parametrize("locked_direction", [None, "clockwise", "counterclockwise"])
+@pytest.mark.parametrize("impossible", [False, True])
+def test_numpy_sampling_matches_python(locked_direction, impossible, monkeypatch):
+    # 对所有长度的滑条都走 NumPy 实现
+    monkeypatch.setattr(convertor, "NUMPY_MIN_SAMPLES", 0)
+    sliders = _random_sliders()
+    expected = _convert(sliders, False, locked_direction, impossible)
+    assert any(row[0] == "Slider" for row in expected)
+    assert _convert(sliders, True, locked_direction, impossible) == expected
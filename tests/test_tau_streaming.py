@@ -0,0 +1,76 @@
+import gc
+import io
+import random
+import weakref
+
+import pytest
+
+from any.osu_parser import parse_osu_file, stream_osu_file
+from tau.convertor import convert_osu_beatmap, create_tau_beatmap, iter_convert
+from tau.difficulty.difficultyCalculator import STREAM_WINDOW_SIZE, TauDifficultyCalculator
+from tau.difficulty.preprocessing.difficultyObjectWindow import DifficultyObjectWindow
+from tau.objects import Beat, HardBeat
+from sample_beatmap import SAMPLE
+
+
+def _long_map(count=500, seed=3):
+    rng = random.Random(seed)
+    beatmap = create_tau_beatmap(parse_osu_file(SAMPLE))
+    time = 0.0
+    for _ in range(count):
+        time += rng.choice((60.0, 90.0, 120.0, 240.0, 700.0))
+        obj = HardBeat() if rng.random() < 0.15 else Beat()
+        obj.start_time = time
+        if isinstance(obj, Beat):
+            obj.angle = rng.uniform(0, 360)
+        beatmap.add_hit_object(obj)
+    return beatmap
+
+
+@pytest.mark.parametrize("mods", [0, 64])
+def test_calculate_iter_matches_calculate(mods):
+    beatmap = _long_map()
+    expected = TauDifficultyCalculator(beatmap, mods).calculate()
+    streamed = TauDifficultyCalculator(create_tau_beatmap(parse_osu_file(SAMPLE)), mods).calculate_iter(
+        iter(beatmap.hit_objects))
+    assert vars(streamed) == vars(expected)
+
+
+def test_stream_parse_convert_calculate_pipeline():
+    expected = TauDifficultyCalculator(convert_osu_beatmap(parse_osu_file(SAMPLE))).calculate()
+    for osu_beatmap in stream_osu_file(io.BytesIO(SAMPLE.encode())):
+        calculator = TauDifficultyCalculator(create_tau_beatmap(osu_beatmap))
+        assert vars(calculator.calculate_iter(iter_convert(osu_beatmap))) == vars(expected)
+    assert vars(TauDifficultyCalculator(create_tau_beatmap(parse_osu_file(SAMPLE))).calculate_iter([])) == \
+        vars(TauDifficultyCalculator(create_tau_beatmap(parse_osu_file(SAMPLE))).calculate())
+
+
+def test_early_difficulty_objects_are_released():
+    beatmap = _long_map(count=4 * STREAM_WINDOW_SIZE)
+    refs = []
+    calculator = TauDifficultyCalculator(beatmap)
+    original = calculator._iter_difficulty_hit_objects
+
+    def tracking(hit_objects, difficulty_objects):
+        for obj in original(hit_objects, difficulty_objects):
+            if not refs:
+                refs.append(weakref.ref(obj))
+            elif len(difficulty_objects) == 3 * STREAM_WINDOW_SIZE:
+                gc.collect()
+                assert refs[0]() is None
+            yield obj
+
+    calculator._iter_difficulty_hit_objects = tracking
+    calculator.calculate_iter(iter(beatmap.hit_objects))
+    assert len(refs) == 1
+
+
+def test_window_indexing():
+    window = DifficultyObjectWindow(4)
+    for i in range(20):
+        window.append(i)
+    assert len(window) == 20 and window[19] == 19 and window[16] == 16
+    with pytest.raises(IndexError):
+        window[20]
+    with pytest.raises(LookupError):
+        window[0]
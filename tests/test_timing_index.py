@@ -0,0 +1,57 @@
+import random
+
+from any.osu_parser import parse_osu_file
+from any.models.TimePoint import FloatTimePoint
+from common.timing import TimingIndex
+from tau.convertor import convert_osu_beatmap
+from tau.objects import Slider
+from test_basic_conversion import FakeTimingPoint
+from sample_beatmap import SAMPLE
+
+
+def _scan(points, t):
+    base = None; sv = 1.0; red = None
+    for tp in sorted(points, key=lambda tp: tp.time):
+        if tp.time > t:
+            break
+        if tp.uninherited:
+            if tp.beat_length > 0:
+                base = tp.beat_length; sv = 1.0; red = tp
+        elif tp.beat_length < 0:
+            sv = 100.0 / -tp.beat_length
+    return base, sv, red
+
+
+def test_matches_sequential_scan():
+    rng = random.Random(3)
+    points = [FakeTimingPoint(0, 400, True), FakeTimingPoint(0, -50, False)]
+    for _ in range(300):
+        if rng.random() < 0.1:
+            points.append(FakeTimingPoint(rng.randint(0, 60000), rng.choice([300, 450, -1]), True))
+        else:
+            points.append(FakeTimingPoint(rng.randint(0, 60000), -rng.uniform(10, 1000), False))
+    index = TimingIndex(points)
+    for t in [-5, 0, 1, 59999, 60000, 70000] + [rng.randint(0, 60000) for _ in range(500)]:
+        base, sv, red = _scan(points, t)
+        assert index.beat_length_at(t) == base
+        assert index.sv_multiplier_at(t) == sv
+        assert index.timing_at(t) is red
+    assert index.beat_length_at(-5, 1000) == 1000
+
+
+def test_each_conversion_sees_current_timing_points():
+    class Beatmap:
+        timing_points = [FakeTimingPoint(0, 500, True)]
+
+    beatmap = Beatmap()
+    assert TimingIndex.from_beatmap(beatmap).beat_length_at(5000) == 500
+    beatmap.timing_points[0] = FakeTimingPoint(0, 250, True)
+    assert TimingIndex.from_beatmap(beatmap).beat_length_at(5000) == 250
+
+    osu = parse_osu_file(SAMPLE)
+    velocities = {o.start_time: o.velocity for o in convert_osu_beatmap(osu).hit_objects if isinstance(o, Slider)}
+    first = osu.timing_points[0]
+    osu.timing_points[0] = FloatTimePoint(first.start_time, float(first.beat_length) / 2, first.meter, first.sample_set,
+                                          first.sample_index, first.volume, first.uninherited, first.effects)
+    halved = {o.start_time: o.velocity for o in convert_osu_beatmap(osu).hit_objects if isinstance(o, Slider)}
+    assert velocities and all(halved[t] == v * 2 for t, v in velocities.items())